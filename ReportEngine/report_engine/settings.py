@@ -117,11 +117,18 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Uploaded and generated files (exports cached by reports_app live here)
+MEDIA_ROOT = BASE_DIR / 'media'
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Reviewer information requests are appended to one rotating log file
+INFORMATION_REQUEST_LOG_DIR = BASE_DIR / 'information_request_logs'
+INFORMATION_REQUEST_LOG_FILE = INFORMATION_REQUEST_LOG_DIR / 'info_requests.log'
+
 # Logging Configuration
 LOGGING = {
     'version': 1,
@@ -135,12 +142,25 @@ LOGGING = {
             'format': '{levelname} {message}',
             'style': '{',
         },
+        'message': {
+            'format': '{message}',
+            'style': '{',
+        },
     },
     'handlers': {
         'console': {
             'class': 'logging.StreamHandler',
             'formatter': 'verbose',
         },
+        'information_requests': {
+            'class': 'logging.handlers.RotatingFileHandler',
+            'filename': INFORMATION_REQUEST_LOG_FILE,
+            'maxBytes': 10_000_000,
+            'backupCount': 5,
+            'encoding': 'utf-8',
+            'delay': True,
+            'formatter': 'message',
+        },
     },
     'loggers': {
         'django': {
@@ -158,6 +178,11 @@ LOGGING = {
             'level': 'DEBUG',
             'propagate': True,
         },
+        'reports_app.information_requests': {
+            'handlers': ['information_requests'],
+            'level': 'INFO',
+            'propagate': False,
+        },
     },
 }
 
@@ -1,7 +1,15 @@
+import os
+
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class ReportsAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'reports_app'
     label = 'reports_app'
+
+    def ready(self):
+        # The information request log handler opens its file on the first
+        # entry; its directory has to exist by then
+        os.makedirs(settings.INFORMATION_REQUEST_LOG_DIR, exist_ok=True)
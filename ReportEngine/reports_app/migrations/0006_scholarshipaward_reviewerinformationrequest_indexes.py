@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-16 22:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reports_app', '0005_awarddecision'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reviewerinformationrequest',
+            index=models.Index(fields=['status'], name='reports_app_status_b06c47_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reviewerinformationrequest',
+            index=models.Index(fields=['scholarship_name', 'status'], name='reports_app_scholar_ae2fd4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='scholarshipaward',
+            index=models.Index(fields=['scholarship_name', 'status'], name='reports_app_scholar_ea1933_idx'),
+        ),
+    ]
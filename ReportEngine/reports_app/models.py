@@ -140,6 +140,9 @@ class ScholarshipAward(models.Model):
         ordering = ['-award_date']
         verbose_name = 'Scholarship Award'
         verbose_name_plural = 'Scholarship Awards'
+        indexes = [
+            models.Index(fields=['scholarship_name', 'status']),
+        ]
 
     def __str__(self):
         return f"{self.scholarship_name} awarded to {self.applicant.name}"
@@ -286,6 +289,10 @@ class ReviewerInformationRequest(models.Model):
         ordering = ['-requested_at']
         verbose_name = 'Reviewer Information Request'
         verbose_name_plural = 'Reviewer Information Requests'
+        indexes = [
+            models.Index(fields=['status']),
+            models.Index(fields=['scholarship_name', 'status']),
+        ]
     
     def __str__(self):
         return f"{self.request_type} for {self.applicant.name} - {self.status}"
@@ -0,0 +1,357 @@
+"""
+PDF rendering helpers that do not depend on Django.
+
+Functions here take plain report dictionaries produced by ReportEngine and
+write ReportLab documents. Keeping them free of model imports lets worker
+processes import this module without configuring Django, so rendering can be
+fanned out with concurrent.futures.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import (
+    ListFlowable,
+    ListItem,
+    Paragraph,
+    SimpleDocTemplate,
+    Spacer,
+    Table,
+    TableStyle,
+)
+
+
+@lru_cache(maxsize=None)
+def sample_styles():
+    """Return ReportLab's sample stylesheet, built once per process.
+
+    The stylesheet is shared, so callers must not add or change styles;
+    those that do should build their own with getSampleStyleSheet.
+    """
+    return getSampleStyleSheet()
+
+
+def bullet_list(items, style):
+    """Render items as a single bulleted ListFlowable.
+
+    Args:
+        items: Iterable of values to list, one bullet each
+        style: Paragraph style for the item text
+
+    Returns:
+        ListFlowable: One flowable holding every item
+    """
+    return ListFlowable(
+        [ListItem(Paragraph(str(item), style)) for item in items],
+        bulletType="bullet",
+        start="•",
+        leftIndent=12,
+    )
+
+
+def flatten_applicant_review(match, styles):
+    """Pre-render one pre-screening match's review details as flowables.
+
+    Lines that share a style are joined into a single Paragraph with
+    ``<br/>`` breaks, so the layout engine wraps and splits far fewer
+    flowables than one Paragraph per line would give it.
+
+    Args:
+        match: Applicant match from generate_prescreening_report
+        styles: Stylesheet from getSampleStyleSheet
+
+    Returns:
+        list: Flowables to extend the report story with
+    """
+    normal, h4 = styles["Normal"], styles["Heading4"]
+    review_data = match.get("review_data", {})
+    flowables = [Paragraph(f"\nDetailed Review for {match['applicant']['name']}:", h4)]
+
+    # Essay Reviews
+    if review_data.get("essay_review", {}).get("comments"):
+        flowables.append(Paragraph("Essay Reviews:", h4))
+        flowables.append(
+            Paragraph(
+                "<br/>".join(
+                    f"Essay {i} - Score: {score}/10<br/>Feedback: {comment}"
+                    for i, (comment, score) in enumerate(
+                        zip(
+                            review_data["essay_review"]["comments"],
+                            review_data["essay_review"]["scores"],
+                        ),
+                        1,
+                    )
+                ),
+                normal,
+            )
+        )
+
+    # Interview Notes
+    if review_data.get("interview_notes"):
+        flowables.append(Paragraph("Interview Notes:", h4))
+        flowables.append(Paragraph(review_data["interview_notes"], normal))
+
+    # Committee Feedback
+    if review_data.get("committee_feedback"):
+        flowables.append(Paragraph("Committee Feedback:", h4))
+        flowables.append(
+            Paragraph(
+                "<br/>".join(
+                    f"• {feedback['member']}: {feedback['comments']}"
+                    for feedback in review_data["committee_feedback"]
+                ),
+                normal,
+            )
+        )
+
+    # Award Decision Details
+    if match.get("award_decision"):
+        ad = match["award_decision"]
+        flowables.append(Paragraph("Award Decision:", h4))
+        lines = [f"Decision: {ad['decision'].replace('_', ' ').title()}"]
+        if ad.get("decided_at"):
+            decided_at = ad["decided_at"]
+            if hasattr(decided_at, "strftime"):
+                decided_at = decided_at.strftime("%Y-%m-%d")
+            lines.append(f"Decided At: {decided_at}")
+        flowables.append(Paragraph("<br/>".join(lines), normal))
+        if ad.get("comments"):
+            flowables.append(Paragraph("Comments:", h4))
+            flowables.append(Paragraph(str(ad["comments"]), normal))
+
+    return flowables
+
+
+def render_applicant_pdf(report_data: Dict[str, Any], output_path: str) -> str:
+    """Write a single-applicant report PDF.
+
+    Args:
+        report_data: Single applicant report from generate_applicant_report
+        output_path: Path where the PDF should be written
+
+    Returns:
+        str: Path to the generated PDF file
+    """
+    doc = SimpleDocTemplate(output_path, pagesize=letter)
+    story = []
+    styles = sample_styles()
+    h1, h2, h3, h4, normal = (
+        styles["Heading1"],
+        styles["Heading2"],
+        styles["Heading3"],
+        styles["Heading4"],
+        styles["Normal"],
+    )
+
+    story.append(
+        Paragraph(
+            f"Applicant Report: {report_data['personal_info']['name']}",
+            h1,
+        )
+    )
+    story.append(
+        Paragraph(
+            f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            normal,
+        )
+    )
+    story.append(Spacer(1, 12))
+
+    # Personal and Academic Information
+    story.append(Paragraph("Personal Information", h2))
+    personal_info = [
+        ["Student ID:", report_data["personal_info"]["student_id"]],
+        ["NetID:", report_data["personal_info"]["netid"]],
+        ["Major:", report_data["academic_info"]["major"]],
+        ["Minor:", report_data["academic_info"]["minor"] or "N/A"],
+        ["GPA:", f"{report_data['academic_info']['gpa']:.2f}"],
+        ["Academic Level:", report_data["academic_info"]["academic_level"]],
+        [
+            "Expected Graduation:",
+            report_data["academic_info"]["expected_graduation_str"],
+        ],
+    ]
+    info_table = Table(personal_info)
+    info_table.setStyle(
+        TableStyle(
+            [
+                ("GRID", (0, 0), (-1, -1), 1, colors.black),
+                ("BACKGROUND", (0, 0), (0, -1), colors.grey),
+                ("TEXTCOLOR", (0, 0), (0, -1), colors.whitesmoke),
+            ]
+        )
+    )
+    story.append(info_table)
+    story.append(Spacer(1, 12))
+
+    # Academic Achievements
+    story.append(Paragraph("Academic Achievements", h2))
+    if report_data.get("achievements"):
+        for achievement in report_data["achievements"]:
+            if isinstance(achievement, dict):
+                achievement_type = achievement.get("type", "Achievement")
+                story.append(
+                    Paragraph(
+                        f"• {achievement_type} - {achievement['date_str']}", normal
+                    )
+                )
+                if achievement.get("description"):
+                    story.append(Paragraph(f"  {achievement['description']}", normal))
+            else:
+                story.append(Paragraph(f"• {str(achievement)}", normal))
+    else:
+        story.append(Paragraph("No achievements recorded", normal))
+    story.append(Spacer(1, 12))
+
+    # Financial Information
+    story.append(Paragraph("Financial Information", h2))
+    financial_info = report_data.get("financial_info", {})
+    if isinstance(financial_info, dict):
+        story.append(
+            Paragraph(
+                f"FAFSA Submitted: {financial_info.get('fafsa_submitted', 'N/A')}",
+                normal,
+            )
+        )
+        story.append(
+            Paragraph(
+                f"Expected Family Contribution: ${financial_info.get('efc', 0):,}",
+                normal,
+            )
+        )
+        story.append(
+            Paragraph(
+                f"Household Income Range: {financial_info.get('household_income', 'N/A')}",
+                normal,
+            )
+        )
+    else:
+        story.append(Paragraph("Financial information not available", normal))
+    story.append(Spacer(1, 12))
+
+    # Current Aid
+    if isinstance(financial_info, dict) and financial_info.get("current_aid"):
+        story.append(Paragraph("Current Financial Aid:", h3))
+        story.append(
+            bullet_list(
+                (
+                    (
+                        f"{aid.get('type', 'Aid')}: ${aid.get('amount', 0):,}"
+                        if isinstance(aid, dict)
+                        else aid
+                    )
+                    for aid in financial_info["current_aid"]
+                ),
+                normal,
+            )
+        )
+    story.append(Spacer(1, 12))
+
+    # Essay Submissions (new section)
+    story.append(Paragraph("Essay Submissions", h2))
+    essays_list = report_data.get("essays") or []
+    if essays_list:
+        for es in essays_list:
+            if isinstance(es, dict):
+                content_preview = (es.get("content", "") or "")[:120]
+                story.append(
+                    Paragraph(
+                        f"• {es.get('prompt', 'Essay')} ({es['submission_date_str']})",
+                        normal,
+                    )
+                )
+                if content_preview:
+                    story.append(Paragraph(f"  {content_preview}", normal))
+        story.append(Spacer(1, 12))
+    else:
+        story.append(Paragraph("No essay submissions recorded", normal))
+        story.append(Spacer(1, 12))
+
+    # Scholarship Awards
+    story.append(Paragraph("Scholarship Awards", h2))
+    story.append(
+        Paragraph(
+            f"Total Awards: {report_data['scholarships']['total_awards']} "
+            f"(${report_data['scholarships']['total_amount']:,})",
+            normal,
+        )
+    )
+
+    for award in report_data["scholarships"]["detailed_awards"]:
+        story.append(
+            Paragraph(
+                f"Award: {award.get('scholarship_name', 'Unknown')}",
+                h3,
+            )
+        )
+        story.append(Paragraph(f"Amount: ${award.get('award_amount', 0):,}", normal))
+        story.append(Paragraph(f"Status: {award.get('status', 'N/A')}", normal))
+        if award.get("award_date"):
+            story.append(Paragraph(f"Award Date: {award['award_date_str']}", normal))
+        # (Per-award raw evaluations removed; consolidated table provided below)
+
+        if award.get("committee_feedback"):
+            story.append(Paragraph("Committee Feedback:", h4))
+            story.append(
+                bullet_list(
+                    (
+                        (
+                            f"{feedback.get('member', 'Member')}: {feedback.get('comments', 'No comments')}"
+                            if isinstance(feedback, dict)
+                            else feedback
+                        )
+                        for feedback in award["committee_feedback"]
+                    ),
+                    normal,
+                )
+            )
+        story.append(Spacer(1, 12))
+
+    # Consolidated Essay Evaluation Section
+    evaluations = report_data.get("essay_evaluations", [])
+    story.append(Paragraph("Consolidated Essay Evaluations", h2))
+    if evaluations:
+        eval_table_data = [
+            [
+                "Source",
+                "Scholarship",
+                "Prompt",
+                "Score",
+                "Reviewer",
+                "Date",
+                "Feedback",
+            ]
+        ]
+        for ev in evaluations:
+            eval_table_data.append(
+                [
+                    ev.get("source", ""),
+                    ev.get("scholarship_name") or "-",
+                    ev.get("prompt", "")[:50],
+                    ev.get("score"),
+                    ev.get("reviewer"),
+                    ev["date_str"],
+                    (ev.get("feedback") or "")[:80],
+                ]
+            )
+        eval_table = Table(eval_table_data, repeatRows=1)
+        eval_table.setStyle(
+            TableStyle(
+                [
+                    ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+                    ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+                ]
+            )
+        )
+        story.append(eval_table)
+    else:
+        story.append(Paragraph("No essay evaluations available", normal))
+
+    doc.build(story)
+    return output_path
@@ -0,0 +1,378 @@
+"""
+Pre-screening evaluation helpers that do not depend on Django.
+
+ReportEngine.generate_prescreening_report reads applicants and award
+decisions from the database, lays them out with ApplicantColumns and then
+evaluates each scholarship with evaluate_scholarship. That function only
+takes plain data, so the scholarships can be fanned out over a process pool
+whose workers import this module without configuring Django.
+"""
+
+import heapq
+import sys
+from operator import itemgetter
+
+import numpy as np
+
+
+def parse_criterion(criterion):
+    """Parse an eligibility criterion string into the parts the report checks.
+
+    Returns:
+        dict: "kind" ("gpa", "major", "enrollment" or None) plus, for GPA
+        criteria, the "required" float and, for major criteria, the
+        "required" major and its lowercased form "required_lower"
+    """
+    if "GPA" in criterion:
+        required_gpa = float(criterion.split("+")[0].split()[-1])
+        return {"kind": "gpa", "required": required_gpa}
+    lowered = criterion.lower()
+    if "major" in lowered:
+        required_major = criterion.split("major")[0].strip()
+        return {
+            "kind": "major",
+            "required": required_major,
+            "required_lower": sys.intern(required_major.lower()),
+        }
+    if "enrollment" in lowered:
+        return {"kind": "enrollment"}
+    return {"kind": None}
+
+
+# Application components, in the order PrescreeningApplicant checks them
+_REQUIRED_COMPONENTS = (
+    "personal_info",
+    "academic_info",
+    "essays",
+    "financial_info",
+    "academic_records",
+)
+
+# Review data for applicants with no essays, interview notes or committee
+# feedback. Shared by every such applicant, so it must not be modified.
+_EMPTY_REVIEW_DATA = {
+    "academic_review": {"score": None, "comments": [], "reviewer": None, "date": None},
+    "essay_review": {"scores": [], "comments": [], "reviewers": [], "dates": []},
+    "interview_notes": None,
+    "committee_feedback": [],
+}
+
+
+class PrescreeningApplicant:
+    """Scholarship-independent pre-screening data for one applicant.
+
+    Resolved once per report rather than once per (scholarship, applicant)
+    pair; the dicts are shared by every assessment of the applicant.
+    """
+
+    __slots__ = ("summary", "application_status", "review_data")
+
+    def __init__(self, applicant):
+        self.summary = {
+            "name": applicant.name,
+            "student_id": applicant.student_id,
+            "major": applicant.major,
+            "gpa": applicant.gpa,
+            "academic_level": applicant.academic_level,
+        }
+
+        # Calculate application completion status. Each of the five
+        # required components is worth 20%.
+        completed = (
+            bool(applicant.name and applicant.student_id),
+            bool(applicant.major and applicant.academic_level),
+            bool(applicant.essays),
+            bool(applicant.financial_info),
+            bool(applicant.academic_history),
+        )
+        completion_percentage = completed.count(True) * 20.0
+
+        # Determine application status
+        if completion_percentage == 100:
+            application_status = "complete"
+        elif completion_percentage > 50:
+            application_status = "in_progress"
+        else:
+            application_status = "incomplete"
+
+        self.application_status = {
+            "status": application_status,
+            "completion_percentage": completion_percentage,
+            "missing_components": [
+                component
+                for component, done in zip(_REQUIRED_COMPONENTS, completed)
+                if not done
+            ],
+        }
+
+        # Review scores and comments, where available. Most applicants being
+        # pre-screened have not been reviewed yet and share one empty record.
+        if not (
+            applicant.essays
+            or applicant.interview_notes
+            or applicant.committee_feedback
+        ):
+            self.review_data = _EMPTY_REVIEW_DATA
+            return
+
+        essay_review = {"scores": [], "comments": [], "reviewers": [], "dates": []}
+        for essay in applicant.essays or ():
+            evaluation = getattr(essay, "evaluation", None)
+            if evaluation is not None:
+                essay_review["scores"].append(evaluation.get("score"))
+                essay_review["comments"].append(evaluation.get("feedback"))
+                essay_review["reviewers"].append(evaluation.get("reviewer"))
+                essay_review["dates"].append(evaluation.get("date"))
+
+        self.review_data = {
+            "academic_review": {
+                "score": None,
+                "comments": [],
+                "reviewer": None,
+                "date": None,
+            },
+            "essay_review": essay_review,
+            "interview_notes": applicant.interview_notes,
+            "committee_feedback": applicant.committee_feedback,
+        }
+
+
+class ApplicantColumns:
+    """Pre-screening applicant data laid out as parallel columns.
+
+    Row ``i`` of every column belongs to the ``i``-th applicant, so criteria
+    are checked with vectorized operations over ``gpa_array`` and
+    ``major_ids`` and the per-applicant loop reads plain lists by index.
+    """
+
+    __slots__ = (
+        "count",
+        "pks",
+        "student_ids",
+        "gpas",
+        "majors",
+        "gpa_array",
+        "major_ids",
+        "distinct_majors",
+        "prepared",
+    )
+
+    def __init__(self, applicants):
+        self.count = len(applicants)
+        self.pks = [applicant.pk for applicant in applicants]
+        self.student_ids = [applicant.student_id for applicant in applicants]
+        self.gpas = [applicant.gpa for applicant in applicants]
+        self.majors = [applicant.major for applicant in applicants]
+        self.gpa_array = np.array(self.gpas, dtype=np.float64)
+        # Lowercased majors as ids into their distinct values, so a major
+        # criterion's substring test runs once per distinct major. They are
+        # interned like parsed criteria, so exact matches compare by identity.
+        ids = {}
+        self.major_ids = np.array(
+            [
+                ids.setdefault(sys.intern(major.lower()), len(ids))
+                for major in self.majors
+            ],
+            dtype=np.intp,
+        )
+        self.distinct_majors = list(ids)
+        # Application status and review data do not depend on the scholarship
+        self.prepared = [PrescreeningApplicant(a) for a in applicants]
+
+
+def evaluate_scholarship(
+    scholarship, award_decisions, columns, matches_only=False, top_k=None
+):
+    """Evaluate every applicant against one scholarship's eligibility criteria.
+
+    Args:
+        scholarship: Dict with the scholarship's "name", "description",
+            "amount", "deadline" and "eligibility_criteria"
+        award_decisions: Applicant pk -> award decision dict for this
+            scholarship
+        columns: ApplicantColumns for the applicants being screened
+        matches_only: Only build assessments for fully qualified applicants
+        top_k: Only keep the top_k highest scoring qualified applicants
+
+    Returns:
+        tuple: The scholarship's entry for the report's "matches" (None when
+        nobody qualifies), its qualified applicants, and a list of
+        (student_id, analysis entry) pairs for "applicant_analysis"
+    """
+    scholarship_matches = []
+    qualified_applicants = []
+    qualification_scores = []  # Track qualification scores for distribution analysis
+    analysis = []
+
+    # Parse each criterion once rather than once per applicant
+    parsed_criteria = [
+        (criterion, parse_criterion(criterion))
+        for criterion in scholarship["eligibility_criteria"]
+    ]
+
+    # Score every criterion against all applicants at once: row i of
+    # ``met`` says which applicants meet criterion i
+    met = np.zeros((len(parsed_criteria), columns.count), dtype=bool)
+    for row, (_, parsed) in enumerate(parsed_criteria):
+        if parsed["kind"] == "gpa":
+            met[row] = columns.gpa_array >= parsed["required"]
+        elif parsed["kind"] == "major":
+            required_lower = parsed["required_lower"]
+            met[row] = np.array(
+                [required_lower in major for major in columns.distinct_majors],
+                dtype=bool,
+            )[columns.major_ids]
+            parsed["exact_match"] = np.array(
+                [required_lower == major for major in columns.distinct_majors],
+                dtype=bool,
+            )[columns.major_ids].tolist()
+        elif parsed["kind"] == "enrollment":
+            # This would need to be enhanced with actual enrollment status data
+            met[row] = True  # Assuming full-time enrollment for demo
+    met_lists = met.tolist()
+    criteria_met_counts = met.sum(axis=0).tolist()
+    meets_all = met.all(axis=0).tolist()
+    total_criteria = len(parsed_criteria)
+
+    for index in range(columns.count):
+        prepared = columns.prepared[index]
+        gpa = columns.gpas[index]
+        major = columns.majors[index]
+        meets_all_criteria = meets_all[index]
+        criteria_met_count = criteria_met_counts[index]
+
+        # Calculate qualification score
+        qualification_score = (criteria_met_count / total_criteria) * 100
+        qualification_scores.append(qualification_score)
+
+        if matches_only and not meets_all_criteria:
+            continue
+
+        eligibility_results = []
+
+        # Evaluate each eligibility criterion
+        for (criterion, parsed), criterion_met in zip(parsed_criteria, met_lists):
+            kind = parsed["kind"]
+            reason = ""
+            details = {}
+
+            # Evaluate GPA requirements
+            if kind == "gpa":
+                required_gpa = parsed["required"]
+                reason = f"GPA: {gpa:.2f} vs required {required_gpa}+"
+                details = {
+                    "type": "gpa",
+                    "required": required_gpa,
+                    "actual": gpa,
+                    "difference": gpa - required_gpa,
+                }
+
+            # Evaluate major requirements
+            elif kind == "major":
+                required_major = parsed["required"]
+                reason = f"Major: {major} vs required {required_major}"
+                details = {
+                    "type": "major",
+                    "required": required_major,
+                    "actual": major,
+                    "exact_match": parsed["exact_match"][index],
+                }
+
+            # Evaluate enrollment status
+            elif kind == "enrollment":
+                reason = "Enrollment status verified"
+                details = {
+                    "type": "enrollment",
+                    "status": "full-time",
+                    "verified": True,
+                }
+
+            # Add detailed evaluation results
+            eligibility_results.append(
+                {
+                    "criterion": criterion,
+                    "is_met": criterion_met[index],
+                    "reason": reason,
+                    "details": details,
+                }
+            )
+
+        # Prepare detailed applicant assessment
+        applicant_assessment = {
+            "applicant": prepared.summary,
+            "qualification_score": qualification_score,
+            "eligibility_details": eligibility_results,
+            "criteria_met_count": criteria_met_count,
+            "total_criteria": total_criteria,
+            "fully_qualified": meets_all_criteria,
+            "application_status": prepared.application_status,
+            "review_data": prepared.review_data,
+            # Simple award decision, if any
+            "award_decision": award_decisions.get(columns.pks[index]),
+        }
+
+        if meets_all_criteria:
+            scholarship_matches.append(applicant_assessment)
+            qualified_applicants.append(
+                {
+                    "applicant": applicant_assessment["applicant"],
+                    "qualification_score": qualification_score,
+                }
+            )
+
+        # Detailed analysis for each applicant
+        analysis.append(
+            (
+                columns.student_ids[index],
+                {
+                    "scholarship_name": scholarship["name"],
+                    "assessment": applicant_assessment,
+                },
+            )
+        )
+
+    if not scholarship_matches:
+        return None, qualified_applicants, analysis
+
+    # Sort qualified applicants by qualification score
+    by_score = itemgetter("qualification_score")
+    if top_k is None:
+        qualified_applicants.sort(key=by_score, reverse=True)
+    else:
+        qualified_applicants = heapq.nlargest(top_k, qualified_applicants, key=by_score)
+
+    match_entry = {
+        "scholarship_name": scholarship["name"],
+        "description": scholarship["description"],
+        "amount": scholarship["amount"],
+        "deadline": scholarship["deadline"],
+        "eligibility_criteria": scholarship["eligibility_criteria"],
+        "matches": scholarship_matches,
+        "qualification_distribution": {
+            "min_score": min(qualification_scores) if qualification_scores else 0,
+            "max_score": max(qualification_scores) if qualification_scores else 0,
+            "average_score": sum(qualification_scores) / len(qualification_scores)
+            if qualification_scores
+            else 0,
+        },
+    }
+    return match_entry, qualified_applicants, analysis
+
+
+def review_tally(review_data):
+    """Summarize one applicant's review record for the report summary.
+
+    Returns:
+        tuple: The academic review score as a 0- or 1-item tuple, the essay
+        scores that are set, and how many reviews are complete (academic
+        review, each scored essay and the interview)
+    """
+    academic_score = review_data["academic_review"]["score"]
+    academic_scores = () if academic_score is None else (academic_score,)
+    essay_scores = tuple(
+        score for score in review_data["essay_review"]["scores"] if score is not None
+    )
+    completed = len(academic_scores) + len(essay_scores)
+    if review_data["interview_notes"]:
+        completed += 1
+    return academic_scores, essay_scores, completed
@@ -0,0 +1,95 @@
+"""Test generate_prescreening_report on the sample scholarships and applicants."""
+import os
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'report_engine.settings')
+django.setup()
+
+from reports_app.models import AwardDecision
+from reports_app.views import _build_prescreening_applicants, _build_sample_engine
+
+engine = _build_sample_engine()
+applicants = _build_prescreening_applicants()
+
+print(f"Sample scholarships: {len(engine.scholarships)}")
+print(f"Sample applicants: {len(applicants)}")
+
+# Full report
+print("\n--- Generating prescreening report ---")
+report = engine.generate_prescreening_report(applicants)
+summary = report['summary']
+
+assert report['scholarships_evaluated'] == len(engine.scholarships)
+assert report['total_applicants'] == len(applicants)
+assert set(report['applicant_analysis']) == {a.student_id for a in applicants}
+for student_id, entries in report['applicant_analysis'].items():
+    assert len(entries) == len(engine.scholarships), student_id
+
+total_matches = sum(len(match['matches']) for match in report['matches'])
+assert summary['total_matches'] == total_matches
+for match in report['matches']:
+    qualified = report['qualified_applicants'][match['scholarship_name']]
+    assert len(qualified) == len(match['matches'])
+    assert all(m['fully_qualified'] for m in match['matches'])
+    scores = [q['qualification_score'] for q in qualified]
+    assert scores == sorted(scores, reverse=True)
+print(f"✓ {total_matches} matches across {len(report['matches'])} scholarships")
+
+completion = summary['application_completion']
+assert sum(completion.values()) == total_matches
+print(f"✓ Application completion: {completion}")
+
+# Same report when only one scholarship is evaluated
+print("\n--- Single scholarship ---")
+name = engine.scholarships[0].name
+single = engine.generate_prescreening_report(applicants, scholarship_id=name)
+assert single['scholarships_evaluated'] == 1
+assert [m['scholarship_name'] for m in single['matches']] in ([], [name])
+print(f"✓ {name}: {len(single['qualified_applicants'].get(name, []))} qualified")
+
+# Matches only keeps the same matches and drops the other assessments
+print("\n--- Matches only ---")
+matches_only = engine.generate_prescreening_report(applicants, matches_only=True)
+assert matches_only['matches'] == report['matches']
+for entries in matches_only['applicant_analysis'].values():
+    assert all(e['assessment']['fully_qualified'] for e in entries)
+print("✓ Matches only report agrees with the full report")
+
+# Evaluating scholarships in worker processes gives the same report
+print("\n--- Parallel evaluation ---")
+# The report is memoized, so build both versions directly
+parallel = engine._build_prescreening_report(
+    applicants, None, matches_only=True, top_k=2, parallel=True
+)
+serial = engine._build_prescreening_report(
+    applicants, None, matches_only=True, top_k=2
+)
+parallel.pop('generated_date')
+serial.pop('generated_date')
+assert parallel == serial
+for qualified in serial['qualified_applicants'].values():
+    assert len(qualified) <= 2
+print("✓ Parallel report matches the serial report")
+
+# A saved award decision is picked up by the next report, not the memoized one
+print("\n--- Award decision invalidation ---")
+assert engine.generate_prescreening_report(applicants) is report
+match = report['matches'][0]
+student_id = match['matches'][0]['applicant']['student_id']
+applicant = next(a for a in applicants if a.student_id == student_id)
+AwardDecision.record(
+    applicant=applicant,
+    scholarship_name=match['scholarship_name'],
+    decision='pending',
+    comments='Prescreening report test',
+)
+try:
+    updated = engine.generate_prescreening_report(applicants)
+    assert updated is not report
+    decisions = [m['award_decision'] for m in updated['matches'][0]['matches']]
+    assert any(d and d['comments'] == 'Prescreening report test' for d in decisions)
+    print("✓ Report rebuilt after the award decision was saved")
+finally:
+    AwardDecision.objects.filter(comments='Prescreening report test').delete()
+
+print("\n✓ Prescreening report tests completed!")
@@ -0,0 +1,63 @@
+"""Test generate_scholarship_report on the scholarships stored in the database."""
+import os
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'report_engine.settings')
+django.setup()
+
+from collections import Counter
+from decimal import Decimal
+
+from reports_app.models import Scholarship
+from reports_app.views import ReportEngine
+
+scholarships = list(Scholarship.objects.all())
+print(f"Scholarships in database: {len(scholarships)}")
+
+# An engine without in-memory scholarships reports on the database
+engine = ReportEngine()
+report = engine.generate_scholarship_report()
+
+# Totals are exact Decimal sums of Scholarship.amount
+print("\n--- Totals ---")
+assert report['total_scholarships'] == len(scholarships)
+assert isinstance(report['total_amount'], (int, Decimal))
+assert report['total_amount'] == sum(s.amount for s in scholarships)
+for detail in report['scholarships']:
+    assert isinstance(detail['amount'], Decimal)
+print(f"✓ Total amount: {report['total_amount']}")
+
+print("\n--- Frequency distribution ---")
+assert report['frequency_distribution'] == Counter(s.frequency for s in scholarships)
+print(f"✓ {report['frequency_distribution']}")
+
+# Filtering keeps the same exact arithmetic
+print("\n--- Filtered report ---")
+annual = engine.generate_scholarship_report({'frequency': 'annual'})
+expected = [s for s in scholarships if s.frequency == 'annual']
+assert annual['total_scholarships'] == len(expected)
+assert annual['total_amount'] == sum(s.amount for s in expected)
+print(f"✓ {len(expected)} annual scholarships, {annual['total_amount']} in total")
+
+# The memoized report follows scholarships saved after it was built
+print("\n--- Database changes ---")
+assert engine.generate_scholarship_report() is report
+added = Scholarship.objects.create(
+    name='Scholarship Report Test Award',
+    description='Created by test_scholarship_report',
+    amount=Decimal('1234.56'),
+    frequency='annual',
+    eligibility_criteria=[],
+)
+try:
+    updated = engine.generate_scholarship_report()
+    assert updated is not report
+    assert updated['total_scholarships'] == report['total_scholarships'] + 1
+    assert updated['total_amount'] == report['total_amount'] + Decimal('1234.56')
+    print("✓ Report rebuilt after a scholarship was added")
+finally:
+    added.delete()
+assert engine.generate_scholarship_report()['total_amount'] == report['total_amount']
+print("✓ Report rebuilt after the scholarship was deleted")
+
+print("\n✓ Scholarship report tests completed!")
@@ -9,4 +9,5 @@ urlpatterns = [
     path('clear-request-logs/', views.clear_request_logs, name='clear_request_logs'),
     path('award-decision/', views.award_scholarship, name='award_scholarship'),
     path('prescreening-report/', views.view_prescreening_report, name='view_prescreening_report'),
+    path('export-status/<str:task_id>/', views.export_status, name='export_status'),
 ]
@@ -1,17 +1,36 @@
 from django.shortcuts import render, redirect
-from django.http import HttpResponse
+from django.conf import settings
+from django.db.models import QuerySet
+from django.http import (
+    FileResponse,
+    HttpResponse,
+    HttpResponseBadRequest,
+    HttpResponseNotModified,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.urls import reverse
+from django.views.decorators.gzip import gzip_page
 from django.contrib.auth.decorators import login_required
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from copy import copy
+from functools import lru_cache, partial
+from itertools import islice, zip_longest
+from operator import itemgetter
+import heapq
+import io
+import json
+import logging
 import os
-import pandas as pd
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill
+import re
+import threading
+import time
+import uuid
 import csv
+import hashlib
 import tempfile
 from .models import (
     Applicant,
@@ -20,7 +39,681 @@ from .models import (
     ReviewerInformationRequest,
     AwardDecision,
 )
+from django.db import close_old_connections, connection
 from django.utils import timezone
+from django.core.cache import cache
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
+from django.middleware.gzip import GZipMiddleware
+
+logger = logging.getLogger("reports_app")
+# Appends to settings.INFORMATION_REQUEST_LOG_FILE; its directory is created
+# once, by ReportsAppConfig.ready, rather than on every request
+info_request_logger = logging.getLogger("reports_app.information_requests")
+
+# Header row for the per-scholarship applicant table in the pre-screening PDF
+_APPLICANT_TABLE_HEADER = (
+    "Name",
+    "Student ID",
+    "Major",
+    "GPA",
+    "Academic Level",
+    "Application Status",
+    "Review Score",
+    "Award Decision",
+)
+# ReportLab lays out and splits one large Table far more slowly than several
+# small ones, so long applicant tables are emitted in chunks of this many rows
+_APPLICANT_TABLE_CHUNK_ROWS = 200
+_APPLICANT_TABLE_FIELDS = itemgetter("name", "student_id", "major")
+
+# Write buffer for file exports, large enough that CSV rows and the many small
+# writes made by json.dump are not flushed one by one
+_EXPORT_BUFFER_SIZE = 1024 * 1024
+# Streamed CSV responses send this many lines per chunk rather than one
+_CSV_STREAM_CHUNK_LINES = 500
+
+_EXPORT_CONTENT_TYPES = {
+    "pdf": "application/pdf",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "csv": "text/csv",
+}
+
+VALID_FORMATS = frozenset(_EXPORT_CONTENT_TYPES)
+VALID_TYPES = frozenset(
+    {"general", "donor", "applicant", "disbursement", "prescreening"}
+)
+
+# Models whose row count and latest update are folded into export cache keys
+_REPORT_CACHE_MODELS = (Applicant, ScholarshipAward, AwardDecision, Scholarship)
+_REPORT_CACHE_MAX_FILES = 64
+# Seconds a cached export is served for; bounds how old its "Generated on"
+# time can be
+_REPORT_CACHE_TTL = 300
+
+# Seconds a generated donor report is reused across exports; also bounds how
+# stale the default "last year up to now" window can get
+_DONOR_REPORT_CACHE_TTL = 300
+
+# Pre-screening reports an engine keeps memoized for its exporters
+_PRESCREENING_REPORT_CACHE_SIZE = 16
+
+# ScholarshipAward fields generate_applicant_report reads from each award
+_APPLICANT_REPORT_AWARD_FIELDS = (
+    "applicant_id",
+    "scholarship_name",
+    "award_amount",
+    "award_date",
+    "status",
+    "disbursement_dates",
+    "requirements_met",
+    "requirements_pending",
+    "performance_metrics",
+    "essays_evaluation",
+    "interview_notes",
+    "committee_feedback",
+)
+
+# Optional donor report parts the PDF, Excel and CSV exports render; none of
+# them show award performance metrics
+_DONOR_EXPORT_FIELDS = frozenset({"key_dates", "scholarships"})
+
+# zlib level for xlsx archives written by _save_workbook
+_XLSX_COMPRESSLEVEL = 1
+
+_CURRENCY_FORMAT = '"$"#,##0.00'
+
+# Transient exports go to tmpfs when the host has one, so a typical report
+# never touches the disk; None lets tempfile fall back to its usual directory
+_SCRATCH_DIR = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
+# pandas, ReportLab and openpyxl are imported inside the functions that use
+# them, so loading this module (every worker start) does not pay their
+# import cost; Python caches each module after its first import.
+
+
+@lru_cache(maxsize=None)
+def _excel_styles():
+    """Build the shared Excel fonts and header style once, on first use.
+
+    Returns:
+        dict: "bold_font", "title_font" and "header_style"
+    """
+    from openpyxl.styles import Font, NamedStyle, PatternFill
+
+    bold_font = Font(bold=True)
+    header_fill = PatternFill(
+        start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"
+    )
+    return {
+        "bold_font": bold_font,
+        "title_font": Font(bold=True, size=14),
+        "header_style": NamedStyle(name="header", font=bold_font, fill=header_fill),
+    }
+
+
+def _styled_cell(ws, value, font=None, fill=None):
+    """Build a styled cell for a write-only worksheet.
+
+    Args:
+        ws: Write-only worksheet the cell will be appended to
+        value: Cell value
+        font: Font to apply (bold by default)
+        fill: Optional fill to apply
+
+    Returns:
+        WriteOnlyCell: Cell ready to be passed to ``ws.append``
+    """
+    from openpyxl.cell import WriteOnlyCell
+
+    cell = WriteOnlyCell(ws, value=value)
+    cell.font = font if font is not None else _excel_styles()["bold_font"]
+    if fill is not None:
+        cell.fill = fill
+    return cell
+
+
+def _report_date(value):
+    """Return a report's "YYYY-MM-DD" date string as a datetime, else as is."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except (TypeError, ValueError):
+        return value
+
+
+def _date_cell(ws, value):
+    """Build a write-only cell for a report date string, formatted as a date.
+
+    Args:
+        ws: Write-only worksheet the cell will be appended to
+        value: "YYYY-MM-DD" string; anything else is written unchanged
+
+    Returns:
+        WriteOnlyCell: Cell ready to be passed to ``ws.append``
+    """
+    from openpyxl.cell import WriteOnlyCell
+
+    value = _report_date(value)
+    cell = WriteOnlyCell(ws, value=value)
+    if isinstance(value, datetime):
+        cell.number_format = "yyyy-mm-dd"
+    return cell
+
+
+def _currency_cell(ws, amount):
+    """Build a numeric write-only cell displayed as currency.
+
+    Args:
+        ws: Write-only worksheet the cell will be appended to
+        amount: Numeric amount
+
+    Returns:
+        WriteOnlyCell: Cell ready to be passed to ``ws.append``
+    """
+    from openpyxl.cell import WriteOnlyCell
+
+    cell = WriteOnlyCell(ws, value=amount)
+    cell.number_format = _CURRENCY_FORMAT
+    return cell
+
+
+def _register_header_style(wb):
+    """Register the shared header NamedStyle on a workbook.
+
+    A copy is added because ``add_named_style`` binds the style to the
+    workbook it is registered with.
+
+    Returns:
+        str: Style name to assign to ``cell.style``
+    """
+    header_style = _excel_styles()["header_style"]
+    if header_style.name not in wb.named_styles:
+        wb.add_named_style(copy(header_style))
+    return header_style.name
+
+
+def _header_row(ws, headers):
+    """Build a bold, grey-filled header row for a write-only worksheet."""
+    from openpyxl.cell import WriteOnlyCell
+
+    header_style = _register_header_style(ws.parent)
+    row = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.style = header_style
+        row.append(cell)
+    return row
+
+
+def _apply_column_widths(ws, widths):
+    """Apply a ``{column_index: width}`` map to a worksheet.
+
+    Write-only worksheets emit column settings with the first row, so this
+    must be called before anything is appended.
+    """
+    from openpyxl.utils import get_column_letter
+
+    for idx, width in widths.items():
+        ws.column_dimensions[get_column_letter(idx)].width = width
+
+
+def _track_width(widths, column, value):
+    """Fold the display length of ``value`` into a running per-column max."""
+    length = len(str(value))
+    if length > widths.get(column, 0):
+        widths[column] = length
+
+
+def _fit_column_widths(ws, widths, max_width=50):
+    """Size columns from lengths gathered with ``_track_width``."""
+    _apply_column_widths(
+        ws, {idx: min(length + 2, max_width) for idx, length in widths.items()}
+    )
+
+
+def _save_workbook(wb, output_path, compresslevel=_XLSX_COMPRESSLEVEL):
+    """Save a workbook, choosing the deflate level of the xlsx archive.
+
+    ``Workbook.save()`` always deflates at zlib's default level 6. Each part
+    is written straight into the archive either way; a lower level mainly
+    trades a slightly larger file for less CPU per export.
+    """
+    from zipfile import ZIP_DEFLATED, ZipFile
+
+    from openpyxl.writer.excel import ExcelWriter
+
+    if wb.write_only and not wb.worksheets:
+        wb.create_sheet()
+    archive = ZipFile(
+        output_path, "w", ZIP_DEFLATED, allowZip64=True, compresslevel=compresslevel
+    )
+    ExcelWriter(wb, archive).save()
+    return output_path
+
+
+def _append_sized_rows(ws, rows, max_width=50):
+    """Size columns to fit ``rows``, then append them to a write-only sheet.
+
+    Rows may mix plain values and WriteOnlyCells; a cell's value is measured.
+    Nothing may have been appended to ``ws`` yet, since write-only sheets
+    emit their column widths with the first row.
+    """
+    # Measure column by column, so each column's width is one max() over
+    # its values rather than a comparison and dict update per cell
+    widths = {}
+    for column, values in enumerate(zip_longest(*rows, fillvalue=""), 1):
+        longest = max(len(str(getattr(value, "value", value))) for value in values)
+        if longest:
+            widths[column] = longest
+    _fit_column_widths(ws, widths, max_width)
+    for row in rows:
+        ws.append(row)
+
+
+def _prescreening_review_cells(review_data):
+    """Format the review-derived cells of one pre-screening applicant."""
+    essay_scores = review_data.get("essay_review", {}).get("scores", [])
+
+    # Calculate average review score
+    review_scores = []
+    if review_data.get("academic_review", {}).get("score"):
+        review_scores.append(review_data["academic_review"]["score"])
+    if essay_scores:
+        review_scores.extend(essay_scores)
+
+    return {
+        "avg_review_score": (
+            f"{sum(review_scores) / len(review_scores):.1f}"
+            if review_scores
+            else "N/A"
+        ),
+        "essay_scores": ", ".join(f"{score:.1f}" for score in essay_scores) or "N/A",
+        "has_interview": "Yes" if review_data.get("interview_notes") else "No",
+        "has_committee_feedback": (
+            "Yes" if review_data.get("committee_feedback") else "No"
+        ),
+    }
+
+
+def _prescreening_applicant_cells(report_data):
+    """Format the per-applicant cells of a pre-screening report once.
+
+    An applicant's review data is the same for every scholarship they match,
+    so the derived cells are computed on first sight and looked up by
+    student ID for every later row. Review records shared between applicants
+    (e.g. the empty record of everyone not yet reviewed) are formatted once.
+    Exporters get the cells through ReportEngine._prescreening_cells, which
+    keeps them with the memoized report.
+
+    Returns:
+        dict: student_id -> dict of preformatted cell strings
+    """
+    cells = {}
+    review_cells = {}
+    for scholarship_match in report_data["matches"]:
+        for match in scholarship_match["matches"]:
+            applicant = match["applicant"]
+            if applicant["student_id"] in cells:
+                continue
+            review_data = match.get("review_data", {})
+            formatted = review_cells.get(id(review_data))
+            if formatted is None:
+                formatted = review_cells[id(review_data)] = (
+                    _prescreening_review_cells(review_data)
+                )
+            cells[applicant["student_id"]] = {
+                "gpa": f"{applicant['gpa']:.2f}",
+                **formatted,
+            }
+    return cells
+
+
+@lru_cache(maxsize=2048)
+def _format_donor_award_row(
+    scholarship,
+    recipient,
+    amount,
+    disbursed,
+    status,
+    requirements_met,
+    requirements_pending,
+    next_disbursement,
+):
+    """Format one donor report award row; memoized on its hashable fields."""
+    return (
+        scholarship,
+        recipient,
+        f"${amount:,.2f}",
+        f"${disbursed:,.2f}",
+        status,
+        "; ".join(requirements_met),
+        "; ".join(requirements_pending),
+        next_disbursement.strftime("%Y-%m-%d") if next_disbursement else "N/A",
+    )
+
+
+def _donor_award_row(award):
+    """Return the formatted export row for a donor report award summary.
+
+    The Excel and CSV donor exports share this, so an award rendered by one
+    is a cache hit for the other.
+    """
+    return _format_donor_award_row(
+        award["scholarship"],
+        award["recipient"],
+        award["amount"],
+        award["disbursed"],
+        award["status"],
+        tuple(award["requirements_met"]),
+        tuple(award["requirements_pending"]),
+        award["next_disbursement"],
+    )
+
+
+def _decode_json_string(value, default):
+    """Return a JSONField value, decoding it if it was stored double-encoded.
+
+    Args:
+        value: Field value, normally already a list or dict
+        default: Returned when ``value`` is a string that is not valid JSON
+    """
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return default
+    return value
+
+
+def _parse_datetimes(values):
+    """Parse ISO 8601 date strings to aware datetimes, each distinct one once.
+
+    Values with a UTC offset keep it; naive values are made aware in the
+    current time zone, as timezone.make_aware does.
+
+    Args:
+        values: Iterable of date strings; duplicates are parsed once
+
+    Returns:
+        dict: Each distinct string -> aware datetime, or None if it is not
+        a valid ISO 8601 date
+    """
+    parsed = {}
+    for string in values:
+        if string in parsed:
+            continue
+        value = _parse_iso_date(string)
+        if not isinstance(value, datetime):
+            value = None
+        elif timezone.is_naive(value):
+            value = timezone.make_aware(value)
+        parsed[string] = value
+    return parsed
+
+
+# gzip_page for a single response, for views that also serve PDF and XLSX
+# files: those are compressed already, so only text responses go through it
+_gzip_response = GZipMiddleware(lambda request: None).process_response
+
+# Background exports: task id -> {"future", "owner", "created", "report_type",
+# "export_format", "output_path"}. Each format has its own queue, so a
+# backlog of slow PDF renders cannot hold up quick CSV or Excel exports.
+_EXPORT_EXECUTORS = {
+    export_format: ThreadPoolExecutor(
+        max_workers=os.cpu_count() or 1,
+        thread_name_prefix=f"report-export-{export_format}",
+    )
+    for export_format in _EXPORT_CONTENT_TYPES
+}
+_EXPORT_TASKS = {}
+_EXPORT_TASKS_LOCK = threading.Lock()
+# Unfinished exports accepted at once; further requests are turned away
+_EXPORT_TASKS_MAX_PENDING = 32
+# Seconds a finished export waits to be downloaded before it is deleted
+_EXPORT_TASK_TTL = 15 * 60
+
+
+def _sweep_export_tasks():
+    """Forget finished exports older than _EXPORT_TASK_TTL and delete their files.
+
+    Must be called with _EXPORT_TASKS_LOCK held.
+    """
+    expired = time.monotonic() - _EXPORT_TASK_TTL
+    for task_id, task in list(_EXPORT_TASKS.items()):
+        if task["created"] < expired and task["future"].done():
+            del _EXPORT_TASKS[task_id]
+            try:
+                os.unlink(task["output_path"])
+            except FileNotFoundError:
+                pass
+
+
+def _run_export(export_method, *args, **kwargs):
+    """Run an export on a worker thread and release its DB connection."""
+    try:
+        return export_method(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+class _TemporaryDownload(io.FileIO):
+    """Read-only handle on an exported temp file that deletes it on close.
+
+    FileResponse closes its file after the last block has been sent, so the
+    export streams from disk without being read into memory and is removed
+    once the download finishes.
+    """
+
+    def __init__(self, path):
+        super().__init__(path, "rb")
+
+    def close(self):
+        was_closed = self.closed
+        super().close()
+        if not was_closed:
+            try:
+                os.unlink(self.name)
+            except FileNotFoundError:
+                pass
+
+
+# Every form datetime.fromisoformat() accepts starts with a four digit year
+_ISO_DATE_START = re.compile(r"\d{4}").match
+
+
+def _parse_iso_date(value):
+    """Return ``value`` as a datetime if it is an ISO date string, else as is.
+
+    Strings that cannot be ISO dates are returned without calling
+    fromisoformat, so they do not pay for a raised and caught ValueError.
+    """
+    if isinstance(value, str) and _ISO_DATE_START(value):
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            pass
+    return value
+
+
+class _Echo:
+    """Pseudo-buffer whose write() hands the formatted CSV line back."""
+
+    def write(self, value):
+        return value
+
+
+_CSV_NEEDS_QUOTING = re.compile(r'["\r\n]').search
+
+
+def _csv_chunks(lines, size=_CSV_STREAM_CHUNK_LINES):
+    """Join CSV lines into chunks of up to ``size`` lines for streaming.
+
+    Each item of a StreamingHttpResponse is written to the client on its
+    own, so sending single lines costs one write per row.
+    """
+    lines = iter(lines)
+    while True:
+        chunk = "".join(islice(lines, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _csv_lines(rows):
+    """Yield each row as a CSV line, byte-identical to csv.writer's output.
+
+    Most report rows are plain names, IDs and numbers that need no quoting,
+    so they are joined directly; only rows with a quote, comma or line break
+    in a field go through csv.writer.
+    """
+    writerow = csv.writer(_Echo()).writerow
+    for row in rows:
+        fields = ["" if value is None else str(value) for value in row]
+        line = ",".join(fields)
+        if (
+            _CSV_NEEDS_QUOTING(line)
+            or line.count(",") != len(fields) - 1
+            or fields == [""]
+        ):
+            yield writerow(row)
+        else:
+            yield line + "\r\n"
+
+
+def _open_download(output_path):
+    """Open an exported temp file for streaming and hand its lifetime to the OS.
+
+    On POSIX the path is unlinked as soon as it is open: the descriptor keeps
+    the data readable until FileResponse closes it, and the kernel reclaims
+    the blocks even if the worker dies mid-download. Other platforms cannot
+    unlink open files, so they fall back to deleting it on close.
+
+    Args:
+        output_path: Path of the exported file
+
+    Returns:
+        File object positioned at the start of the export
+    """
+    if os.name != "posix":
+        return _TemporaryDownload(output_path)
+    handle = open(output_path, "rb")
+    os.unlink(output_path)
+    return handle
+
+
+def _download_response(output_path, content_type, filename):
+    """Stream an exported temp file as an attachment, deleting it afterwards."""
+    return FileResponse(
+        _open_download(output_path),
+        content_type=content_type,
+        as_attachment=True,
+        filename=filename,
+    )
+
+
+def _table_state(*models):
+    """Return the row count and latest ``updated_at`` of each model's table.
+
+    Every table is read in one query. The result changes whenever a row is
+    added, deleted or saved, in this process or any other, so cache keys
+    built from it never outlive the data. Bulk ``QuerySet.update()`` calls
+    on these models must set ``updated_at`` as well.
+    """
+    quote = connection.ops.quote_name
+    columns = []
+    for model in models:
+        table = quote(model._meta.db_table)
+        updated_at = quote(model._meta.get_field("updated_at").column)
+        columns.append(f"(SELECT COUNT(*) FROM {table})")
+        columns.append(f"(SELECT MAX({updated_at}) FROM {table})")
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT " + ", ".join(columns))
+        return tuple(cursor.fetchone())
+
+
+def _export_cache_key(engine, *parts):
+    """Hash export request parameters together with the data they read.
+
+    The engine's report version and each cached model's row count and latest
+    ``updated_at`` are part of the key, so any change to the underlying data
+    yields a new key and older cached files are simply never looked up again.
+    So is the current _REPORT_CACHE_TTL window, so a cached file's "Generated
+    on" time is never much older than the request.
+    """
+    salt = (
+        engine._report_version,
+        *_table_state(*_REPORT_CACHE_MODELS),
+        int(time.time() // _REPORT_CACHE_TTL),
+    )
+    raw = "|".join(str(part) for part in (*parts, *salt))
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _prune_report_cache(cache_dir, max_files=_REPORT_CACHE_MAX_FILES):
+    """Delete the oldest cached exports beyond ``max_files``.
+
+    Other requests may delete files at the same time, so files that vanish
+    while the directory is scanned are skipped.
+    """
+    entries = []
+    for entry in os.scandir(cache_dir):
+        try:
+            if entry.is_file():
+                entries.append((entry.stat().st_mtime, entry.path))
+        except FileNotFoundError:
+            pass
+    entries.sort()
+    for _, path in entries[:-max_files]:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+def _cached_download_response(handle, content_type, filename, etag):
+    """Serve a cached export with validators so repeat requests can 304."""
+    response = FileResponse(
+        handle, content_type=content_type, as_attachment=True, filename=filename
+    )
+    response["ETag"] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def _prescreening_applicant_key(applicant):
+    """Return a hashable key for the applicant data a pre-screening report reads.
+
+    Saved applicants are identified by primary key and ``updated_at``; unsaved
+    ones, such as the demo applicants, by their serialized fields.
+    """
+    if applicant.pk is not None and applicant.updated_at is not None:
+        return (applicant.pk, applicant.updated_at)
+    return json.dumps(
+        [
+            applicant.name,
+            applicant.student_id,
+            applicant.major,
+            applicant.gpa,
+            applicant.academic_level,
+            applicant.essays,
+            applicant.financial_info,
+            applicant.academic_history,
+            applicant.interview_notes,
+            applicant.committee_feedback,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+
+
+def _check_information_request_fields(reviewer_name, request_type, request_details):
+    """Raise ValueError if a required information request field is missing."""
+    if not reviewer_name:
+        raise ValueError("reviewer_name is required")
+    if not request_type:
+        raise ValueError("request_type is required")
+    if not request_details:
+        raise ValueError("request_details is required")
 
 
 class ReportEngine:
@@ -28,6 +721,23 @@ class ReportEngine:
 
     def __init__(self):
         self.scholarships = []
+        # Scholarships keyed by donor name, maintained by add_scholarship
+        self._by_donor = defaultdict(list)
+        # Bumped whenever self.scholarships changes; cached data keys on it
+        self._report_version = 0
+        # Tells this engine's entries in the shared Django cache apart
+        self._cache_token = uuid.uuid4().hex
+        # Scholarship report summaries memoized per (filters, version), where
+        # version includes the Scholarship table state on the database path
+        self._scholarship_report_cache = lru_cache(maxsize=32)(
+            self._build_scholarship_report
+        )
+        # Pre-screening reports keyed on scholarship, applicant and award
+        # decision data, as [report, applicant cells or None] entries;
+        # cleared by add_scholarship. Export threads share the engine, so
+        # lookups and evictions hold the lock.
+        self._prescreen_cache = {}
+        self._prescreen_lock = threading.Lock()
 
     # Function to log reviewer requests for additional applicant information
     # Implements requirement SFWE504_3-LLR-27.
@@ -62,13 +772,7 @@ class ReportEngine:
         Raises:
             ValueError: If applicant cannot be found or required fields are missing
         """
-        # Validate required fields
-        if not reviewer_name:
-            raise ValueError("reviewer_name is required")
-        if not request_type:
-            raise ValueError("request_type is required")
-        if not request_details:
-            raise ValueError("request_details is required")
+        _check_information_request_fields(reviewer_name, request_type, request_details)
 
         # Get applicant instance if not provided
         if not applicant:
@@ -97,32 +801,89 @@ class ReportEngine:
 
         return request
 
+    def bulk_log_information_requests(
+        self, items: List[Dict[str, Any]]
+    ) -> List[ReviewerInformationRequest]:
+        """Log several reviewer information requests at once.
+
+        Applicants are looked up in one query, the requests are inserted
+        with bulk_create and their log entries are written in a single call.
+
+        Args:
+            items (list): One dict per request, holding the keyword arguments
+                of log_information_request
+
+        Returns:
+            List[ReviewerInformationRequest]: The created request objects
+
+        Raises:
+            ValueError: If an applicant cannot be found or required fields are missing
+        """
+        student_ids = set()
+        for item in items:
+            _check_information_request_fields(
+                item.get("reviewer_name"),
+                item.get("request_type"),
+                item.get("request_details"),
+            )
+            if not item.get("applicant"):
+                if not item.get("applicant_id"):
+                    raise ValueError(
+                        "Either applicant or applicant_id must be provided"
+                    )
+                student_ids.add(item["applicant_id"])
+
+        applicants = Applicant.objects.in_bulk(student_ids, field_name="student_id")
+        missing = student_ids - applicants.keys()
+        if missing:
+            raise ValueError(f"Applicant with student_id '{min(missing)}' not found")
+
+        requests = ReviewerInformationRequest.objects.bulk_create(
+            [
+                ReviewerInformationRequest(
+                    applicant=item.get("applicant") or applicants[item["applicant_id"]],
+                    reviewer_name=item["reviewer_name"],
+                    reviewer_email=item.get("reviewer_email"),
+                    scholarship_name=item.get("scholarship_name"),
+                    request_type=item["request_type"],
+                    request_details=item["request_details"],
+                    priority=item.get("priority", "medium"),
+                )
+                for item in items
+            ],
+            batch_size=500,
+        )
+
+        if requests:
+            info_request_logger.info(
+                "\n".join(
+                    self._information_request_log_entry(request) for request in requests
+                )
+            )
+
+        return requests
+
     def _generate_information_request_log(
         self, request: ReviewerInformationRequest
     ) -> str:
         """Generate a detailed log report for an information request.
 
-        Creates a timestamped log file documenting the request details.
+        Appends an entry documenting the request details to the rotating
+        information request log (settings.INFORMATION_REQUEST_LOG_FILE).
 
         Args:
             request (ReviewerInformationRequest): The information request object
 
         Returns:
-            str: Path to the generated log file
+            str: Path to the information request log file
         """
-        # Create logs directory if it doesn't exist
-        logs_dir = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), "information_request_logs"
-        )
-        os.makedirs(logs_dir, exist_ok=True)
-
-        # Generate timestamped filename
-        timestamp = request.requested_at.strftime("%Y%m%d_%H%M%S")
-        filename = f"info_request_{request.id}_{timestamp}.txt"
-        log_path = os.path.join(logs_dir, filename)
+        info_request_logger.info(self._information_request_log_entry(request))
+        return str(settings.INFORMATION_REQUEST_LOG_FILE)
 
-        # Generate log content
-        log_content = f"""
+    @staticmethod
+    def _information_request_log_entry(request: ReviewerInformationRequest) -> str:
+        """Return the log entry text documenting an information request."""
+        return f"""\
 ================================================================================
 APPLICANT INFORMATION REQUEST LOG
 ================================================================================
@@ -166,30 +927,25 @@ Fulfillment Notes: {request.fulfillment_notes or "N/A"}
 
 ================================================================================
 END OF LOG
-================================================================================
-"""
-
-        # Write log to file
-        with open(log_path, "w", encoding="utf-8") as f:
-            f.write(log_content.strip())
-
-        logger.info(f"Information request log generated: {log_path}")
-        return log_path
+================================================================================"""
 
     def get_information_requests(
         self, applicant_id: str = None, status: str = None, scholarship_name: str = None
-    ) -> List[ReviewerInformationRequest]:
+    ) -> QuerySet[ReviewerInformationRequest]:
         """Retrieve information requests with optional filtering.
 
+        The result is left unevaluated so callers can count, slice or
+        iterate it without materialising every row first.
+
         Args:
             applicant_id (str, optional): Filter by applicant student ID
             status (str, optional): Filter by request status ('pending', 'in_progress', 'fulfilled', 'cancelled')
             scholarship_name (str, optional): Filter by scholarship name
 
         Returns:
-            List[ReviewerInformationRequest]: List of matching requests
+            QuerySet[ReviewerInformationRequest]: Lazy queryset of matching requests
         """
-        queryset = ReviewerInformationRequest.objects.all()
+        queryset = ReviewerInformationRequest.objects.select_related("applicant")
 
         if applicant_id:
             queryset = queryset.filter(applicant__student_id=applicant_id)
@@ -200,7 +956,7 @@ END OF LOG
         if scholarship_name:
             queryset = queryset.filter(scholarship_name=scholarship_name)
 
-        return list(queryset)
+        return queryset
 
     def update_request_status(
         self, request_id: int, status: str, fulfillment_notes: str = None
@@ -229,12 +985,18 @@ END OF LOG
         except ReviewerInformationRequest.DoesNotExist:
             raise ValueError(f"Request with ID {request_id} not found")
 
+        # Nothing to save or log when the request already looks like this
+        if request.status == status and (
+            not fulfillment_notes or request.fulfillment_notes == fulfillment_notes
+        ):
+            return request
+
         request.status = status
         if status == "fulfilled":
             request.fulfilled_at = timezone.now()
         if fulfillment_notes:
             request.fulfillment_notes = fulfillment_notes
-        request.save()
+        request.save(update_fields=["status", "fulfilled_at", "fulfillment_notes"])
 
         # Regenerate log with updated status
         self._generate_information_request_log(request)
@@ -247,6 +1009,8 @@ END OF LOG
         donor_name: str,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        fields: Optional[set] = None,
+        top_n: Optional[int] = None,
     ) -> dict:
         """Generate a comprehensive report for a specific donor including key dates and award summaries.
 
@@ -254,26 +1018,76 @@ END OF LOG
             donor_name (str): Name of the donor to generate report for
             start_date (datetime, optional): Start date for report period
             end_date (datetime, optional): End date for report period
+            fields (set, optional): Optional parts to build, out of
+                'key_dates', 'scholarships' and 'performance_metrics'. Parts
+                left out come back empty. Defaults to all of them.
+            top_n (int, optional): Only list the top_n active awards with the
+                soonest next disbursement and the top_n most recent
+                completed awards. The summary still counts every award.
 
         Returns:
             dict: Detailed donor report including scholarships, awards, and key dates
         """
+        # Keyed on the engine's scholarships and on the state of the award and
+        # applicant tables, so no process serves a report older than the data
+        raw_key = "|".join(
+            str(part)
+            for part in (
+                self._cache_token,
+                self._report_version,
+                _table_state(ScholarshipAward, Applicant),
+                donor_name,
+                start_date.isoformat() if start_date else None,
+                end_date.isoformat() if end_date else None,
+                ",".join(sorted(fields)) if fields is not None else None,
+                top_n,
+            )
+        )
+        key = "donor_report:" + hashlib.blake2b(raw_key.encode()).hexdigest()
+        report = cache.get(key)
+        if report is None:
+            report = self._build_donor_report(
+                donor_name, start_date, end_date, fields, top_n
+            )
+            cache.set(key, report, _DONOR_REPORT_CACHE_TTL)
+        return report
+
+    def _build_donor_report(
+        self,
+        donor_name: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        fields: Optional[set] = None,
+        top_n: Optional[int] = None,
+    ) -> dict:
+        """Build the donor report returned (and cached) by generate_donor_report."""
+        import pandas as pd
+
+        def wanted(part):
+            return fields is None or part in fields
+
+        with_key_dates = wanted("key_dates")
+        with_metrics = wanted("performance_metrics")
+
         # Default to last year if no dates provided
         if not end_date:
             end_date = timezone.now()
         if not start_date:
             start_date = end_date - pd.DateOffset(years=1)
 
-        # Ensure dates are timezone-aware
-        if end_date.tzinfo is None:
-            end_date = timezone.make_aware(end_date)
-        if start_date.tzinfo is None:
-            start_date = timezone.make_aware(start_date)
+        # Attach the current timezone to naive datetimes. A plain replace()
+        # is enough here: the default zone is UTC, so there is no DST
+        # ambiguity for make_aware to resolve.
+        default_tz = timezone.get_current_timezone()
 
-        # Filter scholarships for this donor
-        donor_scholarships = [
-            s for s in self.scholarships if s.donor_info.get("name") == donor_name
-        ]
+        def aware(dt):
+            return dt if dt.tzinfo else dt.replace(tzinfo=default_tz)
+
+        end_date = aware(end_date)
+        start_date = aware(start_date)
+
+        # Scholarships for this donor, from the index kept by add_scholarship
+        donor_scholarships = self._by_donor.get(donor_name, ())
 
         active_awards = []
         completed_awards = []
@@ -284,105 +1098,124 @@ END OF LOG
         total_awarded = 0
         total_disbursed = 0
 
-        for scholarship in donor_scholarships:
-            # Track deadlines
-            if scholarship.deadline:
-                deadline = scholarship.deadline
-                if deadline.tzinfo is None:
-                    deadline = timezone.make_aware(deadline)
-                if start_date <= deadline <= end_date:
-                    upcoming_deadlines.append(
-                        {
-                            "scholarship": scholarship.name,
-                            "deadline": deadline,
-                            "type": "Application Deadline",
-                        }
-                    )
-
-            # Track review dates (stored as ISO strings in JSON)
-            if scholarship.review_dates:
-                # Handle case where review_dates might be a JSON string instead of a list
-                review_dates_list = scholarship.review_dates
-                if isinstance(review_dates_list, str):
-                    try:
-                        import json
-
-                        review_dates_list = json.loads(review_dates_list)
-                    except:
-                        review_dates_list = []
+        # Every award on this donor's scholarships made within the report
+        # period, joined to its applicant, in a single query, grouped by
+        # scholarship for the loop below. The rows are read in chunks rather
+        # than cached on the queryset too.
+        award_columns = [
+            "scholarship_name",
+            "award_date",
+            "award_amount",
+            "status",
+            "disbursement_dates",
+            "requirements_met",
+            "requirements_pending",
+            "applicant__name",
+        ]
+        if with_metrics:
+            award_columns.append("performance_metrics")
+        awards_by_scholarship = defaultdict(list)
+        for award in (
+            ScholarshipAward.objects.filter(
+                scholarship_name__in={s.name for s in donor_scholarships},
+                award_date__gte=start_date,
+                award_date__lte=end_date,
+            )
+            .select_related("applicant")
+            .only(*award_columns)
+            .iterator(chunk_size=200)
+        ):
+            awards_by_scholarship[award.scholarship_name].append(award)
+
+        # Parse the review, reporting and disbursement date strings of every
+        # scholarship and award up front, each distinct string once
+        def date_strings():
+            if with_key_dates:
+                for scholarship in donor_scholarships:
+                    if isinstance(scholarship.review_dates, list):
+                        yield from scholarship.review_dates
+                    if isinstance(scholarship.reporting_schedule, dict):
+                        yield from scholarship.reporting_schedule.values()
+            for awards in awards_by_scholarship.values():
+                for award in awards:
+                    if isinstance(award.disbursement_dates, list):
+                        yield from award.disbursement_dates
+
+        parsed_dates = _parse_datetimes(
+            value for value in date_strings() if isinstance(value, str)
+        )
 
-                for review_date_item in review_dates_list:
-                    # Convert ISO string to datetime if needed
-                    if isinstance(review_date_item, str):
-                        try:
-                            review_date = datetime.fromisoformat(review_date_item)
-                            if review_date.tzinfo is None:
-                                review_date = timezone.make_aware(review_date)
-                        except:
-                            continue  # Skip invalid date strings
-                    elif isinstance(review_date_item, datetime):
-                        review_date = review_date_item
-                        if review_date.tzinfo is None:
-                            review_date = timezone.make_aware(review_date)
-                    else:
-                        continue  # Skip invalid types
+        def to_datetime(value):
+            """Return ``value`` as an aware datetime, or None if invalid."""
+            if isinstance(value, str):
+                if value not in parsed_dates:
+                    # Read from a JSON-encoded string, so not parsed above
+                    parsed_dates.update(_parse_datetimes([value]))
+                return parsed_dates[value]
+            if isinstance(value, datetime):
+                return aware(value)
+            return None
 
-                    if start_date <= review_date <= end_date:
-                        upcoming_reviews.append(
+        for scholarship in donor_scholarships:
+            if with_key_dates:
+                # Track deadlines
+                if scholarship.deadline:
+                    deadline = aware(scholarship.deadline)
+                    if start_date <= deadline <= end_date:
+                        upcoming_deadlines.append(
                             {
                                 "scholarship": scholarship.name,
-                                "date": review_date,
-                                "type": "Performance Review",
+                                "deadline": deadline,
+                                "type": "Application Deadline",
                             }
                         )
 
-            # Track reporting requirements (stored as ISO strings in JSON)
-            if scholarship.reporting_schedule:
-                # Handle case where reporting_schedule might be a JSON string instead of a dict
-                reporting_schedule_dict = scholarship.reporting_schedule
-                if isinstance(reporting_schedule_dict, str):
-                    try:
-                        import json
+                # Track review dates (stored as ISO strings in JSON)
+                if scholarship.review_dates:
+                    review_dates_list = _decode_json_string(
+                        scholarship.review_dates, []
+                    )
 
-                        reporting_schedule_dict = json.loads(reporting_schedule_dict)
-                    except:
-                        reporting_schedule_dict = {}
+                    for review_date_item in review_dates_list:
+                        review_date = to_datetime(review_date_item)
+                        if review_date is None:
+                            continue  # Skip invalid dates and types
 
-                if isinstance(reporting_schedule_dict, dict):
-                    for (
-                        report_type,
-                        report_date_item,
-                    ) in reporting_schedule_dict.items():
-                        # Convert ISO string to datetime if needed
-                        if isinstance(report_date_item, str):
-                            try:
-                                report_date = datetime.fromisoformat(report_date_item)
-                                if report_date.tzinfo is None:
-                                    report_date = timezone.make_aware(report_date)
-                            except:
-                                continue  # Skip invalid date strings
-                        elif isinstance(report_date_item, datetime):
-                            report_date = report_date_item
-                            if report_date.tzinfo is None:
-                                report_date = timezone.make_aware(report_date)
-                        else:
-                            continue  # Skip invalid types
-
-                        if start_date <= report_date <= end_date:
-                            reporting_requirements.append(
+                        if start_date <= review_date <= end_date:
+                            upcoming_reviews.append(
                                 {
                                     "scholarship": scholarship.name,
-                                    "date": report_date,
-                                    "type": report_type,
+                                    "date": review_date,
+                                    "type": "Performance Review",
                                 }
                             )
 
-            # Process awards - query ScholarshipAward model by scholarship name
-            scholarship_awards = ScholarshipAward.objects.filter(
-                scholarship_name=scholarship.name
-            )
+                # Track reporting requirements (stored as ISO strings in JSON)
+                if scholarship.reporting_schedule:
+                    reporting_schedule_dict = _decode_json_string(
+                        scholarship.reporting_schedule, {}
+                    )
+
+                    if isinstance(reporting_schedule_dict, dict):
+                        for (
+                            report_type,
+                            report_date_item,
+                        ) in reporting_schedule_dict.items():
+                            report_date = to_datetime(report_date_item)
+                            if report_date is None:
+                                continue  # Skip invalid dates and types
+
+                            if start_date <= report_date <= end_date:
+                                reporting_requirements.append(
+                                    {
+                                        "scholarship": scholarship.name,
+                                        "date": report_date,
+                                        "type": report_type,
+                                    }
+                                )
 
-            for award in scholarship_awards:
+            # Process awards for this scholarship
+            for award in awards_by_scholarship.get(scholarship.name, ()):
                 # Skip awards for "Test User" applicants
                 if award.applicant and (
                     "test user" in award.applicant.name.lower()
@@ -400,49 +1233,27 @@ END OF LOG
                     except Exception:
                         award_date = pd.to_datetime(award_date).to_pydatetime()
                 # Make timezone-aware when needed
-                if award_date and getattr(award_date, "tzinfo", None) is None:
-                    try:
-                        award_date = timezone.make_aware(award_date)
-                    except Exception:
-                        pass
+                if award_date:
+                    award_date = aware(award_date)
 
                 # Normalize disbursement dates: convert ISO strings to datetimes
-                raw_disbursements = award.disbursement_dates or []
-
-                # Handle case where disbursement_dates might be a JSON string instead of a list
-                if isinstance(raw_disbursements, str):
-                    try:
-                        import json
-
-                        raw_disbursements = json.loads(raw_disbursements)
-                    except:
-                        raw_disbursements = []
+                raw_disbursements = _decode_json_string(
+                    award.disbursement_dates or [], []
+                )
 
                 disbursement_dates = []
                 for d in raw_disbursements:
-                    if isinstance(d, str):
+                    dt = to_datetime(d)
+                    if dt is None and isinstance(d, str):
+                        # Not ISO 8601; let pandas infer the format
                         try:
-                            dt = datetime.fromisoformat(d)
+                            dt = pd.to_datetime(d).to_pydatetime()
                         except Exception:
-                            try:
-                                dt = pd.to_datetime(d).to_pydatetime()
-                            except:
-                                continue  # Skip invalid date strings
-                        # Ensure timezone-aware
-                        if getattr(dt, "tzinfo", None) is None:
-                            try:
-                                dt = timezone.make_aware(dt)
-                            except Exception:
-                                pass
-                        disbursement_dates.append(dt)
-                    elif isinstance(d, datetime):
-                        dt = d
-                        # Ensure timezone-aware
-                        if getattr(dt, "tzinfo", None) is None:
-                            try:
-                                dt = timezone.make_aware(dt)
-                            except Exception:
-                                pass
+                            continue  # Skip invalid date strings
+                        if pd.isna(dt):
+                            continue
+                        dt = aware(dt)
+                    if dt is not None:
                         disbursement_dates.append(dt)
                     # Skip invalid types
 
@@ -455,25 +1266,25 @@ END OF LOG
 
                 total_awarded += amount
 
-                # Calculate disbursed amount safely
-                disbursed = 0.0
-                if disbursement_dates:
-                    valid_dates = [d for d in disbursement_dates if d <= end_date]
-                    if valid_dates:
-                        disbursed = sum(
-                            amount / len(disbursement_dates) for _ in valid_dates
-                        )
+                # Count disbursements made by end_date and find the next one
+                # in a single pass
+                paid_count = 0
+                next_disb = None
+                for d in disbursement_dates:
+                    if d <= end_date:
+                        paid_count += 1
+                    elif next_disb is None or d < next_disb:
+                        next_disb = d
+
+                # Each disbursement is an equal share of the award
+                disbursed = (
+                    amount * paid_count / len(disbursement_dates) if paid_count else 0.0
+                )
                 total_disbursed += disbursed
 
                 # Get recipient name from applicant relationship
                 recipient = award.applicant.name if award.applicant else "Unknown"
 
-                # Determine next disbursement
-                next_disb = None
-                future_dates = [d for d in disbursement_dates if d > end_date]
-                if future_dates:
-                    next_disb = min(future_dates)
-
                 award_summary = {
                     "scholarship": scholarship.name,
                     "recipient": recipient,
@@ -483,7 +1294,9 @@ END OF LOG
                     "status": award.status,
                     "requirements_met": award.requirements_met or [],
                     "requirements_pending": award.requirements_pending or [],
-                    "performance_metrics": award.performance_metrics or {},
+                    "performance_metrics": (
+                        (award.performance_metrics or {}) if with_metrics else {}
+                    ),
                     "next_disbursement": next_disb,
                 }
 
@@ -496,8 +1309,45 @@ END OF LOG
         upcoming_deadlines.sort(key=lambda x: x["deadline"])
         upcoming_reviews.sort(key=lambda x: x["date"])
         reporting_requirements.sort(key=lambda x: x["date"])
-        active_awards.sort(key=lambda x: x["next_disbursement"] or end_date)
-        completed_awards.sort(key=lambda x: x["award_date"], reverse=True)
+        active_count = len(active_awards)
+        completed_count = len(completed_awards)
+
+        def next_disbursement(award):
+            return award["next_disbursement"] or end_date
+
+        if top_n is None:
+            active_awards.sort(key=next_disbursement)
+            completed_awards.sort(key=itemgetter("award_date"), reverse=True)
+        else:
+            # Partial sorts: only the first top_n awards are ordered
+            active_awards = heapq.nsmallest(
+                top_n, active_awards, key=next_disbursement
+            )
+            completed_awards = heapq.nlargest(
+                top_n, completed_awards, key=itemgetter("award_date")
+            )
+
+        # Every key date in one chronological list, merged from the sorted
+        # per-category lists rather than concatenated and sorted again
+        all_key_dates = list(
+            heapq.merge(
+                (
+                    {
+                        "category": "Application Deadline",
+                        "scholarship": d["scholarship"],
+                        "date": d["deadline"],
+                        "type": d["type"],
+                    }
+                    for d in upcoming_deadlines
+                ),
+                ({"category": "Performance Review", **d} for d in upcoming_reviews),
+                (
+                    {"category": "Reporting Requirement", **d}
+                    for d in reporting_requirements
+                ),
+                key=itemgetter("date"),
+            )
+        )
 
         return {
             "donor_name": donor_name,
@@ -506,13 +1356,14 @@ END OF LOG
                 "total_scholarships": len(donor_scholarships),
                 "total_awarded": total_awarded,
                 "total_disbursed": total_disbursed,
-                "active_awards": len(active_awards),
-                "completed_awards": len(completed_awards),
+                "active_awards": active_count,
+                "completed_awards": completed_count,
             },
             "key_dates": {
                 "upcoming_deadlines": upcoming_deadlines,
                 "upcoming_reviews": upcoming_reviews,
                 "reporting_requirements": reporting_requirements,
+                "all": all_key_dates,
             },
             "awards": {"active": active_awards, "completed": completed_awards},
             "scholarships": [
@@ -527,7 +1378,7 @@ END OF LOG
                     "eligibility_criteria": s.eligibility_criteria,
                     "disbursement_requirements": s.disbursement_requirements,
                 }
-                for s in donor_scholarships
+                for s in (donor_scholarships if wanted("scholarships") else ())
             ],
         }
 
@@ -549,21 +1400,22 @@ END OF LOG
         Returns:
             str: Path to the generated Excel file
         """
-        report_data = self.generate_donor_report(donor_name, start_date, end_date)
+        from openpyxl import Workbook
+
+        report_data = self.generate_donor_report(
+            donor_name, start_date, end_date, fields=_DONOR_EXPORT_FIELDS
+        )
 
-        wb = Workbook()
+        wb = Workbook(write_only=True)
 
         # Summary Sheet
-        ws_summary = wb.active
-        ws_summary.title = "Summary"
-        ws_summary["A1"] = f"Donor Report: {donor_name}"
-        ws_summary["A2"] = "Report Period:"
-        ws_summary["B2"] = (
-            f"{report_data['report_period']['start'].strftime('%Y-%m-%d')} to {report_data['report_period']['end'].strftime('%Y-%m-%d')}"
-        )
+        ws_summary = wb.create_sheet("Summary")
 
         # Summary Statistics
-        summary_headers = ["Metric", "Value"]
+        summary_headers = [
+            _styled_cell(ws_summary, "Metric"),
+            _styled_cell(ws_summary, "Value"),
+        ]
         summary_data = [
             ["Total Scholarships", report_data["summary"]["total_scholarships"]],
             ["Total Awarded", f"${report_data['summary']['total_awarded']:,.2f}"],
@@ -572,75 +1424,53 @@ END OF LOG
             ["Completed Awards", report_data["summary"]["completed_awards"]],
         ]
 
-        for row_idx, row in enumerate([summary_headers] + summary_data, 4):
-            for col_idx, value in enumerate(row, 1):
-                cell = ws_summary.cell(row=row_idx, column=col_idx, value=value)
-                if row_idx == 4:  # Headers
-                    cell.font = Font(bold=True)
+        _append_sized_rows(
+            ws_summary,
+            [
+                [f"Donor Report: {donor_name}"],
+                [
+                    "Report Period:",
+                    f"{report_data['report_period']['start'].strftime('%Y-%m-%d')} to {report_data['report_period']['end'].strftime('%Y-%m-%d')}",
+                ],
+                [],
+                summary_headers,
+            ]
+            + summary_data,
+        )
 
         # Key Dates Sheet
         ws_dates = wb.create_sheet("Key Dates")
-        date_headers = ["Type", "Scholarship", "Date", "Details"]
+        date_headers = _header_row(ws_dates, ["Type", "Scholarship", "Date", "Details"])
 
-        # Combine all dates
-        all_dates = (
-            [
-                [
-                    "Application Deadline",
-                    d["scholarship"],
-                    d["deadline"].strftime("%Y-%m-%d")
-                    if hasattr(d["deadline"], "strftime")
-                    else str(d["deadline"]),
-                    d.get("type", "Application Deadline"),
-                ]
-                for d in report_data["key_dates"]["upcoming_deadlines"]
-            ]
-            + [
-                [
-                    "Performance Review",
-                    d["scholarship"],
-                    d["date"].strftime("%Y-%m-%d")
-                    if hasattr(d["date"], "strftime")
-                    else str(d["date"]),
-                    d.get("type", "Performance Review"),
-                ]
-                for d in report_data["key_dates"]["upcoming_reviews"]
-            ]
+        # Key dates arrive already merged into chronological order
+        _append_sized_rows(
+            ws_dates,
+            [date_headers]
             + [
                 [
-                    "Reporting Requirement",
+                    d["category"],
                     d["scholarship"],
-                    d["date"].strftime("%Y-%m-%d")
-                    if hasattr(d["date"], "strftime")
-                    else str(d["date"]),
-                    d.get("type", "Report Due"),
+                    d["date"].strftime("%Y-%m-%d"),
+                    d["type"],
                 ]
-                for d in report_data["key_dates"]["reporting_requirements"]
-            ]
+                for d in report_data["key_dates"]["all"]
+            ],
         )
 
-        for row_idx, row in enumerate(
-            [date_headers] + sorted(all_dates, key=lambda x: x[2]), 1
-        ):
-            for col_idx, value in enumerate(row, 1):
-                cell = ws_dates.cell(row=row_idx, column=col_idx, value=value)
-                if row_idx == 1:  # Headers
-                    cell.font = Font(bold=True)
-                    cell.fill = PatternFill(
-                        start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"
-                    )
-
         # Scholarship Details Sheet
         ws_scholarships = wb.create_sheet("Scholarship Details")
-        scholarship_headers = [
-            "Name",
-            "Amount",
-            "Frequency",
-            "Deadline",
-            "Description",
-            "Eligibility Criteria",
-            "Requirements",
-        ]
+        scholarship_headers = _header_row(
+            ws_scholarships,
+            [
+                "Name",
+                "Amount",
+                "Frequency",
+                "Deadline",
+                "Description",
+                "Eligibility Criteria",
+                "Requirements",
+            ],
+        )
 
         scholarship_data = []
         for s in report_data["scholarships"]:
@@ -662,65 +1492,31 @@ END OF LOG
                 ]
             )
 
-        for row_idx, row in enumerate([scholarship_headers] + scholarship_data, 1):
-            for col_idx, value in enumerate(row, 1):
-                cell = ws_scholarships.cell(row=row_idx, column=col_idx, value=value)
-                if row_idx == 1:  # Headers
-                    cell.font = Font(bold=True)
-                    cell.fill = PatternFill(
-                        start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"
-                    )
+        _append_sized_rows(ws_scholarships, [scholarship_headers] + scholarship_data)
 
         # Active Awards Sheet
         ws_active = wb.create_sheet("Active Awards")
         award_headers = [
-            "Scholarship",
-            "Recipient",
-            "Amount",
-            "Disbursed",
-            "Status",
-            "Requirements Met",
-            "Requirements Pending",
-            "Next Disbursement",
+            _styled_cell(ws_active, header)
+            for header in [
+                "Scholarship",
+                "Recipient",
+                "Amount",
+                "Disbursed",
+                "Status",
+                "Requirements Met",
+                "Requirements Pending",
+                "Next Disbursement",
+            ]
         ]
 
         award_data = [
-            [
-                award["scholarship"],
-                award["recipient"],
-                f"${award['amount']:,.2f}",
-                f"${award['disbursed']:,.2f}",
-                award["status"],
-                "; ".join(award["requirements_met"]),
-                "; ".join(award["requirements_pending"]),
-                award["next_disbursement"].strftime("%Y-%m-%d")
-                if award["next_disbursement"]
-                else "N/A",
-            ]
-            for award in report_data["awards"]["active"]
+            _donor_award_row(award) for award in report_data["awards"]["active"]
         ]
 
-        for row_idx, row in enumerate([award_headers] + award_data, 1):
-            for col_idx, value in enumerate(row, 1):
-                cell = ws_active.cell(row=row_idx, column=col_idx, value=value)
-                if row_idx == 1:  # Headers
-                    cell.font = Font(bold=True)
-
-        # Adjust column widths
-        for ws in [ws_summary, ws_dates, ws_scholarships, ws_active]:
-            for col in ws.columns:
-                max_length = 0
-                for cell in col:
-                    try:
-                        max_length = max(max_length, len(str(cell.value)))
-                    except:
-                        pass
-                ws.column_dimensions[chr(64 + col[0].column)].width = min(
-                    max_length + 2, 50
-                )
+        _append_sized_rows(ws_active, [award_headers] + award_data)
 
-        wb.save(output_path)
-        return output_path
+        return _save_workbook(wb, output_path)
 
     def export_donor_report_to_csv(
         self,
@@ -740,168 +1536,144 @@ END OF LOG
         Returns:
             str: Path to the generated CSV file
         """
-        report_data = self.generate_donor_report(donor_name, start_date, end_date)
-
-        with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.writer(csvfile)
+        report_data = self.generate_donor_report(
+            donor_name, start_date, end_date, fields=_DONOR_EXPORT_FIELDS
+        )
 
-            # Header
-            writer.writerow([f"Donor Report: {donor_name}"])
-            writer.writerow(
-                [
-                    "Report Period:",
-                    f"{report_data['report_period']['start'].strftime('%Y-%m-%d')} to "
-                    f"{report_data['report_period']['end'].strftime('%Y-%m-%d')}",
-                ]
-            )
-            writer.writerow([])
+        with open(
+            output_path,
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=_EXPORT_BUFFER_SIZE,
+        ) as csvfile:
+            csv.writer(csvfile).writerows(self._donor_report_csv_rows(report_data))
 
-            # Summary Section
-            writer.writerow(["Summary Statistics"])
-            writer.writerow(["Metric", "Value"])
-            writer.writerow(
-                ["Total Scholarships", report_data["summary"]["total_scholarships"]]
-            )
-            writer.writerow(
-                ["Total Awarded", f"${report_data['summary']['total_awarded']:,.2f}"]
-            )
-            writer.writerow(
-                [
-                    "Total Disbursed",
-                    f"${report_data['summary']['total_disbursed']:,.2f}",
-                ]
-            )
-            writer.writerow(["Active Awards", report_data["summary"]["active_awards"]])
-            writer.writerow(
-                ["Completed Awards", report_data["summary"]["completed_awards"]]
-            )
-            writer.writerow([])
+        return output_path
 
-            # Key Dates Section
-            writer.writerow(["Type", "Scholarship", "Date", "Details"])
+    @staticmethod
+    def _donor_report_csv_rows(report_data):
+        """Yield the CSV rows of a donor report."""
+        # Header
+        yield [f"Donor Report: {report_data['donor_name']}"]
+        yield [
+            "Report Period:",
+            f"{report_data['report_period']['start'].strftime('%Y-%m-%d')} to "
+            f"{report_data['report_period']['end'].strftime('%Y-%m-%d')}",
+        ]
+        yield []
 
-            for deadline in report_data["key_dates"]["upcoming_deadlines"]:
-                deadline_str = (
-                    deadline["deadline"].strftime("%Y-%m-%d")
-                    if hasattr(deadline["deadline"], "strftime")
-                    else str(deadline["deadline"])
-                )
-                writer.writerow(
-                    [
-                        "Application Deadline",
-                        deadline["scholarship"],
-                        deadline_str,
-                        deadline.get("type", "Application Deadline"),
-                    ]
-                )
+        # Summary Section
+        yield ["Summary Statistics"]
+        yield ["Metric", "Value"]
+        yield ["Total Scholarships", report_data["summary"]["total_scholarships"]]
+        yield ["Total Awarded", f"${report_data['summary']['total_awarded']:,.2f}"]
+        yield [
+            "Total Disbursed",
+            f"${report_data['summary']['total_disbursed']:,.2f}",
+        ]
+        yield ["Active Awards", report_data["summary"]["active_awards"]]
+        yield ["Completed Awards", report_data["summary"]["completed_awards"]]
+        yield []
 
-            for review in report_data["key_dates"]["upcoming_reviews"]:
-                review_str = (
-                    review["date"].strftime("%Y-%m-%d")
-                    if hasattr(review["date"], "strftime")
-                    else str(review["date"])
-                )
-                writer.writerow(
-                    [
-                        "Performance Review",
-                        review["scholarship"],
-                        review_str,
-                        review.get("type", "Performance Review"),
-                    ]
-                )
+        # Key Dates Section
+        yield ["Type", "Scholarship", "Date", "Details"]
 
-            for report in report_data["key_dates"]["reporting_requirements"]:
-                report_str = (
-                    report["date"].strftime("%Y-%m-%d")
-                    if hasattr(report["date"], "strftime")
-                    else str(report["date"])
-                )
-                writer.writerow(
-                    [
-                        "Reporting Requirement",
-                        report["scholarship"],
-                        report_str,
-                        report.get("type", "Report Due"),
-                    ]
-                )
-            writer.writerow([])
+        for deadline in report_data["key_dates"]["upcoming_deadlines"]:
+            deadline_str = (
+                deadline["deadline"].strftime("%Y-%m-%d")
+                if hasattr(deadline["deadline"], "strftime")
+                else str(deadline["deadline"])
+            )
+            yield [
+                "Application Deadline",
+                deadline["scholarship"],
+                deadline_str,
+                deadline.get("type", "Application Deadline"),
+            ]
 
-            # Scholarship Details Section
-            writer.writerow(["Scholarship Details"])
-            writer.writerow(
-                [
-                    "Name",
-                    "Amount",
-                    "Frequency",
-                    "Deadline",
-                    "Description",
-                    "Eligibility Criteria",
-                    "Requirements",
-                ]
+        for review in report_data["key_dates"]["upcoming_reviews"]:
+            review_str = (
+                review["date"].strftime("%Y-%m-%d")
+                if hasattr(review["date"], "strftime")
+                else str(review["date"])
             )
+            yield [
+                "Performance Review",
+                review["scholarship"],
+                review_str,
+                review.get("type", "Performance Review"),
+            ]
 
-            for s in report_data["scholarships"]:
-                deadline_str = (
-                    s["deadline"].strftime("%Y-%m-%d")
-                    if s.get("deadline") and hasattr(s["deadline"], "strftime")
-                    else str(s.get("deadline", "N/A"))
-                )
-                eligibility = (
-                    "; ".join(s.get("eligibility_criteria", []))
-                    if isinstance(s.get("eligibility_criteria"), list)
-                    else str(s.get("eligibility_criteria", "N/A"))
-                )
-                requirements = (
-                    "; ".join(s.get("disbursement_requirements", []))
-                    if isinstance(s.get("disbursement_requirements"), list)
-                    else str(s.get("disbursement_requirements", "N/A"))
-                )
+        for report in report_data["key_dates"]["reporting_requirements"]:
+            report_str = (
+                report["date"].strftime("%Y-%m-%d")
+                if hasattr(report["date"], "strftime")
+                else str(report["date"])
+            )
+            yield [
+                "Reporting Requirement",
+                report["scholarship"],
+                report_str,
+                report.get("type", "Report Due"),
+            ]
+        yield []
 
-                writer.writerow(
-                    [
-                        s["name"],
-                        f"${s['amount']:,.2f}",
-                        s["frequency"],
-                        deadline_str,
-                        s["description"],
-                        eligibility,
-                        requirements,
-                    ]
-                )
-            writer.writerow([])
+        # Scholarship Details Section
+        yield ["Scholarship Details"]
+        yield [
+            "Name",
+            "Amount",
+            "Frequency",
+            "Deadline",
+            "Description",
+            "Eligibility Criteria",
+            "Requirements",
+        ]
 
-            # Active Awards Section
-            writer.writerow(["Active Awards"])
-            writer.writerow(
-                [
-                    "Scholarship",
-                    "Recipient",
-                    "Amount",
-                    "Disbursed",
-                    "Status",
-                    "Requirements Met",
-                    "Requirements Pending",
-                    "Next Disbursement",
-                ]
+        for s in report_data["scholarships"]:
+            deadline_str = (
+                s["deadline"].strftime("%Y-%m-%d")
+                if s.get("deadline") and hasattr(s["deadline"], "strftime")
+                else str(s.get("deadline", "N/A"))
+            )
+            eligibility = (
+                "; ".join(s.get("eligibility_criteria", []))
+                if isinstance(s.get("eligibility_criteria"), list)
+                else str(s.get("eligibility_criteria", "N/A"))
+            )
+            requirements = (
+                "; ".join(s.get("disbursement_requirements", []))
+                if isinstance(s.get("disbursement_requirements"), list)
+                else str(s.get("disbursement_requirements", "N/A"))
             )
 
-            for award in report_data["awards"]["active"]:
-                writer.writerow(
-                    [
-                        award["scholarship"],
-                        award["recipient"],
-                        f"${award['amount']:,.2f}",
-                        f"${award['disbursed']:,.2f}",
-                        award["status"],
-                        "; ".join(award["requirements_met"]),
-                        "; ".join(award["requirements_pending"]),
-                        award["next_disbursement"].strftime("%Y-%m-%d")
-                        if award["next_disbursement"]
-                        else "N/A",
-                    ]
-                )
+            yield [
+                s["name"],
+                f"${s['amount']:,.2f}",
+                s["frequency"],
+                deadline_str,
+                s["description"],
+                eligibility,
+                requirements,
+            ]
+        yield []
 
-        return output_path
+        # Active Awards Section
+        yield ["Active Awards"]
+        yield [
+            "Scholarship",
+            "Recipient",
+            "Amount",
+            "Disbursed",
+            "Status",
+            "Requirements Met",
+            "Requirements Pending",
+            "Next Disbursement",
+        ]
+
+        for award in report_data["awards"]["active"]:
+            yield _donor_award_row(award)
 
     def export_donor_report_to_pdf(
         self,
@@ -921,11 +1693,30 @@ END OF LOG
         Returns:
             str: Path to the generated PDF file
         """
-        report_data = self.generate_donor_report(donor_name, start_date, end_date)
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import (
+            SimpleDocTemplate,
+            Paragraph,
+            Spacer,
+            Table,
+            TableStyle,
+        )
+        from .pdf_rendering import bullet_list, sample_styles
+
+        report_data = self.generate_donor_report(
+            donor_name, start_date, end_date, fields=_DONOR_EXPORT_FIELDS
+        )
 
         doc = SimpleDocTemplate(output_path, pagesize=letter)
         story = []
-        styles = getSampleStyleSheet()
+        styles = sample_styles()
+        normal, heading3 = styles["Normal"], styles["Heading3"]
+
+        def date_str(value):
+            if hasattr(value, "strftime"):
+                return value.strftime("%Y-%m-%d")
+            return str(value)
 
         # Title
         story.append(Paragraph(f"Donor Report: {donor_name}", styles["Heading1"]))
@@ -933,7 +1724,7 @@ END OF LOG
             Paragraph(
                 f"Report Period: {report_data['report_period']['start'].strftime('%Y-%m-%d')} to "
                 f"{report_data['report_period']['end'].strftime('%Y-%m-%d')}",
-                styles["Normal"],
+                normal,
             )
         )
 
@@ -958,70 +1749,51 @@ END OF LOG
             )
         )
         story.append(summary_table)
-        story.append(Paragraph("<br/>", styles["Normal"]))
+        story.append(Spacer(1, 12))
 
         # Key Dates Section
         if report_data["key_dates"]["upcoming_deadlines"]:
-            story.append(
-                Paragraph("Upcoming Application Deadlines:", styles["Heading3"])
-            )
-            for deadline in report_data["key_dates"]["upcoming_deadlines"]:
-                deadline_str = (
-                    deadline["deadline"].strftime("%Y-%m-%d")
-                    if hasattr(deadline["deadline"], "strftime")
-                    else str(deadline["deadline"])
-                )
-                story.append(
-                    Paragraph(
-                        f"• {deadline['scholarship']}: {deadline_str} ({deadline.get('type', 'Application Deadline')})",
-                        styles["Normal"],
-                    )
+            story.append(Paragraph("Upcoming Application Deadlines:", heading3))
+            story.extend(
+                Paragraph(
+                    f"• {deadline['scholarship']}: {date_str(deadline['deadline'])} ({deadline.get('type', 'Application Deadline')})",
+                    normal,
                 )
-            story.append(Paragraph("<br/>", styles["Normal"]))
+                for deadline in report_data["key_dates"]["upcoming_deadlines"]
+            )
+            story.append(Spacer(1, 12))
 
         if report_data["key_dates"]["upcoming_reviews"]:
-            story.append(Paragraph("Upcoming Performance Reviews:", styles["Heading3"]))
-            for review in report_data["key_dates"]["upcoming_reviews"]:
-                review_date_str = (
-                    review["date"].strftime("%Y-%m-%d")
-                    if hasattr(review["date"], "strftime")
-                    else str(review["date"])
-                )
-                story.append(
-                    Paragraph(
-                        f"• {review['scholarship']}: {review_date_str} ({review.get('type', 'Performance Review')})",
-                        styles["Normal"],
-                    )
+            story.append(Paragraph("Upcoming Performance Reviews:", heading3))
+            story.extend(
+                Paragraph(
+                    f"• {review['scholarship']}: {date_str(review['date'])} ({review.get('type', 'Performance Review')})",
+                    normal,
                 )
-            story.append(Paragraph("<br/>", styles["Normal"]))
+                for review in report_data["key_dates"]["upcoming_reviews"]
+            )
+            story.append(Spacer(1, 12))
 
         if report_data["key_dates"]["reporting_requirements"]:
-            story.append(
-                Paragraph("Upcoming Reporting Requirements:", styles["Heading3"])
-            )
-            for requirement in report_data["key_dates"]["reporting_requirements"]:
-                req_date_str = (
-                    requirement["date"].strftime("%Y-%m-%d")
-                    if hasattr(requirement["date"], "strftime")
-                    else str(requirement["date"])
-                )
-                story.append(
-                    Paragraph(
-                        f"• {requirement['scholarship']}: {requirement['type']} - {req_date_str}",
-                        styles["Normal"],
-                    )
+            story.append(Paragraph("Upcoming Reporting Requirements:", heading3))
+            story.extend(
+                Paragraph(
+                    f"• {requirement['scholarship']}: {requirement['type']} - {date_str(requirement['date'])}",
+                    normal,
                 )
-            story.append(Paragraph("<br/>", styles["Normal"]))
+                for requirement in report_data["key_dates"]["reporting_requirements"]
+            )
+            story.append(Spacer(1, 12))
 
         # Scholarship Details Section with Key Dates
         if report_data["scholarships"]:
             story.append(Paragraph("Scholarship Details", styles["Heading2"]))
             for scholarship in report_data["scholarships"]:
-                story.append(Paragraph(f"{scholarship['name']}", styles["Heading3"]))
+                story.append(Paragraph(f"{scholarship['name']}", heading3))
                 story.append(
                     Paragraph(
                         f"Amount: ${scholarship['amount']:,.2f} ({scholarship['frequency']})",
-                        styles["Normal"],
+                        normal,
                     )
                 )
 
@@ -1032,61 +1804,50 @@ END OF LOG
                         else str(scholarship["deadline"])
                     )
                     story.append(
-                        Paragraph(
-                            f"Application Deadline: {deadline_str}", styles["Normal"]
-                        )
+                        Paragraph(f"Application Deadline: {deadline_str}", normal)
                     )
 
                 story.append(
-                    Paragraph(
-                        f"Description: {scholarship['description']}", styles["Normal"]
-                    )
+                    Paragraph(f"Description: {scholarship['description']}", normal)
                 )
 
                 # Show eligibility criteria
                 if scholarship.get("eligibility_criteria"):
                     story.append(Paragraph("Eligibility Criteria:", styles["Heading4"]))
-                    for criteria in scholarship["eligibility_criteria"]:
-                        story.append(Paragraph(f"• {criteria}", styles["Normal"]))
+                    story.append(
+                        bullet_list(scholarship["eligibility_criteria"], normal)
+                    )
 
                 # Show disbursement requirements
                 if scholarship.get("disbursement_requirements"):
                     story.append(
                         Paragraph("Disbursement Requirements:", styles["Heading4"])
                     )
-                    for req in scholarship["disbursement_requirements"]:
-                        story.append(Paragraph(f"• {req}", styles["Normal"]))
+                    story.append(
+                        bullet_list(scholarship["disbursement_requirements"], normal)
+                    )
 
-                story.append(Paragraph("<br/>", styles["Normal"]))
+                story.append(Spacer(1, 12))
 
         # Active Awards Section
         story.append(Paragraph("Active Awards", styles["Heading2"]))
         for award in report_data["awards"]["active"]:
-            story.append(
-                Paragraph(f"Scholarship: {award['scholarship']}", styles["Heading3"])
-            )
-            story.append(
-                Paragraph(f"Recipient: {award['recipient']}", styles["Normal"])
-            )
-            story.append(
-                Paragraph(f"Amount: ${award['amount']:,.2f}", styles["Normal"])
-            )
-            story.append(
-                Paragraph(f"Disbursed: ${award['disbursed']:,.2f}", styles["Normal"])
-            )
+            story.append(Paragraph(f"Scholarship: {award['scholarship']}", heading3))
+            lines = [
+                f"Recipient: {award['recipient']}",
+                f"Amount: ${award['amount']:,.2f}",
+                f"Disbursed: ${award['disbursed']:,.2f}",
+            ]
             if award["next_disbursement"]:
-                story.append(
-                    Paragraph(
-                        f"Next Disbursement: {award['next_disbursement'].strftime('%Y-%m-%d')}",
-                        styles["Normal"],
-                    )
+                lines.append(
+                    f"Next Disbursement: {award['next_disbursement'].strftime('%Y-%m-%d')}"
                 )
-            story.append(Paragraph("Requirements Status:", styles["Normal"]))
-            for req in award["requirements_met"]:
-                story.append(Paragraph(f"✓ {req}", styles["Normal"]))
-            for req in award["requirements_pending"]:
-                story.append(Paragraph(f"□ {req}", styles["Normal"]))
-            story.append(Paragraph("<br/>", styles["Normal"]))
+            lines.append("Requirements Status:")
+            lines.extend(f"✓ {req}" for req in award["requirements_met"])
+            lines.extend(f"□ {req}" for req in award["requirements_pending"])
+            # One paragraph per award rather than one per line
+            story.append(Paragraph("<br/>".join(lines), normal))
+            story.append(Spacer(1, 12))
 
         doc.build(story)
         return output_path
@@ -1094,6 +1855,45 @@ END OF LOG
     def add_scholarship(self, scholarship: Scholarship):
         """Add a new scholarship to the system."""
         self.scholarships.append(scholarship)
+        self._by_donor[scholarship.donor_info.get("name")].append(scholarship)
+        self._report_version += 1
+        with self._prescreen_lock:
+            self._prescreen_cache.clear()
+
+    def _active_awards_by_applicant(
+        self, applicant_id: Optional[int] = None
+    ) -> Dict[int, List[ScholarshipAward]]:
+        """Return active awards keyed by applicant id.
+
+        Awards are loaded with a single query and deduplicated per scholarship,
+        keeping the most recent award. Only the fields the applicant report
+        reads are loaded, and rows are streamed rather than cached on the
+        queryset. The index is built per report call and not kept on the
+        engine, which may be shared across requests while awards keep
+        changing in the database.
+
+        Args:
+            applicant_id: When given, only this applicant's awards are queried
+
+        Returns:
+            dict: Applicant primary key -> list of ScholarshipAward, ordered by
+                scholarship name
+        """
+        awards = ScholarshipAward.objects.filter(status="active")
+        if applicant_id is not None:
+            awards = awards.filter(applicant_id=applicant_id)
+
+        awards = awards.only(*_APPLICANT_REPORT_AWARD_FIELDS).order_by(
+            "applicant_id", "scholarship_name", "-award_date", "-id"
+        )
+
+        by_applicant = defaultdict(dict)
+        for award in awards.iterator(chunk_size=500):
+            by_applicant[award.applicant_id].setdefault(award.scholarship_name, award)
+        return {
+            applicant_pk: list(awards_by_name.values())
+            for applicant_pk, awards_by_name in by_applicant.items()
+        }
 
     def get_scholarships_data(self) -> List[Scholarship]:
         """Unified source of scholarships for reports and analytics.
@@ -1127,13 +1927,26 @@ END OF LOG
                 - Requirements status
                 - Summary statistics
         """
-        # Query scholarship awards
+        # Query scholarship awards, joined to their recipients and limited
+        # to the columns the report reads
         if scholarship_name:
             awards_queryset = ScholarshipAward.objects.filter(
                 scholarship_name=scholarship_name, status="active"
             )
         else:
             awards_queryset = ScholarshipAward.objects.filter(status="active")
+        awards_queryset = awards_queryset.select_related("applicant").only(
+            "scholarship_name",
+            "award_date",
+            "award_amount",
+            "disbursement_dates",
+            "requirements_met",
+            "requirements_pending",
+            "status",
+            "notes",
+            "applicant__name",
+            "applicant__student_id",
+        )
 
         # Build disbursement details for each award
         disbursements = []
@@ -1247,13 +2060,29 @@ END OF LOG
 
     # Function to generate pre-screening report. Meets requirement for pre-screening applicants, SFWE504_3-LLR-7, SFWE504_3-LLR-25, SFWE504_3-LLR-26.
     def generate_prescreening_report(
-        self, applicants: List[Applicant], scholarship_id: Optional[str] = None
+        self,
+        applicants: List[Applicant],
+        scholarship_id: Optional[str] = None,
+        matches_only: bool = False,
+        top_k: Optional[int] = None,
+        parallel: bool = False,
     ) -> Dict[str, Any]:
         """Generate a pre-screening report identifying applicants who meet scholarship eligibility criteria.
 
+        The report is memoized and shared between calls for the same
+        scholarship and unchanged applicants and award decisions.
+
         Args:
             applicants (List[Applicant]): List of applicants to evaluate
             scholarship_id (str, optional): Specific scholarship to evaluate for. If None, evaluate all scholarships.
+            matches_only (bool): Only build eligibility details and
+                applicant analysis for applicants who meet every criterion.
+                Matches and summary statistics are unaffected. Defaults to False.
+            top_k (int, optional): Only list the top_k highest scoring
+                qualified applicants per scholarship. Defaults to all of them.
+            parallel (bool): Evaluate scholarships in worker processes. Worth
+                it for many applicants and scholarships; the report is the
+                same either way. Defaults to False.
 
         Returns:
             dict: Pre-screening report containing:
@@ -1265,6 +2094,64 @@ END OF LOG
                 - Scholarship-specific requirements status
                 - Comprehensive applicant qualifications
         """
+        applicants = list(applicants)
+        key = (
+            scholarship_id,
+            matches_only,
+            top_k,
+            _table_state(AwardDecision),
+            tuple(_prescreening_applicant_key(a) for a in applicants),
+        )
+        with self._prescreen_lock:
+            entry = self._prescreen_cache.get(key)
+        if entry is not None:
+            return entry[0]
+
+        report = self._build_prescreening_report(
+            applicants, scholarship_id, matches_only, top_k, parallel
+        )
+        with self._prescreen_lock:
+            if key not in self._prescreen_cache:
+                if len(self._prescreen_cache) >= _PRESCREENING_REPORT_CACHE_SIZE:
+                    # Evict the oldest entry
+                    self._prescreen_cache.pop(next(iter(self._prescreen_cache)))
+                self._prescreen_cache[key] = [report, None]
+            # Another thread may have built the same report meanwhile
+            return self._prescreen_cache[key][0]
+
+    def _prescreening_cells(self, report_data):
+        """Return the applicant cells of a pre-screening report, formatted once.
+
+        The cells are kept in the report's _prescreen_cache entry, so every
+        exporter reuses them and they are dropped along with the report.
+        Reports that are not memoized get freshly formatted cells.
+        """
+        with self._prescreen_lock:
+            entry = next(
+                (e for e in self._prescreen_cache.values() if e[0] is report_data),
+                None,
+            )
+            if entry is not None and entry[1] is not None:
+                return entry[1]
+        cells = _prescreening_applicant_cells(report_data)
+        if entry is not None:
+            with self._prescreen_lock:
+                entry[1] = cells
+        return cells
+
+    def _build_prescreening_report(
+        self,
+        applicants: List[Applicant],
+        scholarship_id: Optional[str],
+        matches_only: bool = False,
+        top_k: Optional[int] = None,
+        parallel: bool = False,
+    ) -> Dict[str, Any]:
+        """Build the report returned (and memoized) by generate_prescreening_report."""
+        import numpy as np
+
+        from .prescreening import ApplicantColumns, evaluate_scholarship, review_tally
+
         report = {
             "generated_date": datetime.now(),
             "scholarships_evaluated": 0,
@@ -1299,254 +2186,83 @@ END OF LOG
         ]
         report["scholarships_evaluated"] = len(scholarships_to_evaluate)
 
-        for scholarship in scholarships_to_evaluate:
-            scholarship_matches = []
-            qualified_applicants = []
-            qualification_scores = []  # Track qualification scores for distribution analysis
-
-            for applicant in applicants:
-                eligibility_results = []
-                meets_all_criteria = True
-                criteria_met_count = 0
-                total_criteria = len(scholarship.eligibility_criteria)
-
-                # Evaluate each eligibility criterion
-                for criterion in scholarship.eligibility_criteria:
-                    is_met = False
-                    reason = ""
-                    details = {}
-
-                    # Evaluate GPA requirements
-                    if "GPA" in criterion:
-                        required_gpa = float(criterion.split("+")[0].split()[-1])
-                        is_met = applicant.gpa >= required_gpa
-                        reason = f"GPA: {applicant.gpa:.2f} vs required {required_gpa}+"
-                        details = {
-                            "type": "gpa",
-                            "required": required_gpa,
-                            "actual": applicant.gpa,
-                            "difference": applicant.gpa - required_gpa,
-                        }
+        columns = ApplicantColumns(applicants)
+        applicant_analysis = defaultdict(list)
+
+        # Load every relevant award decision in one query, as plain rows
+        # rather than model instances, instead of one .get() per pair
+        award_decisions = defaultdict(dict)
+        for applicant_id, scholarship_name, decision, comments, decided_at in (
+            AwardDecision.objects.filter(
+                applicant_id__in=columns.pks,
+                scholarship_name__in=[s.name for s in scholarships_to_evaluate],
+            ).values_list(
+                "applicant_id",
+                "scholarship_name",
+                "decision",
+                "comments",
+                "decided_at",
+            )
+        ):
+            award_decisions[scholarship_name][applicant_id] = {
+                "decision": decision,
+                "comments": comments,
+                "decided_at": decided_at,
+            }
 
-                    # Evaluate major requirements
-                    elif "major" in criterion.lower():
-                        required_major = criterion.split("major")[0].strip()
-                        is_met = required_major.lower() in applicant.major.lower()
-                        reason = (
-                            f"Major: {applicant.major} vs required {required_major}"
-                        )
-                        details = {
-                            "type": "major",
-                            "required": required_major,
-                            "actual": applicant.major,
-                            "exact_match": required_major.lower()
-                            == applicant.major.lower(),
-                        }
+        # Scholarships are evaluated independently of each other, so with
+        # parallel=True they are fanned out over worker processes
+        evaluate = partial(
+            evaluate_scholarship,
+            columns=columns,
+            matches_only=matches_only,
+            top_k=top_k,
+        )
+        scholarship_data = [
+            {
+                "name": s.name,
+                "description": s.description,
+                "amount": s.amount,
+                "deadline": s.deadline,
+                "eligibility_criteria": s.eligibility_criteria,
+            }
+            for s in scholarships_to_evaluate
+        ]
+        decisions_by_scholarship = [
+            award_decisions.get(s.name, {}) for s in scholarships_to_evaluate
+        ]
+        if parallel and len(scholarship_data) > 1:
+            with ProcessPoolExecutor() as executor:
+                results = list(
+                    executor.map(evaluate, scholarship_data, decisions_by_scholarship)
+                )
+        else:
+            results = map(evaluate, scholarship_data, decisions_by_scholarship)
 
-                    # Evaluate enrollment status
-                    elif "enrollment" in criterion.lower():
-                        # This would need to be enhanced with actual enrollment status data
-                        is_met = True  # Assuming full-time enrollment for demo
-                        reason = "Enrollment status verified"
-                        details = {
-                            "type": "enrollment",
-                            "status": "full-time",
-                            "verified": True,
-                        }
+        for match_entry, qualified_applicants, analysis in results:
+            if match_entry is not None:
+                report["matches"].append(match_entry)
+                # Store qualified applicants for this scholarship
+                report["qualified_applicants"][
+                    match_entry["scholarship_name"]
+                ] = qualified_applicants
+            for student_id, entry in analysis:
+                applicant_analysis[student_id].append(entry)
 
-                    # Track met criteria
-                    if is_met:
-                        criteria_met_count += 1
+        report["applicant_analysis"] = dict(applicant_analysis)
 
-                    # Add detailed evaluation results
-                    eligibility_results.append(
-                        {
-                            "criterion": criterion,
-                            "is_met": is_met,
-                            "reason": reason,
-                            "details": details,
-                        }
-                    )
+        # Calculate comprehensive summary statistics, in a single pass over
+        # every match
+        scholarships_with_matches = len(report["matches"])
 
-                    if not is_met:
-                        meets_all_criteria = False
+        # Qualification distribution across all scholarships
+        all_qualification_scores = []
 
-                # Calculate qualification score
-                qualification_score = (criteria_met_count / total_criteria) * 100
-                qualification_scores.append(qualification_score)
-
-                # Calculate application completion status
-                required_components = {
-                    "personal_info": bool(applicant.name and applicant.student_id),
-                    "academic_info": bool(applicant.major and applicant.academic_level),
-                    "essays": bool(applicant.essays),
-                    "financial_info": bool(applicant.financial_info),
-                    "academic_records": bool(applicant.academic_history),
-                }
-                completion_percentage = (
-                    sum(1 for v in required_components.values() if v)
-                    / len(required_components)
-                ) * 100
-
-                # Determine application status
-                if completion_percentage == 100:
-                    application_status = "complete"
-                elif completion_percentage > 50:
-                    application_status = "in_progress"
-                else:
-                    application_status = "incomplete"
-
-                # Get review scores and comments if available
-                review_data = {
-                    "academic_review": {
-                        "score": None,
-                        "comments": [],
-                        "reviewer": None,
-                        "date": None,
-                    },
-                    "essay_review": {
-                        "scores": [],
-                        "comments": [],
-                        "reviewers": [],
-                        "dates": [],
-                    },
-                    "interview_notes": None,
-                    "committee_feedback": [],
-                }
-
-                # Process essay evaluations if available
-                if hasattr(applicant, "essays") and applicant.essays:
-                    for essay in applicant.essays:
-                        if hasattr(essay, "evaluation"):
-                            review_data["essay_review"]["scores"].append(
-                                essay.evaluation.get("score")
-                            )
-                            review_data["essay_review"]["comments"].append(
-                                essay.evaluation.get("feedback")
-                            )
-                            review_data["essay_review"]["reviewers"].append(
-                                essay.evaluation.get("reviewer")
-                            )
-                            review_data["essay_review"]["dates"].append(
-                                essay.evaluation.get("date")
-                            )
-
-                # Process interview notes if available
-                if hasattr(applicant, "interview_notes"):
-                    review_data["interview_notes"] = applicant.interview_notes
-
-                # Process committee feedback if available
-                if hasattr(applicant, "committee_feedback"):
-                    review_data["committee_feedback"] = applicant.committee_feedback
-
-                # Fetch simple award decision, if any
-                award_decision_data = None
-                try:
-                    ad = AwardDecision.objects.get(
-                        applicant=applicant, scholarship_name=scholarship.name
-                    )
-                    award_decision_data = {
-                        "decision": ad.decision,
-                        "comments": ad.comments,
-                        "decided_at": ad.decided_at,
-                    }
-                except AwardDecision.DoesNotExist:
-                    pass
-
-                # Prepare detailed applicant assessment
-                applicant_assessment = {
-                    "applicant": {
-                        "name": applicant.name,
-                        "student_id": applicant.student_id,
-                        "major": applicant.major,
-                        "gpa": applicant.gpa,
-                        "academic_level": applicant.academic_level,
-                    },
-                    "qualification_score": qualification_score,
-                    "eligibility_details": eligibility_results,
-                    "criteria_met_count": criteria_met_count,
-                    "total_criteria": total_criteria,
-                    "fully_qualified": meets_all_criteria,
-                    "application_status": {
-                        "status": application_status,
-                        "completion_percentage": completion_percentage,
-                        "missing_components": [
-                            component
-                            for component, completed in required_components.items()
-                            if not completed
-                        ],
-                    },
-                    "review_data": review_data,
-                    "award_decision": award_decision_data,
-                }
-
-                if meets_all_criteria:
-                    scholarship_matches.append(applicant_assessment)
-                    qualified_applicants.append(
-                        {
-                            "applicant": applicant_assessment["applicant"],
-                            "qualification_score": qualification_score,
-                        }
-                    )
-
-                # Store detailed analysis for each applicant
-                if applicant.student_id not in report["applicant_analysis"]:
-                    report["applicant_analysis"][applicant.student_id] = []
-                report["applicant_analysis"][applicant.student_id].append(
-                    {
-                        "scholarship_name": scholarship.name,
-                        "assessment": applicant_assessment,
-                    }
-                )
-
-            if scholarship_matches:
-                # Sort qualified applicants by qualification score
-                qualified_applicants.sort(
-                    key=lambda x: x["qualification_score"], reverse=True
-                )
-
-                report["matches"].append(
-                    {
-                        "scholarship_name": scholarship.name,
-                        "description": scholarship.description,
-                        "amount": scholarship.amount,
-                        "deadline": scholarship.deadline,
-                        "eligibility_criteria": scholarship.eligibility_criteria,
-                        "matches": scholarship_matches,
-                        "qualification_distribution": {
-                            "min_score": min(qualification_scores)
-                            if qualification_scores
-                            else 0,
-                            "max_score": max(qualification_scores)
-                            if qualification_scores
-                            else 0,
-                            "average_score": sum(qualification_scores)
-                            / len(qualification_scores)
-                            if qualification_scores
-                            else 0,
-                        },
-                    }
-                )
-
-                # Store qualified applicants for this scholarship
-                report["qualified_applicants"][scholarship.name] = qualified_applicants
-
-        # Calculate comprehensive summary statistics
-        total_matches = sum(len(s["matches"]) for s in report["matches"])
-        scholarships_with_matches = len(report["matches"])
-
-        # Calculate qualification distribution across all scholarships
-        all_qualification_scores = []
-        for scholarship in report["matches"]:
-            all_qualification_scores.extend(
-                [match["qualification_score"] for match in scholarship["matches"]]
-            )
-
-        # Collect review statistics
-        review_scores = []
-        essay_scores = []
-        total_reviews = 0
-        completed_reviews = 0
+        # Collect review statistics
+        review_scores = []
+        essay_scores = []
+        completed_reviews = 0
+        review_tallies = {}
 
         # Count application completion status
         application_completion = {"complete": 0, "in_progress": 0, "incomplete": 0}
@@ -1556,6 +2272,8 @@ END OF LOG
 
         for scholarship in report["matches"]:
             for match in scholarship["matches"]:
+                all_qualification_scores.append(match["qualification_score"])
+
                 # Track application status
                 status = match["application_status"]["status"]
                 application_completion[status] += 1
@@ -1564,21 +2282,22 @@ END OF LOG
                 if match.get("award_decision"):
                     award_decision_summary[match["award_decision"]["decision"]] += 1
 
-                # Track review completion
+                # Track review completion. Review records are shared by every
+                # match of an applicant (and by all unreviewed applicants), so
+                # each distinct record is tallied once.
                 review_data = match["review_data"]
-                if review_data["academic_review"]["score"] is not None:
-                    review_scores.append(review_data["academic_review"]["score"])
-                    completed_reviews += 1
-
-                for essay_score in review_data["essay_review"]["scores"]:
-                    if essay_score is not None:
-                        essay_scores.append(essay_score)
-                        completed_reviews += 1
-
-                total_reviews += 1  # Count expected reviews
-                if review_data["interview_notes"]:
-                    completed_reviews += 1
-                total_reviews += 1  # Count interview as expected
+                tally = review_tallies.get(id(review_data))
+                if tally is None:
+                    tally = review_tallies[id(review_data)] = review_tally(review_data)
+                academic_scores, valid_essay_scores, completed = tally
+                review_scores.extend(academic_scores)
+                essay_scores.extend(valid_essay_scores)
+                completed_reviews += completed
+
+        total_matches = len(all_qualification_scores)
+        # Two reviews are expected per match: the academic review and the
+        # interview
+        total_reviews = 2 * total_matches
 
         # Calculate average review scores
         avg_review_score = (
@@ -1589,6 +2308,12 @@ END OF LOG
             (completed_reviews / total_reviews) if total_reviews > 0 else 0
         )
 
+        # Bucket the 0-100 scores in one pass; the last bin is closed, so a
+        # perfect 100 lands in 90-100
+        below_60, in_60s, in_70s, in_80s, in_90s = np.histogram(
+            all_qualification_scores, bins=[0, 60, 70, 80, 90, 100]
+        )[0].tolist()
+
         report["summary"] = {
             "total_matches": total_matches,
             "match_rate": (total_matches / len(applicants)) if applicants else 0.0,
@@ -1617,13 +2342,11 @@ END OF LOG
                 if all_qualification_scores
                 else 0,
                 "score_ranges": {
-                    "90-100": len(
-                        [s for s in all_qualification_scores if 90 <= s <= 100]
-                    ),
-                    "80-89": len([s for s in all_qualification_scores if 80 <= s < 90]),
-                    "70-79": len([s for s in all_qualification_scores if 70 <= s < 80]),
-                    "60-69": len([s for s in all_qualification_scores if 60 <= s < 70]),
-                    "Below 60": len([s for s in all_qualification_scores if s < 60]),
+                    "90-100": in_90s,
+                    "80-89": in_80s,
+                    "70-79": in_70s,
+                    "60-69": in_60s,
+                    "Below 60": below_60,
                 },
             },
             "review_statistics": {
@@ -1645,11 +2368,22 @@ END OF LOG
         self, scholarship_name: str = None, output_path: str = None
     ) -> str:
         """Export disbursement report to PDF format."""
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import (
+            SimpleDocTemplate,
+            Paragraph,
+            Spacer,
+            Table,
+            TableStyle,
+        )
+        from .pdf_rendering import sample_styles
+
         report_data = self.generate_disbursement_report(scholarship_name)
 
         doc = SimpleDocTemplate(output_path, pagesize=letter)
         story = []
-        styles = getSampleStyleSheet()
+        styles = sample_styles()
 
         # Title
         story.append(
@@ -1664,7 +2398,7 @@ END OF LOG
                 styles["Normal"],
             )
         )
-        story.append(Paragraph("<br/>", styles["Normal"]))
+        story.append(Spacer(1, 12))
 
         # Summary Section
         story.append(Paragraph("Summary Statistics", styles["Heading2"]))
@@ -1689,7 +2423,7 @@ END OF LOG
             )
         )
         story.append(summary_table)
-        story.append(Paragraph("<br/>", styles["Normal"]))
+        story.append(Spacer(1, 12))
 
         # Disbursement Details
         story.append(Paragraph("Recipient Disbursement Details", styles["Heading2"]))
@@ -1730,7 +2464,7 @@ END OF LOG
                 )
             )
             story.append(detail_table)
-            story.append(Paragraph("<br/>", styles["Normal"]))
+            story.append(Spacer(1, 12))
 
             # Disbursement schedule
             schedule = disbursement["disbursement_schedule"]
@@ -1741,50 +2475,38 @@ END OF LOG
                 )
             )
 
-            if schedule["completed_payments"]:
-                story.append(Paragraph("Completed Payments:", styles["Normal"]))
-                for payment in schedule["completed_payments"]:
-                    payment_date = payment["date"]
-                    date_str = (
-                        payment_date.strftime("%Y-%m-%d")
-                        if hasattr(payment_date, "strftime")
-                        else str(payment_date)
-                    )
-                    story.append(
-                        Paragraph(
-                            f"✓ {date_str}: ${payment['amount']:,.2f}", styles["Normal"]
-                        )
-                    )
-
-            if schedule["upcoming_payments"]:
-                story.append(Paragraph("Upcoming Payments:", styles["Normal"]))
-                for payment in schedule["upcoming_payments"]:
+            # Each payment list and the requirements list is a single
+            # paragraph with one line per entry
+            for title, mark, payments in (
+                ("Completed Payments:", "✓", schedule["completed_payments"]),
+                ("Upcoming Payments:", "○", schedule["upcoming_payments"]),
+            ):
+                if not payments:
+                    continue
+                lines = [title]
+                for payment in payments:
                     payment_date = payment["date"]
                     date_str = (
                         payment_date.strftime("%Y-%m-%d")
                         if hasattr(payment_date, "strftime")
                         else str(payment_date)
                     )
-                    story.append(
-                        Paragraph(
-                            f"○ {date_str}: ${payment['amount']:,.2f}", styles["Normal"]
-                        )
-                    )
+                    lines.append(f"{mark} {date_str}: ${payment['amount']:,.2f}")
+                story.append(Paragraph("<br/>".join(lines), styles["Normal"]))
 
             # Requirements
             if disbursement["requirements_met"] or disbursement["requirements_pending"]:
                 story.append(Paragraph("Requirements:", styles["Heading4"]))
-                for req in disbursement["requirements_met"]:
-                    story.append(Paragraph(f"✓ {req}", styles["Normal"]))
-                for req in disbursement["requirements_pending"]:
-                    story.append(Paragraph(f"□ {req}", styles["Normal"]))
+                lines = [f"✓ {req}" for req in disbursement["requirements_met"]]
+                lines.extend(f"□ {req}" for req in disbursement["requirements_pending"])
+                story.append(Paragraph("<br/>".join(lines), styles["Normal"]))
 
             if disbursement.get("notes"):
                 story.append(
                     Paragraph(f"Notes: {disbursement['notes']}", styles["Normal"])
                 )
 
-            story.append(Paragraph("<br/>", styles["Normal"]))
+            story.append(Spacer(1, 12))
 
         doc.build(story)
         return output_path
@@ -1793,45 +2515,50 @@ END OF LOG
         self, scholarship_name: str = None, output_path: str = None
     ) -> str:
         """Export disbursement report to Excel format."""
+        from openpyxl import Workbook
+
         report_data = self.generate_disbursement_report(scholarship_name)
 
-        wb = Workbook()
+        wb = Workbook(write_only=True)
 
         # Summary Sheet
-        ws_summary = wb.active
-        ws_summary.title = "Summary"
-        ws_summary.cell(
-            row=1,
-            column=1,
-            value=f"Disbursement Report: {report_data['scholarship_name']}",
-        ).font = Font(bold=True, size=14)
-        ws_summary.cell(
-            row=2,
-            column=1,
-            value=f"Generated: {report_data['generated_date'].strftime('%Y-%m-%d %H:%M:%S')}",
-        )
-
-        ws_summary.cell(row=4, column=1, value="Total Recipients").font = Font(
-            bold=True
-        )
-        ws_summary.cell(row=4, column=2, value=report_data["total_recipients"])
-        ws_summary.cell(row=5, column=1, value="Total Awarded").font = Font(bold=True)
-        ws_summary.cell(
-            row=5, column=2, value=f"${report_data['summary']['total_awarded']:,.2f}"
-        )
-        ws_summary.cell(row=6, column=1, value="Total Disbursed").font = Font(bold=True)
-        ws_summary.cell(
-            row=6, column=2, value=f"${report_data['summary']['total_disbursed']:,.2f}"
-        )
-        ws_summary.cell(row=7, column=1, value="Total Pending").font = Font(bold=True)
-        ws_summary.cell(
-            row=7, column=2, value=f"${report_data['summary']['total_pending']:,.2f}"
-        )
-        ws_summary.cell(row=8, column=1, value="Completion Rate").font = Font(bold=True)
-        ws_summary.cell(
-            row=8,
-            column=2,
-            value=f"{report_data['summary']['disbursement_completion_rate']:.1f}%",
+        ws_summary = wb.create_sheet("Summary")
+        summary = report_data["summary"]
+        _append_sized_rows(
+            ws_summary,
+            [
+                [
+                    _styled_cell(
+                        ws_summary,
+                        f"Disbursement Report: {report_data['scholarship_name']}",
+                        _excel_styles()["title_font"],
+                    )
+                ],
+                [
+                    f"Generated: {report_data['generated_date'].strftime('%Y-%m-%d %H:%M:%S')}"
+                ],
+                [],
+                [
+                    _styled_cell(ws_summary, "Total Recipients"),
+                    report_data["total_recipients"],
+                ],
+                [
+                    _styled_cell(ws_summary, "Total Awarded"),
+                    f"${summary['total_awarded']:,.2f}",
+                ],
+                [
+                    _styled_cell(ws_summary, "Total Disbursed"),
+                    f"${summary['total_disbursed']:,.2f}",
+                ],
+                [
+                    _styled_cell(ws_summary, "Total Pending"),
+                    f"${summary['total_pending']:,.2f}",
+                ],
+                [
+                    _styled_cell(ws_summary, "Completion Rate"),
+                    f"{summary['disbursement_completion_rate']:.1f}%",
+                ],
+            ],
         )
 
         # Disbursements Sheet
@@ -1849,70 +2576,31 @@ END OF LOG
             "Requirements Met",
             "Requirements Pending",
         ]
-        for col, header in enumerate(headers, 1):
-            cell = ws_disbursements.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(
-                start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"
-            )
-
-        for row_idx, disbursement in enumerate(report_data["disbursements"], 2):
-            ws_disbursements.cell(
-                row=row_idx, column=1, value=disbursement["scholarship_name"]
-            )
-            ws_disbursements.cell(
-                row=row_idx, column=2, value=disbursement["recipient_name"]
-            )
-            ws_disbursements.cell(
-                row=row_idx, column=3, value=disbursement["student_id"]
-            )
+        rows = [_header_row(ws_disbursements, headers)]
+        for disbursement in report_data["disbursements"]:
             award_date = disbursement["award_date"]
             date_str = (
                 award_date.strftime("%Y-%m-%d")
                 if hasattr(award_date, "strftime")
                 else str(award_date)
             )
-            ws_disbursements.cell(row=row_idx, column=4, value=date_str)
-            ws_disbursements.cell(
-                row=row_idx,
-                column=5,
-                value=f"${disbursement['total_award_amount']:,.2f}",
-            )
-            ws_disbursements.cell(
-                row=row_idx, column=6, value=f"${disbursement['disbursed_amount']:,.2f}"
-            )
-            ws_disbursements.cell(
-                row=row_idx, column=7, value=f"${disbursement['pending_amount']:,.2f}"
-            )
-            ws_disbursements.cell(row=row_idx, column=8, value=disbursement["status"])
-            ws_disbursements.cell(
-                row=row_idx,
-                column=9,
-                value=f"{len(disbursement['disbursement_schedule']['completed_payments'])}/{disbursement['disbursement_schedule']['total_payments']}",
-            )
-            ws_disbursements.cell(
-                row=row_idx,
-                column=10,
-                value="; ".join(disbursement["requirements_met"]),
-            )
-            ws_disbursements.cell(
-                row=row_idx,
-                column=11,
-                value="; ".join(disbursement["requirements_pending"]),
+            schedule = disbursement["disbursement_schedule"]
+            rows.append(
+                [
+                    disbursement["scholarship_name"],
+                    disbursement["recipient_name"],
+                    disbursement["student_id"],
+                    date_str,
+                    f"${disbursement['total_award_amount']:,.2f}",
+                    f"${disbursement['disbursed_amount']:,.2f}",
+                    f"${disbursement['pending_amount']:,.2f}",
+                    disbursement["status"],
+                    f"{len(schedule['completed_payments'])}/{schedule['total_payments']}",
+                    "; ".join(disbursement["requirements_met"]),
+                    "; ".join(disbursement["requirements_pending"]),
+                ]
             )
-
-        # Adjust column widths
-        for ws in [ws_summary, ws_disbursements]:
-            for col in ws.columns:
-                max_length = 0
-                for cell in col:
-                    try:
-                        max_length = max(max_length, len(str(cell.value)))
-                    except:
-                        pass
-                ws.column_dimensions[chr(64 + col[0].column)].width = min(
-                    max_length + 2, 50
-                )
+        _append_sized_rows(ws_disbursements, rows)
 
         wb.save(output_path)
         return output_path
@@ -1923,79 +2611,72 @@ END OF LOG
         """Export disbursement report to CSV format."""
         report_data = self.generate_disbursement_report(scholarship_name)
 
-        import csv
+        with open(
+            output_path,
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=_EXPORT_BUFFER_SIZE,
+        ) as f:
+            csv.writer(f).writerows(self._disbursement_report_csv_rows(report_data))
 
-        with open(output_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-
-            # Header
-            writer.writerow([f"Disbursement Report: {report_data['scholarship_name']}"])
-            writer.writerow(
-                [
-                    f"Generated: {report_data['generated_date'].strftime('%Y-%m-%d %H:%M:%S')}"
-                ]
-            )
-            writer.writerow([])
+        return output_path
 
-            # Summary
-            writer.writerow(["Summary Statistics"])
-            writer.writerow(["Total Recipients", report_data["total_recipients"]])
-            writer.writerow(
-                ["Total Awarded", f"${report_data['summary']['total_awarded']:,.2f}"]
-            )
-            writer.writerow(
-                [
-                    "Total Disbursed",
-                    f"${report_data['summary']['total_disbursed']:,.2f}",
-                ]
-            )
-            writer.writerow(
-                ["Total Pending", f"${report_data['summary']['total_pending']:,.2f}"]
-            )
-            writer.writerow(
-                [
-                    "Completion Rate",
-                    f"{report_data['summary']['disbursement_completion_rate']:.1f}%",
-                ]
-            )
-            writer.writerow([])
+    @staticmethod
+    def _disbursement_report_csv_rows(report_data):
+        """Yield the CSV rows of a disbursement report."""
+        # Header
+        yield [f"Disbursement Report: {report_data['scholarship_name']}"]
+        yield [
+            f"Generated: {report_data['generated_date'].strftime('%Y-%m-%d %H:%M:%S')}"
+        ]
+        yield []
+
+        # Summary
+        yield ["Summary Statistics"]
+        yield ["Total Recipients", report_data["total_recipients"]]
+        yield ["Total Awarded", f"${report_data['summary']['total_awarded']:,.2f}"]
+        yield [
+            "Total Disbursed",
+            f"${report_data['summary']['total_disbursed']:,.2f}",
+        ]
+        yield ["Total Pending", f"${report_data['summary']['total_pending']:,.2f}"]
+        yield [
+            "Completion Rate",
+            f"{report_data['summary']['disbursement_completion_rate']:.1f}%",
+        ]
+        yield []
 
-            # Disbursements
-            writer.writerow(
-                [
-                    "Scholarship",
-                    "Recipient",
-                    "Student ID",
-                    "Award Date",
-                    "Total Award",
-                    "Disbursed",
-                    "Pending",
-                    "Status",
-                    "Completed/Total Payments",
-                ]
+        # Disbursements
+        yield [
+            "Scholarship",
+            "Recipient",
+            "Student ID",
+            "Award Date",
+            "Total Award",
+            "Disbursed",
+            "Pending",
+            "Status",
+            "Completed/Total Payments",
+        ]
+        for disbursement in report_data["disbursements"]:
+            award_date = disbursement["award_date"]
+            date_str = (
+                award_date.strftime("%Y-%m-%d")
+                if hasattr(award_date, "strftime")
+                else str(award_date)
             )
-            for disbursement in report_data["disbursements"]:
-                award_date = disbursement["award_date"]
-                date_str = (
-                    award_date.strftime("%Y-%m-%d")
-                    if hasattr(award_date, "strftime")
-                    else str(award_date)
-                )
-                writer.writerow(
-                    [
-                        disbursement["scholarship_name"],
-                        disbursement["recipient_name"],
-                        disbursement["student_id"],
-                        date_str,
-                        f"${disbursement['total_award_amount']:,.2f}",
-                        f"${disbursement['disbursed_amount']:,.2f}",
-                        f"${disbursement['pending_amount']:,.2f}",
-                        disbursement["status"],
-                        f"{len(disbursement['disbursement_schedule']['completed_payments'])}/{disbursement['disbursement_schedule']['total_payments']}",
-                    ]
-                )
-
-        return output_path
+            yield [
+                disbursement["scholarship_name"],
+                disbursement["recipient_name"],
+                disbursement["student_id"],
+                date_str,
+                f"${disbursement['total_award_amount']:,.2f}",
+                f"${disbursement['disbursed_amount']:,.2f}",
+                f"${disbursement['pending_amount']:,.2f}",
+                disbursement["status"],
+                f"{len(disbursement['disbursement_schedule']['completed_payments'])}/{disbursement['disbursement_schedule']['total_payments']}",
+            ]
 
     def export_prescreening_report_to_pdf(
         self,
@@ -2004,11 +2685,56 @@ END OF LOG
         output_path: str = None,
     ) -> str:
         """Export pre-screening report to PDF format."""
-        report_data = self.generate_prescreening_report(applicants, scholarship_id)
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import (
+            SimpleDocTemplate,
+            Paragraph,
+            Spacer,
+            Table,
+            TableStyle,
+        )
+        from .pdf_rendering import (
+            bullet_list,
+            flatten_applicant_review,
+            sample_styles,
+        )
+
+        report_data = self.generate_prescreening_report(
+            applicants, scholarship_id, matches_only=True
+        )
+        applicant_cells = self._prescreening_cells(report_data)
+
+        def applicant_row(match):
+            applicant = match["applicant"]
+            cells = applicant_cells[applicant["student_id"]]
+            decision_label = "Pending"
+            if match.get("award_decision"):
+                decision_label = (
+                    match["award_decision"]["decision"].replace("_", " ").title()
+                )
+            return (
+                *_APPLICANT_TABLE_FIELDS(applicant),
+                cells["gpa"],
+                applicant["academic_level"],
+                match.get("application_status", {}).get("status", "Unknown").title(),
+                cells["avg_review_score"],
+                decision_label,
+            )
+
+        applicant_table_style = TableStyle(
+            [
+                ("GRID", (0, 0), (-1, -1), 1, colors.black),
+                ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+            ]
+        )
 
         doc = SimpleDocTemplate(output_path, pagesize=letter)
         story = []
-        styles = getSampleStyleSheet()
+        styles = sample_styles()
 
         # Title
         story.append(Paragraph("Pre-screening Report", styles["Heading1"]))
@@ -2021,31 +2747,31 @@ END OF LOG
 
         # Summary Section
         story.append(Paragraph("Summary", styles["Heading2"]))
-        summary_data = [
-            ["Total Applicants", str(report_data["total_applicants"])],
-            ["Total Matches", str(report_data["summary"]["total_matches"])],
-            ["Match Rate", f"{report_data['summary']['match_rate'] * 100:.1f}%"],
-            [
+        summary_data = (
+            ("Total Applicants", str(report_data["total_applicants"])),
+            ("Total Matches", str(report_data["summary"]["total_matches"])),
+            ("Match Rate", f"{report_data['summary']['match_rate'] * 100:.1f}%"),
+            (
                 "Scholarships with Matches",
                 str(report_data["summary"]["scholarships_with_matches"]),
-            ],
-            [
+            ),
+            (
                 "Review Completion Rate",
                 f"{report_data['summary']['review_statistics']['review_completion_rate'] * 100:.1f}%",
-            ],
-            [
+            ),
+            (
                 "Applications Complete",
                 str(report_data["summary"]["application_completion"]["complete"]),
-            ],
-            [
+            ),
+            (
                 "Applications In Progress",
                 str(report_data["summary"]["application_completion"]["in_progress"]),
-            ],
-            [
+            ),
+            (
                 "Applications Incomplete",
                 str(report_data["summary"]["application_completion"]["incomplete"]),
-            ],
-        ]
+            ),
+        )
 
         summary_table = Table(summary_data)
         summary_table.setStyle(
@@ -2058,7 +2784,7 @@ END OF LOG
             )
         )
         story.append(summary_table)
-        story.append(Paragraph("<br/>", styles["Normal"]))
+        story.append(Spacer(1, 12))
 
         # Review Statistics
         story.append(Paragraph("Review Statistics", styles["Heading2"]))
@@ -2081,7 +2807,7 @@ END OF LOG
                 styles["Normal"],
             )
         )
-        story.append(Paragraph("<br/>", styles["Normal"]))
+        story.append(Spacer(1, 12))
 
         # Award Decision Summary Section
         if "award_decisions" in report_data["summary"]:
@@ -2092,7 +2818,7 @@ END OF LOG
                 Paragraph(f"Not Awarded: {ad['not_awarded']}", styles["Normal"])
             )
             story.append(Paragraph(f"Pending: {ad['pending']}", styles["Normal"]))
-            story.append(Paragraph("<br/>", styles["Normal"]))
+            story.append(Spacer(1, 12))
 
         # Matches by Scholarship
         for scholarship_match in report_data["matches"]:
@@ -2115,151 +2841,32 @@ END OF LOG
             # Eligibility Criteria Section
             if scholarship_match.get("eligibility_criteria"):
                 story.append(Paragraph("Eligibility Criteria:", styles["Heading3"]))
-                for criteria in scholarship_match["eligibility_criteria"]:
-                    story.append(Paragraph(f"• {criteria}", styles["Normal"]))
-                story.append(Paragraph("<br/>", styles["Normal"]))
+                story.append(
+                    bullet_list(
+                        scholarship_match["eligibility_criteria"], styles["Normal"]
+                    )
+                )
+                story.append(Spacer(1, 12))
 
             # Table of matching applicants with review scores
             story.append(Paragraph("Qualified Applicants:", styles["Heading3"]))
-            applicant_data = [
-                [
-                    "Name",
-                    "Student ID",
-                    "Major",
-                    "GPA",
-                    "Academic Level",
-                    "Application Status",
-                    "Review Score",
-                    "Award Decision",
-                ]
-            ]
-
-            for match in scholarship_match["matches"]:
-                applicant = match["applicant"]
-                review_data = match.get("review_data", {})
-                application_status = match.get("application_status", {})
-
-                # Calculate average review score
-                review_scores = []
-                if review_data.get("academic_review", {}).get("score"):
-                    review_scores.append(review_data["academic_review"]["score"])
-                if review_data.get("essay_review", {}).get("scores"):
-                    review_scores.extend(review_data["essay_review"]["scores"])
-                avg_review_score = (
-                    sum(review_scores) / len(review_scores) if review_scores else "N/A"
-                )
-
-                decision_label = "Pending"
-                if match.get("award_decision"):
-                    decision_label = (
-                        match["award_decision"]["decision"].replace("_", " ").title()
-                    )
-                applicant_data.append(
+            applicant_rows = [applicant_row(m) for m in scholarship_match["matches"]]
+            for start in range(0, len(applicant_rows), _APPLICANT_TABLE_CHUNK_ROWS):
+                applicant_table = Table(
                     [
-                        applicant["name"],
-                        applicant["student_id"],
-                        applicant["major"],
-                        f"{applicant['gpa']:.2f}",
-                        applicant["academic_level"],
-                        application_status.get("status", "Unknown").title(),
-                        f"{avg_review_score:.1f}"
-                        if isinstance(avg_review_score, float)
-                        else avg_review_score,
-                        decision_label,
-                    ]
-                )
-
-            if len(applicant_data) > 1:
-                applicant_table = Table(applicant_data)
-                applicant_table.setStyle(
-                    TableStyle(
-                        [
-                            ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                            ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-                            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                            ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                        ]
-                    )
+                        _APPLICANT_TABLE_HEADER,
+                        *applicant_rows[start : start + _APPLICANT_TABLE_CHUNK_ROWS],
+                    ],
+                    repeatRows=1,
                 )
+                applicant_table.setStyle(applicant_table_style)
                 story.append(applicant_table)
 
             # Detailed Review Information
             for match in scholarship_match["matches"]:
-                applicant = match["applicant"]
-                review_data = match.get("review_data", {})
-                story.append(
-                    Paragraph(
-                        f"\nDetailed Review for {applicant['name']}:",
-                        styles["Heading4"],
-                    )
-                )
-
-                # Essay Reviews
-                if review_data.get("essay_review", {}).get("comments"):
-                    story.append(Paragraph("Essay Reviews:", styles["Heading4"]))
-                    for i, (comment, score) in enumerate(
-                        zip(
-                            review_data["essay_review"]["comments"],
-                            review_data["essay_review"]["scores"],
-                        ),
-                        1,
-                    ):
-                        story.append(
-                            Paragraph(
-                                f"Essay {i} - Score: {score}/10", styles["Normal"]
-                            )
-                        )
-                        story.append(
-                            Paragraph(f"Feedback: {comment}", styles["Normal"])
-                        )
+                story.extend(flatten_applicant_review(match, styles))
 
-                # Interview Notes
-                if review_data.get("interview_notes"):
-                    story.append(Paragraph("Interview Notes:", styles["Heading4"]))
-                    story.append(
-                        Paragraph(review_data["interview_notes"], styles["Normal"])
-                    )
-
-                # Committee Feedback (retained)
-                if review_data.get("committee_feedback"):
-                    story.append(Paragraph("Committee Feedback:", styles["Heading4"]))
-                    for feedback in review_data["committee_feedback"]:
-                        story.append(
-                            Paragraph(
-                                f"• {feedback['member']}: {feedback['comments']}",
-                                styles["Normal"],
-                            )
-                        )
-                # Award Decision Details
-                if match.get("award_decision"):
-                    ad = match["award_decision"]
-                    story.append(Paragraph("Award Decision:", styles["Heading4"]))
-                    story.append(
-                        Paragraph(
-                            f"Decision: {ad['decision'].replace('_', ' ').title()}",
-                            styles["Normal"],
-                        )
-                    )
-                    if ad.get("decided_at"):
-                        try:
-                            story.append(
-                                Paragraph(
-                                    f"Decided At: {ad['decided_at'].strftime('%Y-%m-%d')}",
-                                    styles["Normal"],
-                                )
-                            )
-                        except Exception:
-                            story.append(
-                                Paragraph(
-                                    f"Decided At: {ad['decided_at']}", styles["Normal"]
-                                )
-                            )
-                    if ad.get("comments"):
-                        story.append(Paragraph("Comments:", styles["Heading4"]))
-                        story.append(Paragraph(str(ad["comments"]), styles["Normal"]))
-
-            story.append(Paragraph("<br/>", styles["Normal"]))
+            story.append(Spacer(1, 12))
 
         doc.build(story)
         return output_path
@@ -2280,214 +2887,189 @@ END OF LOG
         Returns:
             str: Path to the generated CSV file
         """
-        report_data = self.generate_prescreening_report(applicants, scholarship_id)
-
-        with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.writer(csvfile)
+        report_data = self.generate_prescreening_report(
+            applicants, scholarship_id, matches_only=True
+        )
 
-            # Write header and summary information
-            writer.writerow(["Pre-screening Report"])
-            writer.writerow(
-                [
-                    "Generated Date:",
-                    report_data["generated_date"].strftime("%Y-%m-%d %H:%M:%S"),
-                ]
-            )
-            writer.writerow(["Total Applicants:", report_data["total_applicants"]])
-            writer.writerow(["Total Matches:", report_data["summary"]["total_matches"]])
-            writer.writerow(
-                ["Match Rate:", f"{report_data['summary']['match_rate'] * 100:.1f}%"]
+        with open(
+            output_path,
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=_EXPORT_BUFFER_SIZE,
+        ) as csvfile:
+            csvfile.writelines(
+                _csv_lines(self._prescreening_report_csv_rows(report_data))
             )
-            writer.writerow(
-                [
-                    "Scholarships with Matches:",
-                    report_data["summary"]["scholarships_with_matches"],
-                ]
-            )
-            writer.writerow([])
 
-            # Write review statistics
-            writer.writerow(["Review Statistics"])
-            review_stats = report_data["summary"]["review_statistics"]
-            writer.writerow(
-                [
-                    "Average Academic Review Score:",
-                    f"{review_stats['average_scores']['academic_review']:.1f}/10",
-                ]
-            )
-            writer.writerow(
-                [
-                    "Average Essay Review Score:",
-                    f"{review_stats['average_scores']['essay_review']:.1f}/10",
-                ]
-            )
-            writer.writerow(["Reviews Completed:", review_stats["reviews_completed"]])
-            writer.writerow(
-                ["Total Reviews Expected:", review_stats["total_reviews_expected"]]
-            )
-            writer.writerow(
-                [
-                    "Review Completion Rate:",
-                    f"{review_stats['review_completion_rate'] * 100:.1f}%",
-                ]
-            )
-            writer.writerow([])
-
-            # Write application completion statistics
-            writer.writerow(["Application Completion"])
-            completion_stats = report_data["summary"]["application_completion"]
-            writer.writerow(["Complete:", completion_stats["complete"]])
-            writer.writerow(["In Progress:", completion_stats["in_progress"]])
-            writer.writerow(["Incomplete:", completion_stats["incomplete"]])
-            writer.writerow([])
-
-            # Write detailed matches for each scholarship
-            writer.writerow(["Scholarship Matches"])
-            writer.writerow(
-                [
-                    "Scholarship Name",
-                    "Eligibility Criteria",
-                    "Applicant Name",
-                    "Student ID",
-                    "Major",
-                    "GPA",
-                    "Academic Level",
-                    "Application Status",
-                    "Qualification Score",
-                    "Review Score",
-                    "Has Interview",
-                    "Has Committee Feedback",
-                    "Award Decision",
-                    "Decision Comments",
-                ]
-            )
+        return output_path
 
-            for match in report_data["matches"]:
-                scholarship_name = match["scholarship_name"]
-                eligibility_list = match.get("eligibility_criteria", [])
-                eligibility_str = (
-                    "; ".join(eligibility_list)
-                    if isinstance(eligibility_list, list)
-                    else str(eligibility_list)
-                )
-                for applicant_match in match["matches"]:
-                    applicant = applicant_match["applicant"]
-                    review_data = applicant_match["review_data"]
-
-                    # Calculate average review score
-                    review_scores = []
-                    if review_data.get("academic_review", {}).get("score"):
-                        review_scores.append(review_data["academic_review"]["score"])
-                    if review_data.get("essay_review", {}).get("scores"):
-                        review_scores.extend(review_data["essay_review"]["scores"])
-                    avg_review_score = (
-                        f"{sum(review_scores) / len(review_scores):.1f}"
-                        if review_scores
-                        else "N/A"
-                    )
+    def _prescreening_report_csv_rows(self, report_data):
+        """Yield the CSV rows of a pre-screening report."""
+        # Write header and summary information
+        yield ["Pre-screening Report"]
+        yield [
+            "Generated Date:",
+            report_data["generated_date"].strftime("%Y-%m-%d %H:%M:%S"),
+        ]
+        yield ["Total Applicants:", report_data["total_applicants"]]
+        yield ["Total Matches:", report_data["summary"]["total_matches"]]
+        yield ["Match Rate:", f"{report_data['summary']['match_rate'] * 100:.1f}%"]
+        yield [
+            "Scholarships with Matches:",
+            report_data["summary"]["scholarships_with_matches"],
+        ]
+        yield []
 
-                    decision_label = "Pending"
-                    decision_comments = ""
-                    if applicant_match.get("award_decision"):
-                        decision_label = (
-                            applicant_match["award_decision"]["decision"]
-                            .replace("_", " ")
-                            .title()
-                        )
-                        decision_comments = applicant_match["award_decision"].get(
-                            "comments", ""
-                        )
+        # Write review statistics
+        yield ["Review Statistics"]
+        review_stats = report_data["summary"]["review_statistics"]
+        yield [
+            "Average Academic Review Score:",
+            f"{review_stats['average_scores']['academic_review']:.1f}/10",
+        ]
+        yield [
+            "Average Essay Review Score:",
+            f"{review_stats['average_scores']['essay_review']:.1f}/10",
+        ]
+        yield ["Reviews Completed:", review_stats["reviews_completed"]]
+        yield ["Total Reviews Expected:", review_stats["total_reviews_expected"]]
+        yield [
+            "Review Completion Rate:",
+            f"{review_stats['review_completion_rate'] * 100:.1f}%",
+        ]
+        yield []
+
+        # Write application completion statistics
+        yield ["Application Completion"]
+        completion_stats = report_data["summary"]["application_completion"]
+        yield ["Complete:", completion_stats["complete"]]
+        yield ["In Progress:", completion_stats["in_progress"]]
+        yield ["Incomplete:", completion_stats["incomplete"]]
+        yield []
+
+        # Write detailed matches for each scholarship
+        yield ["Scholarship Matches"]
+        yield [
+            "Scholarship Name",
+            "Eligibility Criteria",
+            "Applicant Name",
+            "Student ID",
+            "Major",
+            "GPA",
+            "Academic Level",
+            "Application Status",
+            "Qualification Score",
+            "Review Score",
+            "Has Interview",
+            "Has Committee Feedback",
+            "Award Decision",
+            "Decision Comments",
+        ]
 
-                    writer.writerow(
-                        [
-                            scholarship_name,
-                            eligibility_str,
-                            applicant["name"],
-                            applicant["student_id"],
-                            applicant["major"],
-                            f"{applicant['gpa']:.2f}",
-                            applicant["academic_level"],
-                            applicant_match["application_status"]["status"].title(),
-                            f"{applicant_match['qualification_score']:.1f}%",
-                            avg_review_score,
-                            "Yes" if review_data.get("interview_notes") else "No",
-                            "Yes" if review_data.get("committee_feedback") else "No",
-                            decision_label,
-                            decision_comments,
-                        ]
+        applicant_cells = self._prescreening_cells(report_data)
+        for match in report_data["matches"]:
+            scholarship_name = match["scholarship_name"]
+            eligibility_list = match.get("eligibility_criteria", [])
+            eligibility_str = (
+                "; ".join(eligibility_list)
+                if isinstance(eligibility_list, list)
+                else str(eligibility_list)
+            )
+            for applicant_match in match["matches"]:
+                applicant = applicant_match["applicant"]
+                cells = applicant_cells[applicant["student_id"]]
+
+                decision_label = "Pending"
+                decision_comments = ""
+                if applicant_match.get("award_decision"):
+                    decision_label = (
+                        applicant_match["award_decision"]["decision"]
+                        .replace("_", " ")
+                        .title()
+                    )
+                    decision_comments = applicant_match["award_decision"].get(
+                        "comments", ""
                     )
-            writer.writerow([])
 
-            # Write detailed review information
-            writer.writerow(["Detailed Reviews"])
-            writer.writerow(
-                [
-                    "Applicant Name",
-                    "Student ID",
-                    "Review Type",
-                    "Score",
-                    "Comments",
-                    "Reviewer",
-                    "Date",
+                yield [
+                    scholarship_name,
+                    eligibility_str,
+                    applicant["name"],
+                    applicant["student_id"],
+                    applicant["major"],
+                    cells["gpa"],
+                    applicant["academic_level"],
+                    applicant_match["application_status"]["status"].title(),
+                    f"{applicant_match['qualification_score']:.1f}%",
+                    cells["avg_review_score"],
+                    cells["has_interview"],
+                    cells["has_committee_feedback"],
+                    decision_label,
+                    decision_comments,
                 ]
-            )
+        yield []
 
-            for match in report_data["matches"]:
-                for applicant_match in match["matches"]:
-                    applicant = applicant_match["applicant"]
-                    review_data = applicant_match["review_data"]
-
-                    # Academic Review
-                    if review_data.get("academic_review", {}).get("score"):
-                        writer.writerow(
-                            [
-                                applicant["name"],
-                                applicant["student_id"],
-                                "Academic Review",
-                                review_data["academic_review"]["score"],
-                                review_data["academic_review"].get("comments", "N/A"),
-                                review_data["academic_review"].get("reviewer", "N/A"),
-                                review_data["academic_review"].get("date", "N/A"),
-                            ]
-                        )
+        # Write detailed review information
+        yield ["Detailed Reviews"]
+        yield [
+            "Applicant Name",
+            "Student ID",
+            "Review Type",
+            "Score",
+            "Comments",
+            "Reviewer",
+            "Date",
+        ]
 
-                    # Essay Reviews
-                    for i, (score, comment, reviewer, date) in enumerate(
-                        zip(
-                            review_data["essay_review"]["scores"],
-                            review_data["essay_review"]["comments"],
-                            review_data["essay_review"]["reviewers"],
-                            review_data["essay_review"]["dates"],
-                        ),
-                        1,
-                    ):
-                        writer.writerow(
-                            [
-                                applicant["name"],
-                                applicant["student_id"],
-                                f"Essay Review {i}",
-                                score,
-                                comment,
-                                reviewer,
-                                date.strftime("%Y-%m-%d") if date else "N/A",
-                            ]
-                        )
+        for match in report_data["matches"]:
+            for applicant_match in match["matches"]:
+                applicant = applicant_match["applicant"]
+                review_data = applicant_match["review_data"]
 
-                    # Committee Feedback
-                    for feedback in review_data.get("committee_feedback", []):
-                        writer.writerow(
-                            [
-                                applicant["name"],
-                                applicant["student_id"],
-                                "Committee Feedback",
-                                feedback.get("recommendation", "N/A"),
-                                feedback["comments"],
-                                feedback["member"],
-                                feedback.get("date", "N/A"),
-                            ]
-                        )
+                # Academic Review
+                if review_data.get("academic_review", {}).get("score"):
+                    yield [
+                        applicant["name"],
+                        applicant["student_id"],
+                        "Academic Review",
+                        review_data["academic_review"]["score"],
+                        review_data["academic_review"].get("comments", "N/A"),
+                        review_data["academic_review"].get("reviewer", "N/A"),
+                        review_data["academic_review"].get("date", "N/A"),
+                    ]
 
-        return output_path
+                # Essay Reviews
+                for i, (score, comment, reviewer, date) in enumerate(
+                    zip(
+                        review_data["essay_review"]["scores"],
+                        review_data["essay_review"]["comments"],
+                        review_data["essay_review"]["reviewers"],
+                        review_data["essay_review"]["dates"],
+                    ),
+                    1,
+                ):
+                    yield [
+                        applicant["name"],
+                        applicant["student_id"],
+                        f"Essay Review {i}",
+                        score,
+                        comment,
+                        reviewer,
+                        date.strftime("%Y-%m-%d") if date else "N/A",
+                    ]
+
+                # Committee Feedback
+                for feedback in review_data.get("committee_feedback", []):
+                    yield [
+                        applicant["name"],
+                        applicant["student_id"],
+                        "Committee Feedback",
+                        feedback.get("recommendation", "N/A"),
+                        feedback["comments"],
+                        feedback["member"],
+                        feedback.get("date", "N/A"),
+                    ]
 
     def export_prescreening_report_to_excel(
         self,
@@ -2496,16 +3078,53 @@ END OF LOG
         output_path: str = None,
     ) -> str:
         """Export pre-screening report to Excel format."""
-        report_data = self.generate_prescreening_report(applicants, scholarship_id)
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+
+        bold_font = _excel_styles()["bold_font"]
 
-        wb = Workbook()
+        report_data = self.generate_prescreening_report(
+            applicants, scholarship_id, matches_only=True
+        )
+        applicant_cells = self._prescreening_cells(report_data)
+
+        wb = Workbook(write_only=True)
+        header_style = _register_header_style(wb)
+        column_widths = {}
+        sheet_cells = {}
+
+        def put(ws, row, column, value, font=None, style=None):
+            """Buffer a cell and record its length for the column width map.
+
+            Write-only sheets can only be appended to in order, so cells are
+            collected by position and flushed once every sheet is complete.
+            """
+            _track_width(column_widths.setdefault(ws.title, {}), column, value)
+            sheet_cells.setdefault(ws.title, {}).setdefault(row, {})[column] = (
+                value,
+                font,
+                style,
+            )
+
+        def put_row(ws, row, values, style=None):
+            """Buffer a whole row of cells, starting at column 1, in one call."""
+            widths = column_widths.setdefault(ws.title, {})
+            for column, value in enumerate(values, 1):
+                _track_width(widths, column, value)
+            sheet_cells.setdefault(ws.title, {})[row] = {
+                column: (value, None, style) for column, value in enumerate(values, 1)
+            }
 
         # Summary Sheet
-        ws_summary = wb.active
-        ws_summary.title = "Summary"
-        ws_summary["A1"] = "Pre-screening Report Summary"
-        ws_summary["A2"] = "Generated on:"
-        ws_summary["B2"] = report_data["generated_date"].strftime("%Y-%m-%d %H:%M:%S")
+        ws_summary = wb.create_sheet("Summary")
+        put(ws_summary, 1, 1, "Pre-screening Report Summary")
+        put(ws_summary, 2, 1, "Generated on:")
+        put(
+            ws_summary,
+            2,
+            2,
+            report_data["generated_date"].strftime("%Y-%m-%d %H:%M:%S"),
+        )
 
         summary_data = [
             ["Total Applicants", report_data["total_applicants"]],
@@ -2534,12 +3153,11 @@ END OF LOG
         ]
 
         for row_idx, (label, value) in enumerate(summary_data, 4):
-            ws_summary[f"A{row_idx}"] = label
-            ws_summary[f"B{row_idx}"] = value
+            put(ws_summary, row_idx, 1, label)
+            put(ws_summary, row_idx, 2, value)
 
         # Review Statistics
-        ws_summary["A12"] = "Review Statistics"
-        ws_summary["A12"].font = Font(bold=True)
+        put(ws_summary, 12, 1, "Review Statistics", font=bold_font)
         review_stats = [
             [
                 "Average Academic Review Score",
@@ -2559,35 +3177,45 @@ END OF LOG
             ],
         ]
         for row_idx, (label, value) in enumerate(review_stats, 13):
-            ws_summary[f"A{row_idx}"] = label
-            ws_summary[f"B{row_idx}"] = value
+            put(ws_summary, row_idx, 1, label)
+            put(ws_summary, row_idx, 2, value)
 
         # Matches Sheet with Review Information
         for scholarship_match in report_data["matches"]:
             ws_matches = wb.create_sheet(scholarship_match["scholarship_name"][:31])
 
             # Scholarship details
-            ws_matches["A1"] = "Scholarship Details"
-            ws_matches["A2"] = "Description:"
-            ws_matches["B2"] = scholarship_match["description"]
-            ws_matches["A3"] = "Amount:"
-            ws_matches["B3"] = f"${scholarship_match['amount']:,.2f}"
-            ws_matches["A4"] = "Deadline:"
-            ws_matches["B4"] = (
-                scholarship_match["deadline"].strftime("%Y-%m-%d")
-                if scholarship_match["deadline"]
-                else "No deadline set"
+            put(ws_matches, 1, 1, "Scholarship Details")
+            put(ws_matches, 2, 1, "Description:")
+            put(ws_matches, 2, 2, scholarship_match["description"])
+            put(ws_matches, 3, 1, "Amount:")
+            put(ws_matches, 3, 2, f"${scholarship_match['amount']:,.2f}")
+            put(ws_matches, 4, 1, "Deadline:")
+            put(
+                ws_matches,
+                4,
+                2,
+                (
+                    scholarship_match["deadline"].strftime("%Y-%m-%d")
+                    if scholarship_match["deadline"]
+                    else "No deadline set"
+                ),
             )
             # Eligibility Criteria
-            ws_matches["A5"] = "Eligibility Criteria:"
+            put(ws_matches, 5, 1, "Eligibility Criteria:")
             eligibility_list = scholarship_match.get("eligibility_criteria", [])
             if isinstance(eligibility_list, list):
-                ws_matches["B5"] = "; ".join(eligibility_list)
+                put(ws_matches, 5, 2, "; ".join(eligibility_list))
             else:
-                ws_matches["B5"] = str(eligibility_list) if eligibility_list else "N/A"
+                put(
+                    ws_matches,
+                    5,
+                    2,
+                    str(eligibility_list) if eligibility_list else "N/A",
+                )
 
             # Matching applicants with review scores
-            ws_matches["A6"] = "Qualified Applicants"
+            put(ws_matches, 6, 1, "Qualified Applicants")
             headers = [
                 "Name",
                 "Student ID",
@@ -2602,67 +3230,15 @@ END OF LOG
                 "Award Decision",
                 "Decision Comments",
             ]
-            for col, header in enumerate(headers, 1):
-                cell = ws_matches.cell(row=7, column=col, value=header)
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(
-                    start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"
-                )
+            put_row(ws_matches, 7, headers, style=header_style)
 
             row = 8
             for match in scholarship_match["matches"]:
                 applicant = match["applicant"]
+                cells = applicant_cells[applicant["student_id"]]
                 review_data = match.get("review_data", {})
                 application_status = match.get("application_status", {})
 
-                # Calculate average review score
-                review_scores = []
-                if review_data.get("academic_review", {}).get("score"):
-                    review_scores.append(review_data["academic_review"]["score"])
-                if review_data.get("essay_review", {}).get("scores"):
-                    review_scores.extend(review_data["essay_review"]["scores"])
-                avg_review_score = (
-                    sum(review_scores) / len(review_scores) if review_scores else "N/A"
-                )
-
-                ws_matches.cell(row=row, column=1, value=applicant["name"])
-                ws_matches.cell(row=row, column=2, value=applicant["student_id"])
-                ws_matches.cell(row=row, column=3, value=applicant["major"])
-                ws_matches.cell(row=row, column=4, value=f"{applicant['gpa']:.2f}")
-                ws_matches.cell(row=row, column=5, value=applicant["academic_level"])
-                ws_matches.cell(
-                    row=row,
-                    column=6,
-                    value=application_status.get("status", "Unknown").title(),
-                )
-                ws_matches.cell(
-                    row=row,
-                    column=7,
-                    value=f"{avg_review_score:.1f}"
-                    if isinstance(avg_review_score, float)
-                    else avg_review_score,
-                )
-                ws_matches.cell(
-                    row=row,
-                    column=8,
-                    value=", ".join(
-                        f"{score:.1f}"
-                        for score in review_data.get("essay_review", {}).get(
-                            "scores", []
-                        )
-                    )
-                    or "N/A",
-                )
-                ws_matches.cell(
-                    row=row,
-                    column=9,
-                    value="Yes" if review_data.get("interview_notes") else "No",
-                )
-                ws_matches.cell(
-                    row=row,
-                    column=10,
-                    value="Yes" if review_data.get("committee_feedback") else "No",
-                )
                 decision_label = "Pending"
                 decision_comments = ""
                 if match.get("award_decision"):
@@ -2670,28 +3246,46 @@ END OF LOG
                         match["award_decision"]["decision"].replace("_", " ").title()
                     )
                     decision_comments = match["award_decision"].get("comments", "")
-                ws_matches.cell(row=row, column=11, value=decision_label)
-                ws_matches.cell(row=row, column=12, value=decision_comments)
+                put_row(
+                    ws_matches,
+                    row,
+                    (
+                        applicant["name"],
+                        applicant["student_id"],
+                        applicant["major"],
+                        cells["gpa"],
+                        applicant["academic_level"],
+                        application_status.get("status", "Unknown").title(),
+                        cells["avg_review_score"],
+                        cells["essay_scores"],
+                        cells["has_interview"],
+                        cells["has_committee_feedback"],
+                        decision_label,
+                        decision_comments,
+                    ),
+                )
                 row += 1
 
                 # Add detailed review information
                 if review_data.get("interview_notes"):
                     row += 1
-                    ws_matches.cell(row=row, column=1, value="Interview Notes:")
-                    ws_matches.cell(
-                        row=row, column=2, value=review_data["interview_notes"]
+                    put_row(
+                        ws_matches,
+                        row,
+                        ("Interview Notes:", review_data["interview_notes"]),
                     )
                     row += 1
 
                 if review_data.get("committee_feedback"):
                     row += 1
-                    ws_matches.cell(row=row, column=1, value="Committee Feedback:")
+                    put(ws_matches, row, 1, "Committee Feedback:")
                     for feedback in review_data["committee_feedback"]:
                         row += 1
-                        ws_matches.cell(
-                            row=row,
-                            column=2,
-                            value=f"{feedback['member']}: {feedback['comments']}",
+                        put(
+                            ws_matches,
+                            row,
+                            2,
+                            f"{feedback['member']}: {feedback['comments']}",
                         )
                     row += 1
 
@@ -2699,26 +3293,31 @@ END OF LOG
             ws_reviews = wb.create_sheet(
                 f"{scholarship_match['scholarship_name'][:20]}_Reviews"
             )
-            ws_reviews["A1"] = (
-                f"Detailed Review Information for {scholarship_match['scholarship_name']}"
+            put(
+                ws_reviews,
+                1,
+                1,
+                f"Detailed Review Information for {scholarship_match['scholarship_name']}",
+                font=bold_font,
             )
-            ws_reviews["A1"].font = Font(bold=True)
 
             row = 3
             for match in scholarship_match["matches"]:
                 applicant = match["applicant"]
                 review_data = match.get("review_data", {})
 
-                ws_reviews.cell(
-                    row=row, column=1, value=f"Review Details for {applicant['name']}"
+                put(
+                    ws_reviews,
+                    row,
+                    1,
+                    f"Review Details for {applicant['name']}",
+                    font=bold_font,
                 )
-                ws_reviews.cell(row=row, column=1).font = Font(bold=True)
                 row += 2
 
                 # Essay Reviews
                 if review_data.get("essay_review", {}).get("comments"):
-                    ws_reviews.cell(row=row, column=1, value="Essay Reviews")
-                    ws_reviews.cell(row=row, column=1).font = Font(bold=True)
+                    put(ws_reviews, row, 1, "Essay Reviews", font=bold_font)
                     row += 1
 
                     for i, (comment, score, reviewer, date) in enumerate(
@@ -2730,77 +3329,97 @@ END OF LOG
                         ),
                         1,
                     ):
-                        ws_reviews.cell(row=row, column=1, value=f"Essay {i}")
-                        ws_reviews.cell(row=row, column=2, value=f"Score: {score}/10")
-                        ws_reviews.cell(row=row + 1, column=1, value="Reviewer:")
-                        ws_reviews.cell(row=row + 1, column=2, value=reviewer)
-                        ws_reviews.cell(row=row + 2, column=1, value="Date:")
-                        ws_reviews.cell(
-                            row=row + 2,
-                            column=2,
-                            value=date.strftime("%Y-%m-%d") if date else "N/A",
+                        put_row(ws_reviews, row, (f"Essay {i}", f"Score: {score}/10"))
+                        put_row(ws_reviews, row + 1, ("Reviewer:", reviewer))
+                        put_row(
+                            ws_reviews,
+                            row + 2,
+                            ("Date:", date.strftime("%Y-%m-%d") if date else "N/A"),
                         )
-                        ws_reviews.cell(row=row + 3, column=1, value="Feedback:")
-                        ws_reviews.cell(row=row + 3, column=2, value=comment)
+                        put_row(ws_reviews, row + 3, ("Feedback:", comment))
                         row += 5
 
                 # Committee Feedback
                 if review_data.get("committee_feedback"):
-                    ws_reviews.cell(row=row, column=1, value="Committee Feedback")
-                    ws_reviews.cell(row=row, column=1).font = Font(bold=True)
+                    put(ws_reviews, row, 1, "Committee Feedback", font=bold_font)
                     row += 1
 
                     for feedback in review_data["committee_feedback"]:
-                        ws_reviews.cell(row=row, column=1, value="Member:")
-                        ws_reviews.cell(row=row, column=2, value=feedback["member"])
-                        ws_reviews.cell(row=row + 1, column=1, value="Comments:")
-                        ws_reviews.cell(
-                            row=row + 1, column=2, value=feedback["comments"]
-                        )
+                        put(ws_reviews, row, 1, "Member:")
+                        put(ws_reviews, row, 2, feedback["member"])
+                        put(ws_reviews, row + 1, 1, "Comments:")
+                        put(ws_reviews, row + 1, 2, feedback["comments"])
                         if "date" in feedback:
-                            ws_reviews.cell(row=row + 2, column=1, value="Date:")
-                            ws_reviews.cell(
-                                row=row + 2,
-                                column=2,
-                                value=feedback["date"],
+                            put(ws_reviews, row + 2, 1, "Date:")
+                            put(
+                                ws_reviews,
+                                row + 2,
+                                2,
+                                feedback["date"],
                             )
                         row += 4
 
                 row += 2  # Add space between applicants
 
-        # Adjust column widths
+        # Size columns from the tracked lengths, then stream the buffered rows
         for ws in wb.worksheets:
-            for col in ws.columns:
-                max_length = 0
-                for cell in col:
-                    try:
-                        max_length = max(max_length, len(str(cell.value)))
-                    except:
-                        pass
-                ws.column_dimensions[chr(64 + col[0].column)].width = min(
-                    max_length + 2, 50
-                )
-
-        wb.save(output_path)
-        return output_path
+            _fit_column_widths(ws, column_widths.get(ws.title, {}))
+            rows = sheet_cells.get(ws.title, {})
+            for row in range(1, max(rows, default=0) + 1):
+                columns = rows.get(row, {})
+                values = [None] * max(columns, default=0)
+                for column, (value, font, style) in columns.items():
+                    if font is None and style is None:
+                        values[column - 1] = value
+                        continue
+                    cell = WriteOnlyCell(ws, value=value)
+                    if font is not None:
+                        cell.font = font
+                    if style is not None:
+                        cell.style = style
+                    values[column - 1] = cell
+                ws.append(values)
+
+        return _save_workbook(wb, output_path)
 
     @staticmethod
     def _parse_iso_dates(obj):
-        """Recursively convert ISO date strings back to datetime objects in a dict/list structure."""
-        from datetime import datetime
+        """Convert ISO date strings back to datetime objects in a dict/list structure.
 
-        if isinstance(obj, str):
-            try:
-                return datetime.fromisoformat(obj.replace("Z", "+00:00"))
-            except ValueError:
-                return obj
-        if isinstance(obj, dict):
-            return {k: ReportEngine._parse_iso_dates(v) for k, v in obj.items()}
-        if isinstance(obj, list):
-            return [ReportEngine._parse_iso_dates(v) for v in obj]
-        if isinstance(obj, tuple):
-            return tuple(ReportEngine._parse_iso_dates(v) for v in obj)
-        return obj
+        Dicts and lists are copied, never modified in place. Nesting is walked
+        with an explicit stack rather than by recursion.
+        """
+        if not isinstance(obj, (dict, list, tuple)):
+            return _parse_iso_date(obj)
+        root = [obj]
+        stack = [(root, 0)]
+        while stack:
+            parent, key = stack.pop()
+            value = parent[key]
+            if isinstance(value, tuple):
+                parent[key] = tuple(ReportEngine._parse_iso_dates(v) for v in value)
+                continue
+            if isinstance(value, dict):
+                copied = dict(value)
+                keys = copied.keys()
+            else:
+                copied = list(value)
+                keys = range(len(copied))
+            parent[key] = copied
+            for child_key in keys:
+                child = copied[child_key]
+                if isinstance(child, str):
+                    copied[child_key] = _parse_iso_date(child)
+                elif isinstance(child, (dict, list, tuple)):
+                    stack.append((copied, child_key))
+        return root[0]
+
+    @staticmethod
+    def _format_date(value, default="N/A"):
+        """Format a date for display, falling back to str() or a default."""
+        if hasattr(value, "strftime"):
+            return value.strftime("%Y-%m-%d")
+        return str(value) if value else default
 
     # Function to generate applicant report. Meets requirement SFWE504_3-LLR-6.
     def generate_applicant_report(
@@ -2840,14 +3459,14 @@ END OF LOG
                     pass
 
             # Exclude test/dummy applicants if matched directly
-            if not applicant_data or (
-                applicant_data
-                and applicant_data.name
-                and applicant_data.name.lower() in banned_names
+            if applicant_data is None or (
+                (applicant_data.name or "").lower() in banned_names
             ):
                 return None
 
             applicants_to_process = [applicant_data]
+            # Only this applicant's awards are needed; skip the full index
+            awards_index = self._active_awards_by_applicant(applicant_data.pk)
         else:
             # All applicants report
             # Exclude test/dummy applicants by name while preserving ordering
@@ -2856,91 +3475,74 @@ END OF LOG
                 for a in Applicant.objects.all().order_by("name")
                 if (a.name or "").lower() not in banned_names
             ]
+            awards_index = self._active_awards_by_applicant()
 
         # Process each applicant
         all_applicant_reports = []
         for applicant_data in applicants_to_process:
-            # Ensure required applicant fields exist; auto-generate sensible defaults if missing
-            defaults_applied = False
-            try:
-                # Minor
-                if not getattr(applicant_data, "minor", None):
-                    applicant_data.minor = "N/A"
-                    defaults_applied = True
+            # Ensure required applicant fields exist; auto-generate sensible defaults
+            # if missing. They are only set on the loaded instance, never saved, so
+            # building a report does not write to the Applicant table.
 
-                # Academic achievements
-                if not getattr(applicant_data, "academic_achievements", None):
-                    from django.utils import timezone as _tz
+            # Minor
+            if not getattr(applicant_data, "minor", None):
+                applicant_data.minor = "N/A"
 
-                    applicant_data.academic_achievements = [
-                        {
-                            "type": "Orientation Completed",
-                            "date": _tz.now().date().isoformat(),
-                            "description": "New student orientation completed",
-                        }
-                    ]
-                    defaults_applied = True
-
-                # Financial information
-                fi = getattr(applicant_data, "financial_info", None)
-                if not isinstance(fi, dict) or not fi:
-                    applicant_data.financial_info = {
-                        "fafsa_submitted": False,
-                        "efc": 0,
-                        "household_income": "N/A",
-                        "current_aid": [],
+            # Academic achievements
+            if not getattr(applicant_data, "academic_achievements", None):
+                from django.utils import timezone as _tz
+
+                applicant_data.academic_achievements = [
+                    {
+                        "type": "Orientation Completed",
+                        "date": _tz.now().date().isoformat(),
+                        "description": "New student orientation completed",
                     }
-                    defaults_applied = True
+                ]
 
-                # Essay submissions
-                if not getattr(applicant_data, "essays", None):
-                    from django.utils import timezone as _tz2
+            # Financial information
+            fi = getattr(applicant_data, "financial_info", None)
+            if not isinstance(fi, dict) or not fi:
+                applicant_data.financial_info = {
+                    "fafsa_submitted": False,
+                    "efc": 0,
+                    "household_income": "N/A",
+                    "current_aid": [],
+                }
 
-                    applicant_data.essays = [
-                        {
-                            "prompt": "Personal Statement",
-                            "content": "N/A",
-                            "submission_date": _tz2.now().isoformat(),
-                        }
-                    ]
-                    defaults_applied = True
+            # Essay submissions
+            if not getattr(applicant_data, "essays", None):
+                from django.utils import timezone as _tz2
 
-                if defaults_applied:
-                    applicant_data.save()
-            except Exception:
-                # Non-fatal: continue with available data
-                pass
-            # Query only ACTIVE awards for this applicant (exclude previous/completed awards)
-            awards_queryset = ScholarshipAward.objects.filter(
-                applicant=applicant_data, status="active"
-            )
+                applicant_data.essays = [
+                    {
+                        "prompt": "Personal Statement",
+                        "content": "N/A",
+                        "submission_date": _tz2.now().isoformat(),
+                    }
+                ]
 
-            # Deduplicate by scholarship_name: keep the most recent award per scholarship
-            awards_by_name = {}
-            for aw in awards_queryset.order_by(
-                "scholarship_name", "-award_date", "-id"
-            ):
-                if aw.scholarship_name not in awards_by_name:
-                    awards_by_name[aw.scholarship_name] = aw
-            deduped_awards = list(awards_by_name.values())
+            # Only ACTIVE awards, most recent per scholarship name
+            deduped_awards = awards_index.get(applicant_data.pk, [])
 
             applicant_awards = []
             for award in deduped_awards:
+                award_amount = float(award.award_amount)
+                disbursement_dates = award.disbursement_dates or []
+                per_disbursement = (
+                    award_amount / len(disbursement_dates)
+                    if disbursement_dates
+                    else award_amount
+                )
                 applicant_awards.append(
                     {
                         "scholarship_name": award.scholarship_name,
-                        "award_amount": float(award.award_amount),
+                        "award_amount": award_amount,
                         "award_date": award.award_date,
                         "status": award.status,
                         "disbursements": [
-                            {
-                                "date": date,
-                                "amount": float(award.award_amount)
-                                / len(award.disbursement_dates)
-                                if award.disbursement_dates
-                                else float(award.award_amount),
-                            }
-                            for date in award.disbursement_dates
+                            {"date": date, "amount": per_disbursement}
+                            for date in disbursement_dates
                         ],
                         "requirements_met": award.requirements_met,
                         "requirements_pending": award.requirements_pending,
@@ -2993,6 +3595,48 @@ END OF LOG
                                 }
                             )
 
+            # Parse once, then stamp display strings so exporters never call
+            # strftime per cell. Stamping happens after parsing because
+            # _parse_iso_dates would turn the "YYYY-MM-DD" strings back into
+            # datetimes.
+            detailed_awards = self._parse_iso_dates(applicant_awards)
+            for award in detailed_awards:
+                award["award_date_str"] = self._format_date(award["award_date"])
+            essay_evaluations = self._parse_iso_dates(normalized_essay_evaluations)
+            for ev in essay_evaluations:
+                ev["date_str"] = self._format_date(ev["date"], "")
+            achievements = self._parse_iso_dates(applicant_data.academic_achievements)
+            for achievement in achievements or []:
+                if isinstance(achievement, dict):
+                    achievement["date_str"] = self._format_date(
+                        achievement.get("date")
+                    )
+            essays = []
+            for essay in applicant_data.essays if applicant_data.essays else []:
+                if isinstance(essay, dict):
+                    submission_date = self._parse_iso_dates(
+                        essay.get("submission_date")
+                    )
+                    essays.append(
+                        {
+                            "prompt": essay.get("prompt", ""),
+                            "submission_date": submission_date,
+                            "submission_date_str": self._format_date(
+                                submission_date
+                            ),
+                            "content": essay.get("content", ""),
+                        }
+                    )
+                else:
+                    essays.append(
+                        {
+                            "prompt": "",
+                            "submission_date": None,
+                            "submission_date_str": "N/A",
+                            "content": str(essay),
+                        }
+                    )
+
             applicant_report = {
                 "personal_info": {
                     "name": applicant_data.name,
@@ -3005,55 +3649,33 @@ END OF LOG
                     "gpa": applicant_data.gpa,
                     "academic_level": applicant_data.academic_level,
                     "expected_graduation": applicant_data.expected_graduation,  # This is already a date from model
+                    "expected_graduation_str": self._format_date(
+                        applicant_data.expected_graduation
+                    ),
                     "academic_history": self._parse_iso_dates(
                         applicant_data.academic_history
                     ),
                 },
-                "achievements": self._parse_iso_dates(
-                    applicant_data.academic_achievements
-                ),
+                "achievements": achievements,
                 "financial_info": applicant_data.financial_info,
-                "essays": [
-                    {
-                        "prompt": essay.get("prompt", "")
-                        if isinstance(essay, dict)
-                        else "",
-                        "submission_date": self._parse_iso_dates(
-                            essay.get("submission_date")
-                        )
-                        if isinstance(essay, dict)
-                        else None,
-                        "content": essay.get("content", "")
-                        if isinstance(essay, dict)
-                        else str(essay),
-                    }
-                    for essay in (
-                        applicant_data.essays if applicant_data.essays else []
-                    )
-                ],
-                "essay_evaluations": self._parse_iso_dates(
-                    normalized_essay_evaluations
-                ),
+                "essays": essays,
+                "essay_evaluations": essay_evaluations,
                 "scholarships": {
                     "total_awards": len(applicant_awards),
                     "total_amount": sum(
                         award["award_amount"] for award in applicant_awards
                     ),
-                    "active_awards": self._parse_iso_dates(
-                        [
-                            award
-                            for award in applicant_awards
-                            if award["status"] == "active"
-                        ]
-                    ),
-                    "completed_awards": self._parse_iso_dates(
-                        [
-                            award
-                            for award in applicant_awards
-                            if award["status"] == "completed"
-                        ]
-                    ),
-                    "detailed_awards": self._parse_iso_dates(applicant_awards),
+                    "active_awards": [
+                        award
+                        for award in detailed_awards
+                        if award["status"] == "active"
+                    ],
+                    "completed_awards": [
+                        award
+                        for award in detailed_awards
+                        if award["status"] == "completed"
+                    ],
+                    "detailed_awards": detailed_awards,
                 },
             }
             all_applicant_reports.append(applicant_report)
@@ -3100,26 +3722,75 @@ END OF LOG
             Union[dict, str]: Report data as dictionary if no export_format specified,
                               otherwise path to the exported file.
         """
-        # Use unified data access so all features see the same set of scholarships
-        scholarships_data = self.get_scholarships_data()
+        try:
+            filter_key = frozenset(filters.items()) if filters else frozenset()
+        except TypeError:
+            # Unhashable filter values cannot be memoized
+            report_data = self._build_scholarship_report(filters.items())
+        else:
+            # Without in-memory scholarships the report reads the Scholarship
+            # table, which can change without bumping _report_version
+            report_version = (
+                self._report_version
+                if self.scholarships
+                else (self._report_version, _table_state(Scholarship))
+            )
+            report_data = self._scholarship_report_cache(filter_key, report_version)
 
-        # Apply filters if provided
-        if filters:
-            for key, value in filters.items():
-                scholarships_data = [
-                    s for s in scholarships_data if getattr(s, key, None) == value
-                ]
+        # Handle export if requested
+        if export_format:
+            _created_temp = False
+            if not output_path:
+                fd, output_path = tempfile.mkstemp(
+                    suffix=f".{export_format}", dir=_SCRATCH_DIR
+                )
+                os.close(fd)
+                _created_temp = True
+            try:
+                if export_format.lower() == "pdf":
+                    return self.export_to_pdf(output_path, filters)
+                if export_format.lower() == "xlsx":
+                    return self.export_to_excel(output_path, filters)
+                if export_format.lower() == "csv":
+                    return self.export_to_csv(output_path, filters)
+                raise ValueError(f"Unsupported export format: {export_format}")
+            except Exception:
+                # Don't leak the temp file we allocated when the export fails
+                if _created_temp:
+                    os.unlink(output_path)
+                raise
+
+        return report_data
 
-        # Generate report summary
-        total_amount = sum(s.amount for s in scholarships_data)
-        frequencies = {}
-        for s in scholarships_data:
-            frequencies[s.frequency] = frequencies.get(s.frequency, 0) + 1
+    def _build_scholarship_report(self, filter_items, report_version=None):
+        """Build the scholarship report summary used by generate_scholarship_report.
 
-        # Format scholarship details
+        Args:
+            filter_items: Iterable of (attribute, value) pairs to filter on
+            report_version: Engine report version, plus the Scholarship table
+                state when reading the database; only used as part of the
+                memoization key so cached summaries expire when scholarships change
+
+        Returns:
+            dict: Report summary and formatted scholarship details
+        """
+        filter_items = tuple(filter_items or ())
+
+        # Filter, aggregate and format in a single pass over the scholarships,
+        # with the bound append looked up once rather than per scholarship
+        total_amount = 0
+        frequencies = defaultdict(int)
         scholarship_details = []
-        for s in scholarships_data:
-            scholarship_details.append(
+        add_detail = scholarship_details.append
+        # Use unified data access so all features see the same set of scholarships
+        for s in self.get_scholarships_data():
+            if filter_items and any(
+                getattr(s, key, None) != value for key, value in filter_items
+            ):
+                continue
+            total_amount += s.amount
+            frequencies[s.frequency] += 1
+            add_detail(
                 {
                     "name": s.name,
                     "description": s.description,
@@ -3135,61 +3806,181 @@ END OF LOG
             )
 
         report_data = {
-            "total_scholarships": len(scholarships_data),
+            "total_scholarships": len(scholarship_details),
             "total_amount": total_amount,
-            "frequency_distribution": frequencies,
+            "frequency_distribution": dict(frequencies),
             "scholarships": scholarship_details,
         }
 
-        # Handle export if requested
-        if export_format:
-            if not output_path:
-                temp_file = tempfile.NamedTemporaryFile(
-                    delete=False, suffix=f".{export_format}"
-                )
-                output_path = temp_file.name
-                temp_file.close()
-            if export_format.lower() == "pdf":
-                return self.export_to_pdf(output_path, filters)
-            if export_format.lower() == "xlsx":
-                return self.export_to_excel(output_path, filters)
-            if export_format.lower() == "csv":
-                return self.export_to_csv(output_path, filters)
-            raise ValueError(f"Unsupported export format: {export_format}")
-
         return report_data
 
+    def submit_export(
+        self,
+        export_format: str,
+        output_path: str,
+        filters=None,
+        report_type: str = "general",
+        owner: Optional[str] = None,
+        **params,
+    ) -> str:
+        """Queue a report export on the worker pool for its format.
+
+        Finished exports that were never downloaded are deleted after
+        _EXPORT_TASK_TTL seconds.
+
+        Args:
+            export_format: One of 'pdf', 'xlsx' or 'csv'
+            output_path: Path where the exported file should be written
+            filters: Optional filters passed to generate_scholarship_report
+                (general reports only)
+            report_type: Report type key in EXPORTERS, e.g. 'general',
+                'donor', 'applicant' or 'disbursement'
+            owner: Who may fetch the export, e.g. a user or session id
+            **params: Keyword arguments for the report's exporter, e.g.
+                donor_name, student_id or scholarship_name
+
+        Returns:
+            str: Task id to poll with get_export_task
+
+        Raises:
+            ValueError: If the report type has no exporter for the format
+            RuntimeError: If _EXPORT_TASKS_MAX_PENDING exports are unfinished
+        """
+        try:
+            exporter, _ = EXPORTERS[(report_type, export_format)]
+        except KeyError:
+            raise ValueError(
+                f"Unsupported export format for {report_type} report: {export_format}"
+            ) from None
+        if report_type == "general":
+            params["filters"] = filters
+
+        task_id = uuid.uuid4().hex
+        with _EXPORT_TASKS_LOCK:
+            _sweep_export_tasks()
+            pending = sum(not task["future"].done() for task in _EXPORT_TASKS.values())
+            if pending >= _EXPORT_TASKS_MAX_PENDING:
+                raise RuntimeError("Too many exports in progress")
+            future = _EXPORT_EXECUTORS[export_format].submit(
+                _run_export, exporter, self, output_path=output_path, **params
+            )
+            _EXPORT_TASKS[task_id] = {
+                "future": future,
+                "owner": owner,
+                "created": time.monotonic(),
+                "report_type": report_type,
+                "export_format": export_format,
+                "output_path": output_path,
+            }
+        return task_id
+
+    @staticmethod
+    def get_export_task(task_id: str, remove: bool = False) -> Optional[Dict[str, Any]]:
+        """Look up a background export queued with submit_export.
+
+        Args:
+            task_id: Id returned by submit_export
+            remove: Drop the task from the registry once it is returned
+
+        Returns:
+            dict: Task entry, or None if the id is unknown
+        """
+        with _EXPORT_TASKS_LOCK:
+            _sweep_export_tasks()
+            if remove:
+                return _EXPORT_TASKS.pop(task_id, None)
+            return _EXPORT_TASKS.get(task_id)
+
+    def iter_csv_rows(self, report_type: str = "general", **params) -> Iterator[str]:
+        """Build a report and return its CSV export as an iterator of lines.
+
+        The report is generated before this returns, so lookup errors surface
+        before any response has started; rows are formatted lazily as the
+        iterator is consumed, e.g. by StreamingHttpResponse.
+
+        Args:
+            report_type: 'general', 'donor', 'applicant', 'disbursement' or
+                'prescreening'
+            **params: Keyword arguments for the report's generate_* method
+
+        Returns:
+            Iterator[str]: CSV-formatted lines
+        """
+        generators = {
+            "general": (self.generate_scholarship_report, self._scholarship_csv_rows),
+            "donor": (self.generate_donor_report, self._donor_report_csv_rows),
+            "applicant": (
+                self.generate_applicant_report,
+                self._applicant_report_csv_rows,
+            ),
+            "disbursement": (
+                self.generate_disbursement_report,
+                self._disbursement_report_csv_rows,
+            ),
+            "prescreening": (
+                self.generate_prescreening_report,
+                self._prescreening_report_csv_rows,
+            ),
+        }
+        try:
+            generate, csv_rows = generators[report_type]
+        except KeyError:
+            raise ValueError(f"Unsupported report type: {report_type}") from None
+        if report_type == "donor":
+            params.setdefault("fields", _DONOR_EXPORT_FIELDS)
+        report_data = generate(**params)
+        if report_type == "applicant" and not report_data:
+            raise ValueError("Applicant not found")
+
+        return _csv_lines(csv_rows(report_data))
+
     # Export Methods for PDF, Excel, CSV meeting the requirement SFWE504_3-LLR-3, SFWE504_3-LLR-11, and SFWE504_3-LLR-33
     def export_to_pdf(self, output_path: str, filters=None) -> str:
         """Export scholarships data to PDF format."""
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import (
+            SimpleDocTemplate,
+            Paragraph,
+            Table,
+            TableStyle,
+            Spacer,
+        )
+        from .pdf_rendering import bullet_list, sample_styles
+
         report_data = self.generate_scholarship_report(filters)
 
         doc = SimpleDocTemplate(output_path, pagesize=letter)
         story = []
 
         # Title and Summary
-        styles = getSampleStyleSheet()
-        story.append(Paragraph("Scholarship Report", styles["Heading1"]))
+        styles = sample_styles()
+        h1, h2, h3, h4, normal = (
+            styles["Heading1"],
+            styles["Heading2"],
+            styles["Heading3"],
+            styles["Heading4"],
+            styles["Normal"],
+        )
+        story.append(Paragraph("Scholarship Report", h1))
         story.append(
             Paragraph(
                 f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-                styles["Normal"],
+                normal,
             )
         )
         story.append(
             Paragraph(
                 f"Total Scholarships: {report_data['total_scholarships']}",
-                styles["Normal"],
+                normal,
             )
         )
         story.append(
-            Paragraph(
-                f"Total Amount: ${report_data['total_amount']:,.2f}", styles["Normal"]
-            )
+            Paragraph(f"Total Amount: ${report_data['total_amount']:,.2f}", normal)
         )
 
         # Frequency Distribution
-        story.append(Paragraph("Frequency Distribution:", styles["Heading2"]))
+        story.append(Paragraph("Frequency Distribution:", h2))
         freq_data = [
             [freq, count]
             for freq, count in report_data["frequency_distribution"].items()
@@ -3208,29 +3999,22 @@ END OF LOG
                 )
             )
             story.append(freq_table)
-        story.append(Paragraph("<br/><br/>", styles["Normal"]))
+        story.append(Spacer(1, 24))
 
         # Scholarships Details
-        story.append(Paragraph("Scholarship Details:", styles["Heading2"]))
+        story.append(Paragraph("Scholarship Details:", h2))
         for scholarship in report_data["scholarships"]:
             # Scholarship Header
-            story.append(Paragraph(f"<br/>{scholarship['name']}", styles["Heading3"]))
-            story.append(
-                Paragraph(f"Amount: ${scholarship['amount']:,.2f}", styles["Normal"])
-            )
-            story.append(
-                Paragraph(f"Deadline: {scholarship['deadline']}", styles["Normal"])
-            )
-            story.append(
-                Paragraph(f"Frequency: {scholarship['frequency']}", styles["Normal"])
-            )
+            story.append(Spacer(1, 12))
+            story.append(Paragraph(scholarship["name"], h3))
+            story.append(Paragraph(f"Amount: ${scholarship['amount']:,.2f}", normal))
+            story.append(Paragraph(f"Deadline: {scholarship['deadline']}", normal))
+            story.append(Paragraph(f"Frequency: {scholarship['frequency']}", normal))
 
             # Donor/Sponsor Information
             donor_info = scholarship.get("donor", {})
             if donor_info:
-                story.append(
-                    Paragraph("Donor/Sponsor Information:", styles["Heading4"])
-                )
+                story.append(Paragraph("Donor/Sponsor Information:", h4))
                 donor_name = donor_info.get("name", "N/A")
                 donor_contact = donor_info.get("contact", "N/A")
                 donor_org = donor_info.get(
@@ -3242,68 +4026,90 @@ END OF LOG
                 )
                 donor_address = donor_info.get("address", "N/A")
 
-                story.append(Paragraph(f"Name: {donor_name}", styles["Normal"]))
+                story.append(Paragraph(f"Name: {donor_name}", normal))
                 if donor_contact != "N/A":
-                    story.append(
-                        Paragraph(f"Contact: {donor_contact}", styles["Normal"])
-                    )
+                    story.append(Paragraph(f"Contact: {donor_contact}", normal))
                 if donor_email != "N/A" and donor_email != donor_contact:
-                    story.append(Paragraph(f"Email: {donor_email}", styles["Normal"]))
+                    story.append(Paragraph(f"Email: {donor_email}", normal))
                 if donor_phone != "N/A":
-                    story.append(Paragraph(f"Phone: {donor_phone}", styles["Normal"]))
+                    story.append(Paragraph(f"Phone: {donor_phone}", normal))
                 if donor_address != "N/A":
-                    story.append(
-                        Paragraph(f"Address: {donor_address}", styles["Normal"])
-                    )
+                    story.append(Paragraph(f"Address: {donor_address}", normal))
 
             # Description
-            story.append(Paragraph("Description:", styles["Heading4"]))
-            story.append(Paragraph(scholarship["description"], styles["Normal"]))
+            story.append(Paragraph("Description:", h4))
+            story.append(Paragraph(scholarship["description"], normal))
 
             # Eligibility Criteria
-            story.append(Paragraph("Eligibility Criteria:", styles["Heading4"]))
-            for criterion in scholarship["eligibility"]:
-                story.append(Paragraph(f"• {criterion}", styles["Normal"]))
+            story.append(Paragraph("Eligibility Criteria:", h4))
+            if scholarship["eligibility"]:
+                story.append(bullet_list(scholarship["eligibility"], normal))
 
             # Requirements
-            story.append(Paragraph("Disbursement Requirements:", styles["Heading4"]))
-            for req in scholarship["requirements"]:
-                story.append(Paragraph(f"• {req}", styles["Normal"]))
+            story.append(Paragraph("Disbursement Requirements:", h4))
+            if scholarship["requirements"]:
+                story.append(bullet_list(scholarship["requirements"], normal))
 
-            story.append(Paragraph("<br/>", styles["Normal"]))
+            story.append(Spacer(1, 12))
 
         doc.build(story)
         return output_path
 
-    def export_to_excel(self, output_path: str, filters=None) -> str:
-        """Export scholarships data to Excel format."""
+    def export_to_excel(self, output_path: str, filters=None, backend=None) -> str:
+        """Export scholarships data to Excel format.
+
+        Args:
+            output_path: Path where to save the Excel file
+            filters: Optional filters passed to generate_scholarship_report
+            backend: "openpyxl" (the default) or "xlsxwriter". xlsxwriter
+                serializes plain tabular rows faster but is not a project
+                requirement, so it is only used when asked for and installed.
+
+        Returns:
+            str: Path to the generated Excel file
+        """
+        from openpyxl import Workbook
+
+        if backend is None:
+            backend = "openpyxl"
+        if backend not in ("xlsxwriter", "openpyxl"):
+            raise ValueError(f"Unsupported Excel backend: {backend}")
+
         report_data = self.generate_scholarship_report(filters)
 
-        wb = Workbook()
+        if backend == "xlsxwriter":
+            return self._export_to_excel_xlsxwriter(report_data, output_path)
+
+        wb = Workbook(write_only=True)
 
         # Summary Sheet
-        ws_summary = wb.active
-        ws_summary.title = "Summary"
-        ws_summary["A1"] = "Scholarship Report Summary"
-        ws_summary["A2"] = "Generated on:"
-        ws_summary["B2"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        ws_summary["A3"] = "Total Scholarships:"
-        ws_summary["B3"] = report_data["total_scholarships"]
-        ws_summary["A4"] = "Total Amount:"
-        ws_summary["B4"] = f"${report_data['total_amount']:,.2f}"
+        ws_summary = wb.create_sheet("Summary")
+        _apply_column_widths(ws_summary, {1: 28, 2: 22})
+        ws_summary.append(["Scholarship Report Summary"])
+        ws_summary.append(
+            ["Generated on:", datetime.now().strftime("%Y-%m-%d %H:%M:%S")]
+        )
+        ws_summary.append(["Total Scholarships:", report_data["total_scholarships"]])
+        ws_summary.append(
+            [
+                "Total Amount:",
+                _currency_cell(ws_summary, float(report_data["total_amount"])),
+            ]
+        )
+        ws_summary.append([])
 
         # Frequency Distribution
-        ws_summary["A6"] = "Frequency Distribution"
-        ws_summary["A7"] = "Frequency"
-        ws_summary["B7"] = "Count"
-        row = 8
+        ws_summary.append(["Frequency Distribution"])
+        ws_summary.append(["Frequency", "Count"])
         for freq, count in report_data["frequency_distribution"].items():
-            ws_summary[f"A{row}"] = freq
-            ws_summary[f"B{row}"] = count
-            row += 1
+            ws_summary.append([freq, count])
 
         # Scholarships Sheet
         ws_details = wb.create_sheet("Scholarship Details")
+        _apply_column_widths(
+            ws_details,
+            {1: 35, 2: 15, 3: 12, 4: 12, 5: 50, 6: 30, 7: 30, 8: 30, 9: 18},
+        )
         headers = [
             "Name",
             "Amount",
@@ -3315,15 +4121,9 @@ END OF LOG
             "Donor Email",
             "Donor Phone",
         ]
-        for col, header in enumerate(headers, 1):
-            cell = ws_details.cell(row=1, column=col)
-            cell.value = header
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(
-                start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"
-            )
+        ws_details.append(_header_row(ws_details, headers))
 
-        for row, scholarship in enumerate(report_data["scholarships"], 2):
+        for scholarship in report_data["scholarships"]:
             donor_info = scholarship.get("donor", {})
             donor_name = donor_info.get("name", "N/A") if donor_info else "N/A"
             donor_contact = donor_info.get("contact", "N/A") if donor_info else "N/A"
@@ -3336,532 +4136,435 @@ END OF LOG
             )
             donor_phone = donor_info.get("phone", "N/A") if donor_info else "N/A"
 
-            ws_details.cell(row=row, column=1, value=scholarship["name"])
-            ws_details.cell(row=row, column=2, value=f"${scholarship['amount']:,.2f}")
-            ws_details.cell(row=row, column=3, value=scholarship["deadline"])
-            ws_details.cell(row=row, column=4, value=scholarship["frequency"])
-            ws_details.cell(row=row, column=5, value=scholarship["description"])
-            ws_details.cell(row=row, column=6, value=donor_name)
-            ws_details.cell(row=row, column=7, value=donor_contact)
-            ws_details.cell(row=row, column=8, value=donor_email)
-            ws_details.cell(row=row, column=9, value=donor_phone)
-
-        # Adjust column widths
-        for ws in [ws_summary, ws_details]:
-            for col in ws.columns:
-                max_length = 0
-                for cell in col:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                ws.column_dimensions[chr(64 + col[0].column)].width = min(
-                    max_length + 2, 50
-                )
+            ws_details.append(
+                [
+                    scholarship["name"],
+                    _currency_cell(ws_details, float(scholarship["amount"])),
+                    _date_cell(ws_details, scholarship["deadline"]),
+                    scholarship["frequency"],
+                    scholarship["description"],
+                    donor_name,
+                    donor_contact,
+                    donor_email,
+                    donor_phone,
+                ]
+            )
 
         wb.save(output_path)
         return output_path
 
-    def export_to_csv(self, output_path: str, filters=None) -> str:
-        """Export scholarships data to CSV format."""
-        report_data = self.generate_scholarship_report(filters)
+    def _export_to_excel_xlsxwriter(self, report_data, output_path: str) -> str:
+        """Write the scholarship report with xlsxwriter in constant-memory mode.
 
-        with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.writer(csvfile)
+        Mirrors the openpyxl layout of export_to_excel.
+        """
+        import xlsxwriter
+
+        wb = xlsxwriter.Workbook(
+            output_path, {"constant_memory": True, "strings_to_numbers": False}
+        )
+        header_format = wb.add_format({"bold": True, "bg_color": "#CCCCCC"})
+        currency_format = wb.add_format({"num_format": "$#,##0.00"})
+        date_format = wb.add_format({"num_format": "yyyy-mm-dd"})
 
-            # Write summary
-            writer.writerow(["Scholarship Report Summary"])
-            writer.writerow(
-                ["Generated on:", datetime.now().strftime("%Y-%m-%d %H:%M:%S")]
+        # Summary Sheet
+        ws_summary = wb.add_worksheet("Summary")
+        ws_summary.set_column(0, 0, 28)
+        ws_summary.set_column(1, 1, 22)
+        ws_summary.write_string(0, 0, "Scholarship Report Summary")
+        ws_summary.write_row(
+            1, 0, ["Generated on:", datetime.now().strftime("%Y-%m-%d %H:%M:%S")]
+        )
+        ws_summary.write_row(
+            2, 0, ["Total Scholarships:", report_data["total_scholarships"]]
+        )
+        ws_summary.write_string(3, 0, "Total Amount:")
+        ws_summary.write_number(
+            3, 1, float(report_data["total_amount"]), currency_format
+        )
+
+        # Frequency Distribution
+        ws_summary.write_string(5, 0, "Frequency Distribution")
+        ws_summary.write_row(6, 0, ["Frequency", "Count"])
+        for row_idx, (freq, count) in enumerate(
+            report_data["frequency_distribution"].items(), 7
+        ):
+            ws_summary.write_row(row_idx, 0, [freq, count])
+
+        # Scholarships Sheet
+        ws_details = wb.add_worksheet("Scholarship Details")
+        for col, width in enumerate((35, 15, 12, 12, 50, 30, 30, 30, 18)):
+            ws_details.set_column(col, col, width)
+        headers = [
+            "Name",
+            "Amount",
+            "Deadline",
+            "Frequency",
+            "Description",
+            "Donor Name",
+            "Donor Contact",
+            "Donor Email",
+            "Donor Phone",
+        ]
+        ws_details.write_row(0, 0, headers, header_format)
+
+        for row_idx, scholarship in enumerate(report_data["scholarships"], 1):
+            donor_info = scholarship.get("donor", {})
+            donor_name = donor_info.get("name", "N/A") if donor_info else "N/A"
+            donor_contact = donor_info.get("contact", "N/A") if donor_info else "N/A"
+            donor_email = (
+                donor_info.get(
+                    "email", donor_contact if "@" in str(donor_contact) else "N/A"
+                )
+                if donor_info
+                else "N/A"
+            )
+            donor_phone = donor_info.get("phone", "N/A") if donor_info else "N/A"
+
+            ws_details.write_string(row_idx, 0, scholarship["name"])
+            ws_details.write_number(
+                row_idx, 1, float(scholarship["amount"]), currency_format
             )
-            writer.writerow(["Total Scholarships:", report_data["total_scholarships"]])
-            writer.writerow(["Total Amount:", f"${report_data['total_amount']:,.2f}"])
-            writer.writerow([])
-
-            # Write frequency distribution
-            writer.writerow(["Frequency Distribution"])
-            writer.writerow(["Frequency", "Count"])
-            for freq, count in report_data["frequency_distribution"].items():
-                writer.writerow([freq, count])
-            writer.writerow([])
-
-            # Write scholarship details
-            writer.writerow(["Scholarship Details"])
-            writer.writerow(
+            deadline = _report_date(scholarship["deadline"])
+            if isinstance(deadline, datetime):
+                ws_details.write_datetime(row_idx, 2, deadline, date_format)
+            else:
+                ws_details.write_string(row_idx, 2, deadline)
+            ws_details.write_row(
+                row_idx,
+                3,
                 [
-                    "Name",
-                    "Amount",
-                    "Deadline",
-                    "Frequency",
-                    "Description",
-                    "Eligibility Criteria",
-                    "Requirements",
-                    "Donor Name",
-                    "Donor Contact",
-                    "Donor Email",
-                    "Donor Phone",
-                ]
+                    scholarship["frequency"],
+                    scholarship["description"],
+                    donor_name,
+                    donor_contact,
+                    donor_email,
+                    donor_phone,
+                ],
             )
 
-            for scholarship in report_data["scholarships"]:
-                donor_info = scholarship.get("donor", {})
-                donor_name = donor_info.get("name", "N/A") if donor_info else "N/A"
-                donor_contact = (
-                    donor_info.get("contact", "N/A") if donor_info else "N/A"
-                )
-                donor_email = (
-                    donor_info.get(
-                        "email", donor_contact if "@" in str(donor_contact) else "N/A"
-                    )
-                    if donor_info
-                    else "N/A"
-                )
-                donor_phone = donor_info.get("phone", "N/A") if donor_info else "N/A"
+        wb.close()
+        return output_path
 
-                writer.writerow(
-                    [
-                        scholarship["name"],
-                        f"${scholarship['amount']:,.2f}",
-                        scholarship["deadline"],
-                        scholarship["frequency"],
-                        scholarship["description"],
-                        "; ".join(scholarship["eligibility"]),
-                        "; ".join(scholarship["requirements"]),
-                        donor_name,
-                        donor_contact,
-                        donor_email,
-                        donor_phone,
-                    ]
-                )
+    def export_to_csv(self, output_path: str, filters=None) -> str:
+        """Export scholarships data to CSV format."""
+        report_data = self.generate_scholarship_report(filters)
+
+        with open(
+            output_path,
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=_EXPORT_BUFFER_SIZE,
+        ) as csvfile:
+            csv.writer(csvfile).writerows(self._scholarship_csv_rows(report_data))
 
         return output_path
 
+    @staticmethod
+    def _scholarship_csv_rows(report_data):
+        """Yield the CSV rows of a general scholarship report."""
+
+        def detail_row(scholarship):
+            donor_info = scholarship.get("donor", {})
+            donor_name = donor_info.get("name", "N/A") if donor_info else "N/A"
+            donor_contact = donor_info.get("contact", "N/A") if donor_info else "N/A"
+            donor_email = (
+                donor_info.get(
+                    "email", donor_contact if "@" in str(donor_contact) else "N/A"
+                )
+                if donor_info
+                else "N/A"
+            )
+            donor_phone = donor_info.get("phone", "N/A") if donor_info else "N/A"
+            return [
+                scholarship["name"],
+                f"${scholarship['amount']:,.2f}",
+                scholarship["deadline"],
+                scholarship["frequency"],
+                scholarship["description"],
+                "; ".join(scholarship["eligibility"]),
+                "; ".join(scholarship["requirements"]),
+                donor_name,
+                donor_contact,
+                donor_email,
+                donor_phone,
+            ]
+
+        # Write summary
+        yield from [
+            ["Scholarship Report Summary"],
+            ["Generated on:", datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
+            ["Total Scholarships:", report_data["total_scholarships"]],
+            ["Total Amount:", f"${report_data['total_amount']:,.2f}"],
+            [],
+        ]
+
+        # Write frequency distribution
+        yield from [["Frequency Distribution"], ["Frequency", "Count"]]
+        yield from report_data["frequency_distribution"].items()
+        yield []
+
+        # Write scholarship details
+        yield ["Scholarship Details"]
+        yield [
+            "Name",
+            "Amount",
+            "Deadline",
+            "Frequency",
+            "Description",
+            "Eligibility Criteria",
+            "Requirements",
+            "Donor Name",
+            "Donor Contact",
+            "Donor Email",
+            "Donor Phone",
+        ]
+        yield from [
+            detail_row(scholarship) for scholarship in report_data["scholarships"]
+        ]
+
     def export_applicant_report_to_pdf(
         self, student_id: str = None, netid: str = None, output_path: str = None
     ) -> str:
         """Export applicant report to PDF format."""
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import (
+            SimpleDocTemplate,
+            Paragraph,
+            Table,
+            TableStyle,
+            Spacer,
+        )
+        from .pdf_rendering import render_applicant_pdf, sample_styles
+
         report_data = self.generate_applicant_report(student_id, netid)
         if not report_data:
             raise ValueError("Applicant not found")
 
-        # Check if this is a multi-applicant report or single applicant
-        is_multi_applicant = "applicants" in report_data
+        # Single applicant reports are rendered by the shared module-level helper
+        if "applicants" not in report_data:
+            return render_applicant_pdf(report_data, output_path)
 
-        # Use landscape orientation for the multi-applicant summary; portrait otherwise
+        # Use landscape orientation for the multi-applicant summary
         try:
             from reportlab.lib.pagesizes import landscape, letter as _letter
 
-            pagesize = landscape(_letter) if is_multi_applicant else _letter
+            pagesize = landscape(_letter)
         except Exception:
             # Fallback to portrait letter if landscape import not available
             pagesize = letter
 
         doc = SimpleDocTemplate(output_path, pagesize=pagesize)
         story = []
-        styles = getSampleStyleSheet()
+        styles = sample_styles()
+        h1, h2, normal = styles["Heading1"], styles["Heading2"], styles["Normal"]
 
-        if is_multi_applicant:
-            # Multi-applicant summary report
-            story.append(Paragraph(f"All Applicants Report", styles["Heading1"]))
-            story.append(
-                Paragraph(
-                    f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-                    styles["Normal"],
-                )
-            )
-            story.append(Paragraph("<br/>", styles["Normal"]))
-
-            # Summary statistics
-            story.append(Paragraph("Summary Statistics", styles["Heading2"]))
-            summary_data = [
-                ["Total Applicants:", str(report_data["total_applicants"])],
-                [
-                    "Total Scholarship Awards:",
-                    str(report_data["summary"]["total_scholarship_awards"]),
-                ],
-                [
-                    "Total Scholarship Amount:",
-                    f"${report_data['summary']['total_scholarship_amount']:,.2f}",
-                ],
-                ["Average GPA:", f"{report_data['summary']['average_gpa']:.2f}"],
-            ]
-            summary_table = Table(summary_data)
-            summary_table.setStyle(
-                TableStyle(
-                    [
-                        ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                        ("BACKGROUND", (0, 0), (0, -1), colors.grey),
-                        ("TEXTCOLOR", (0, 0), (0, -1), colors.whitesmoke),
-                    ]
-                )
+        # Multi-applicant summary report
+        story.append(Paragraph(f"All Applicants Report", h1))
+        story.append(
+            Paragraph(
+                f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                normal,
             )
-            story.append(summary_table)
-            story.append(Paragraph("<br/>", styles["Normal"]))
+        )
+        story.append(Spacer(1, 12))
 
-            # Individual applicant summaries
-            story.append(Paragraph("Individual Applicants", styles["Heading2"]))
-            applicant_summary_data = [
+        # Summary statistics
+        story.append(Paragraph("Summary Statistics", h2))
+        summary_data = [
+            ["Total Applicants:", str(report_data["total_applicants"])],
+            [
+                "Total Scholarship Awards:",
+                str(report_data["summary"]["total_scholarship_awards"]),
+            ],
+            [
+                "Total Scholarship Amount:",
+                f"${report_data['summary']['total_scholarship_amount']:,.2f}",
+            ],
+            ["Average GPA:", f"{report_data['summary']['average_gpa']:.2f}"],
+        ]
+        summary_table = Table(summary_data)
+        summary_table.setStyle(
+            TableStyle(
                 [
-                    "Name",
-                    "Student ID",
-                    "Major",
-                    "Minor",
-                    "GPA",
-                    "Academic Level",
-                    "Achievements (#)",
-                    "FAFSA",
-                    "EFC",
-                    "Income Range",
-                    "Essay Submissions (#)",
-                    "Awards",
-                    "Total Amount",
+                    ("GRID", (0, 0), (-1, -1), 1, colors.black),
+                    ("BACKGROUND", (0, 0), (0, -1), colors.grey),
+                    ("TEXTCOLOR", (0, 0), (0, -1), colors.whitesmoke),
                 ]
-            ]
-            for applicant in report_data["applicants"]:
-                achievements = applicant.get("achievements") or []
-                financial = applicant.get("financial_info") or {}
-                essays = applicant.get("essays") or []
-                applicant_summary_data.append(
-                    [
-                        applicant["personal_info"]["name"],
-                        applicant["personal_info"]["student_id"],
-                        applicant["academic_info"]["major"],
-                        applicant["academic_info"].get("minor") or "N/A",
-                        f"{applicant['academic_info']['gpa']:.2f}",
-                        applicant["academic_info"]["academic_level"],
-                        str(len(achievements)),
-                        "Yes" if financial.get("fafsa_submitted") else "No",
-                        financial.get("efc", 0),
-                        financial.get("household_income", "N/A"),
-                        str(len(essays)),
-                        str(applicant["scholarships"]["total_awards"]),
-                        f"${applicant['scholarships']['total_amount']:,.2f}",
-                    ]
-                )
-
-            applicant_table = Table(applicant_summary_data)
-            applicant_table.setStyle(
-                TableStyle(
-                    [
-                        ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                        ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                        ("FONTSIZE", (0, 0), (-1, -1), 8),
-                    ]
-                )
             )
-            story.append(applicant_table)
+        )
+        story.append(summary_table)
+        story.append(Spacer(1, 12))
 
-        else:
-            # Single applicant detailed report (existing logic)
-            story.append(
-                Paragraph(
-                    f"Applicant Report: {report_data['personal_info']['name']}",
-                    styles["Heading1"],
-                )
-            )
-            story.append(
-                Paragraph(
-                    f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-                    styles["Normal"],
-                )
+        # Individual applicant summaries
+        story.append(Paragraph("Individual Applicants", h2))
+        applicant_summary_data = [
+            [
+                "Name",
+                "Student ID",
+                "Major",
+                "Minor",
+                "GPA",
+                "Academic Level",
+                "Achievements (#)",
+                "FAFSA",
+                "EFC",
+                "Income Range",
+                "Essay Submissions (#)",
+                "Awards",
+                "Total Amount",
+            ]
+        ]
+        for applicant in report_data["applicants"]:
+            achievements = applicant.get("achievements") or []
+            financial = applicant.get("financial_info") or {}
+            essays = applicant.get("essays") or []
+            applicant_summary_data.append(
+                [
+                    applicant["personal_info"]["name"],
+                    applicant["personal_info"]["student_id"],
+                    applicant["academic_info"]["major"],
+                    applicant["academic_info"].get("minor") or "N/A",
+                    f"{applicant['academic_info']['gpa']:.2f}",
+                    applicant["academic_info"]["academic_level"],
+                    str(len(achievements)),
+                    "Yes" if financial.get("fafsa_submitted") else "No",
+                    financial.get("efc", 0),
+                    financial.get("household_income", "N/A"),
+                    str(len(essays)),
+                    str(applicant["scholarships"]["total_awards"]),
+                    f"${applicant['scholarships']['total_amount']:,.2f}",
+                ]
             )
-            story.append(Paragraph("<br/>", styles["Normal"]))
 
-            # Personal and Academic Information
-            story.append(Paragraph("Personal Information", styles["Heading2"]))
-            personal_info = [
-                ["Student ID:", report_data["personal_info"]["student_id"]],
-                ["NetID:", report_data["personal_info"]["netid"]],
-                ["Major:", report_data["academic_info"]["major"]],
-                ["Minor:", report_data["academic_info"]["minor"] or "N/A"],
-                ["GPA:", f"{report_data['academic_info']['gpa']:.2f}"],
-                ["Academic Level:", report_data["academic_info"]["academic_level"]],
+        applicant_table = Table(applicant_summary_data)
+        applicant_table.setStyle(
+            TableStyle(
                 [
-                    "Expected Graduation:",
-                    report_data["academic_info"]["expected_graduation"].strftime(
-                        "%Y-%m-%d"
-                    ),
-                ],
-            ]
-            info_table = Table(personal_info)
-            info_table.setStyle(
-                TableStyle(
-                    [
-                        ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                        ("BACKGROUND", (0, 0), (0, -1), colors.grey),
-                        ("TEXTCOLOR", (0, 0), (0, -1), colors.whitesmoke),
-                    ]
-                )
+                    ("GRID", (0, 0), (-1, -1), 1, colors.black),
+                    ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+                    ("FONTSIZE", (0, 0), (-1, -1), 8),
+                ]
             )
-            story.append(info_table)
-            story.append(Paragraph("<br/>", styles["Normal"]))
-
-            # Academic Achievements
-            story.append(Paragraph("Academic Achievements", styles["Heading2"]))
-            if report_data.get("achievements"):
-                for achievement in report_data["achievements"]:
-                    if isinstance(achievement, dict):
-                        achievement_type = achievement.get("type", "Achievement")
-                        achievement_date = achievement.get("date")
-                        date_str = (
-                            achievement_date.strftime("%Y-%m-%d")
-                            if hasattr(achievement_date, "strftime")
-                            else str(achievement_date)
-                            if achievement_date
-                            else "N/A"
-                        )
-                        story.append(
-                            Paragraph(
-                                f"• {achievement_type} - {date_str}", styles["Normal"]
-                            )
-                        )
-                        if achievement.get("description"):
-                            story.append(
-                                Paragraph(
-                                    f"  {achievement['description']}", styles["Normal"]
-                                )
-                            )
-                    else:
-                        story.append(
-                            Paragraph(f"• {str(achievement)}", styles["Normal"])
-                        )
-            else:
-                story.append(Paragraph("No achievements recorded", styles["Normal"]))
-            story.append(Paragraph("<br/>", styles["Normal"]))
+        )
+        story.append(applicant_table)
 
-            # Financial Information
-            story.append(Paragraph("Financial Information", styles["Heading2"]))
-            financial_info = report_data.get("financial_info", {})
-            if isinstance(financial_info, dict):
-                story.append(
-                    Paragraph(
-                        f"FAFSA Submitted: {financial_info.get('fafsa_submitted', 'N/A')}",
-                        styles["Normal"],
-                    )
-                )
-                story.append(
-                    Paragraph(
-                        f"Expected Family Contribution: ${financial_info.get('efc', 0):,}",
-                        styles["Normal"],
-                    )
-                )
-                story.append(
-                    Paragraph(
-                        f"Household Income Range: {financial_info.get('household_income', 'N/A')}",
-                        styles["Normal"],
-                    )
-                )
-            else:
-                story.append(
-                    Paragraph("Financial information not available", styles["Normal"])
-                )
-            story.append(Paragraph("<br/>", styles["Normal"]))
-
-            # Current Aid
-            if isinstance(financial_info, dict) and financial_info.get("current_aid"):
-                story.append(Paragraph("Current Financial Aid:", styles["Heading3"]))
-                for aid in financial_info["current_aid"]:
-                    if isinstance(aid, dict):
-                        story.append(
-                            Paragraph(
-                                f"• {aid.get('type', 'Aid')}: ${aid.get('amount', 0):,}",
-                                styles["Normal"],
-                            )
-                        )
-                    else:
-                        story.append(Paragraph(f"• {str(aid)}", styles["Normal"]))
-            story.append(Paragraph("<br/>", styles["Normal"]))
-
-            # Essay Submissions (new section)
-            story.append(Paragraph("Essay Submissions", styles["Heading2"]))
-            essays_list = report_data.get("essays") or []
-            if essays_list:
-                for es in essays_list:
-                    if isinstance(es, dict):
-                        sub_date = es.get("submission_date")
-                        if hasattr(sub_date, "strftime"):
-                            sub_date_str = sub_date.strftime("%Y-%m-%d")
-                        else:
-                            sub_date_str = str(sub_date) if sub_date else "N/A"
-                        content_preview = (es.get("content", "") or "")[:120]
-                        story.append(
-                            Paragraph(
-                                f"• {es.get('prompt', 'Essay')} ({sub_date_str})",
-                                styles["Normal"],
-                            )
-                        )
-                        if content_preview:
-                            story.append(
-                                Paragraph(f"  {content_preview}", styles["Normal"])
-                            )
-                story.append(Paragraph("<br/>", styles["Normal"]))
-            else:
-                story.append(
-                    Paragraph("No essay submissions recorded", styles["Normal"])
-                )
-                story.append(Paragraph("<br/>", styles["Normal"]))
+        doc.build(story)
+        return output_path
 
-            # Scholarship Awards
-            story.append(Paragraph("Scholarship Awards", styles["Heading2"]))
-            story.append(
-                Paragraph(
-                    f"Total Awards: {report_data['scholarships']['total_awards']} "
-                    f"(${report_data['scholarships']['total_amount']:,})",
-                    styles["Normal"],
-                )
-            )
+    def export_applicant_reports_to_pdf_batch(
+        self, student_ids: List[str], output_dir: str, max_workers: int = None
+    ) -> List[str]:
+        """Export one PDF per applicant, rendering them in parallel processes.
 
-            for award in report_data["scholarships"]["detailed_awards"]:
-                story.append(
-                    Paragraph(
-                        f"Award: {award.get('scholarship_name', 'Unknown')}",
-                        styles["Heading3"],
-                    )
-                )
-                story.append(
-                    Paragraph(
-                        f"Amount: ${award.get('award_amount', 0):,}", styles["Normal"]
-                    )
-                )
-                story.append(
-                    Paragraph(f"Status: {award.get('status', 'N/A')}", styles["Normal"])
-                )
-                award_date = award.get("award_date")
-                if hasattr(award_date, "strftime"):
-                    story.append(
-                        Paragraph(
-                            f"Award Date: {award_date.strftime('%Y-%m-%d')}",
-                            styles["Normal"],
-                        )
-                    )
-                elif award_date:
-                    story.append(
-                        Paragraph(f"Award Date: {str(award_date)}", styles["Normal"])
-                    )
-                # (Per-award raw evaluations removed; consolidated table provided below)
-
-                if award.get("committee_feedback"):
-                    story.append(Paragraph("Committee Feedback:", styles["Heading4"]))
-                    for feedback in award["committee_feedback"]:
-                        if isinstance(feedback, dict):
-                            story.append(
-                                Paragraph(
-                                    f"• {feedback.get('member', 'Member')}: {feedback.get('comments', 'No comments')}",
-                                    styles["Normal"],
-                                )
-                            )
-                        else:
-                            story.append(
-                                Paragraph(f"• {str(feedback)}", styles["Normal"])
-                            )
-                story.append(Paragraph("<br/>", styles["Normal"]))
+        Report data is gathered on the calling thread (it needs the database);
+        only the ReportLab rendering is handed to worker processes.
 
-            # Consolidated Essay Evaluation Section
-            evaluations = report_data.get("essay_evaluations", [])
-            story.append(
-                Paragraph("Consolidated Essay Evaluations", styles["Heading2"])
+        Args:
+            student_ids: Student IDs to export
+            output_dir: Directory the PDFs are written to
+            max_workers: Worker process count (defaults to the CPU count)
+
+        Returns:
+            list: Paths of the generated PDFs, in student_ids order. Unknown
+                applicants are skipped.
+        """
+        from .pdf_rendering import render_applicant_pdf
+
+        os.makedirs(output_dir, exist_ok=True)
+        report_datas = []
+        output_paths = []
+        for student_id in student_ids:
+            report_data = self.generate_applicant_report(student_id=student_id)
+            if not report_data:
+                logger.warning(f"Skipping unknown applicant {student_id}")
+                continue
+            report_datas.append(report_data)
+            output_paths.append(
+                os.path.join(output_dir, f"applicant_report_{student_id}.pdf")
             )
-            if evaluations:
-                eval_table_data = [
-                    [
-                        "Source",
-                        "Scholarship",
-                        "Prompt",
-                        "Score",
-                        "Reviewer",
-                        "Date",
-                        "Feedback",
-                    ]
-                ]
-                for ev in evaluations:
-                    date_obj = ev.get("date")
-                    date_str = (
-                        date_obj.strftime("%Y-%m-%d")
-                        if hasattr(date_obj, "strftime")
-                        else (str(date_obj) if date_obj else "")
-                    )
-                    eval_table_data.append(
-                        [
-                            ev.get("source", ""),
-                            ev.get("scholarship_name") or "-",
-                            ev.get("prompt", "")[:50],
-                            ev.get("score"),
-                            ev.get("reviewer"),
-                            date_str,
-                            (ev.get("feedback") or "")[:80],
-                        ]
-                    )
-                eval_table = Table(eval_table_data, repeatRows=1)
-                eval_table.setStyle(
-                    TableStyle(
-                        [
-                            ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-                            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                            ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
-                            ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                        ]
-                    )
-                )
-                story.append(eval_table)
-            else:
-                story.append(
-                    Paragraph("No essay evaluations available", styles["Normal"])
-                )
 
-        doc.build(story)
-        return output_path
+        if not report_datas:
+            return []
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(render_applicant_pdf, report_datas, output_paths))
 
     def export_applicant_report_to_excel(
         self, student_id: str = None, netid: str = None, output_path: str = None
     ) -> str:
         """Export applicant report to Excel format."""
+        from openpyxl import Workbook
+
+        title_font = _excel_styles()["title_font"]
+
         report_data = self.generate_applicant_report(student_id, netid)
         if not report_data:
             raise ValueError("Applicant not found")
 
-        wb = Workbook()
+        wb = Workbook(write_only=True)
 
         # Check if this is a multi-applicant report
         is_multi_applicant = "applicants" in report_data
 
         if is_multi_applicant:
             # Multi-applicant summary
-            ws_summary = wb.active
-            ws_summary.title = "Summary"
+            ws_summary = wb.create_sheet("Summary")
+            _apply_column_widths(ws_summary, {1: 28, 2: 18})
 
             # Summary statistics
-            ws_summary.cell(
-                row=1, column=1, value="All Applicants Summary"
-            ).font = Font(bold=True, size=14)
-            ws_summary.cell(row=3, column=1, value="Total Applicants").font = Font(
-                bold=True
+            ws_summary.append(
+                [_styled_cell(ws_summary, "All Applicants Summary", title_font)]
+            )
+            ws_summary.append([])
+            ws_summary.append(
+                [
+                    _styled_cell(ws_summary, "Total Applicants"),
+                    report_data["total_applicants"],
+                ]
             )
-            ws_summary.cell(row=3, column=2, value=report_data["total_applicants"])
-            ws_summary.cell(
-                row=4, column=1, value="Total Scholarship Awards"
-            ).font = Font(bold=True)
-            ws_summary.cell(
-                row=4,
-                column=2,
-                value=report_data["summary"]["total_scholarship_awards"],
+            ws_summary.append(
+                [
+                    _styled_cell(ws_summary, "Total Scholarship Awards"),
+                    report_data["summary"]["total_scholarship_awards"],
+                ]
             )
-            ws_summary.cell(
-                row=5, column=1, value="Total Scholarship Amount"
-            ).font = Font(bold=True)
-            ws_summary.cell(
-                row=5,
-                column=2,
-                value=f"${report_data['summary']['total_scholarship_amount']:,.2f}",
+            ws_summary.append(
+                [
+                    _styled_cell(ws_summary, "Total Scholarship Amount"),
+                    f"${report_data['summary']['total_scholarship_amount']:,.2f}",
+                ]
             )
-            ws_summary.cell(row=6, column=1, value="Average GPA").font = Font(bold=True)
-            ws_summary.cell(
-                row=6, column=2, value=f"{report_data['summary']['average_gpa']:.2f}"
+            ws_summary.append(
+                [
+                    _styled_cell(ws_summary, "Average GPA"),
+                    f"{report_data['summary']['average_gpa']:.2f}",
+                ]
             )
 
             # Individual applicant list
             ws_applicants = wb.create_sheet("All Applicants")
+            _apply_column_widths(
+                ws_applicants,
+                {
+                    1: 25,
+                    2: 12,
+                    3: 12,
+                    4: 25,
+                    5: 20,
+                    6: 8,
+                    7: 16,
+                    8: 18,
+                    9: 8,
+                    10: 10,
+                    11: 16,
+                    12: 22,
+                    13: 14,
+                    14: 15,
+                },
+            )
             headers = [
                 "Name",
                 "Student ID",
@@ -3878,77 +4581,36 @@ END OF LOG
                 "Total Awards",
                 "Total Amount",
             ]
-            for col, header in enumerate(headers, 1):
-                cell = ws_applicants.cell(row=1, column=col, value=header)
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(
-                    start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"
-                )
+            ws_applicants.append(_header_row(ws_applicants, headers))
 
-            for row_idx, applicant in enumerate(report_data["applicants"], 2):
+            for applicant in report_data["applicants"]:
                 financial = applicant.get("financial_info") or {}
                 achievements = applicant.get("achievements") or []
                 essays = applicant.get("essays") or []
-                ws_applicants.cell(
-                    row=row_idx, column=1, value=applicant["personal_info"]["name"]
-                )
-                ws_applicants.cell(
-                    row=row_idx,
-                    column=2,
-                    value=applicant["personal_info"]["student_id"],
-                )
-                ws_applicants.cell(
-                    row=row_idx, column=3, value=applicant["personal_info"]["netid"]
-                )
-                ws_applicants.cell(
-                    row=row_idx, column=4, value=applicant["academic_info"]["major"]
-                )
-                ws_applicants.cell(
-                    row=row_idx,
-                    column=5,
-                    value=applicant["academic_info"]["minor"] or "N/A",
-                )
-                ws_applicants.cell(
-                    row=row_idx,
-                    column=6,
-                    value=f"{applicant['academic_info']['gpa']:.2f}",
-                )
-                ws_applicants.cell(
-                    row=row_idx,
-                    column=7,
-                    value=applicant["academic_info"]["academic_level"],
-                )
-                ws_applicants.cell(row=row_idx, column=8, value=len(achievements))
-                ws_applicants.cell(
-                    row=row_idx,
-                    column=9,
-                    value="Yes" if financial.get("fafsa_submitted") else "No",
-                )
-                ws_applicants.cell(
-                    row=row_idx, column=10, value=financial.get("efc", 0)
-                )
-                ws_applicants.cell(
-                    row=row_idx,
-                    column=11,
-                    value=financial.get("household_income", "N/A"),
-                )
-                ws_applicants.cell(row=row_idx, column=12, value=len(essays))
-                ws_applicants.cell(
-                    row=row_idx,
-                    column=13,
-                    value=applicant["scholarships"]["total_awards"],
-                )
-                ws_applicants.cell(
-                    row=row_idx,
-                    column=14,
-                    value=f"${applicant['scholarships']['total_amount']:,.2f}",
+                ws_applicants.append(
+                    [
+                        applicant["personal_info"]["name"],
+                        applicant["personal_info"]["student_id"],
+                        applicant["personal_info"]["netid"],
+                        applicant["academic_info"]["major"],
+                        applicant["academic_info"]["minor"] or "N/A",
+                        f"{applicant['academic_info']['gpa']:.2f}",
+                        applicant["academic_info"]["academic_level"],
+                        len(achievements),
+                        "Yes" if financial.get("fafsa_submitted") else "No",
+                        financial.get("efc", 0),
+                        financial.get("household_income", "N/A"),
+                        len(essays),
+                        applicant["scholarships"]["total_awards"],
+                        f"${applicant['scholarships']['total_amount']:,.2f}",
+                    ]
                 )
 
         else:
             # Single applicant detailed report (existing logic)
             # Personal Information Sheet
-            ws_personal = wb.active
-            ws_personal.title = "Personal Information"
+            ws_personal = wb.create_sheet("Personal Information")
+            _apply_column_widths(ws_personal, {1: 22, 2: 40})
 
             personal_info = [
                 ["Student Name", report_data["personal_info"]["name"]],
@@ -3960,83 +4622,61 @@ END OF LOG
                 ["Academic Level", report_data["academic_info"]["academic_level"]],
                 [
                     "Expected Graduation",
-                    report_data["academic_info"]["expected_graduation"].strftime(
-                        "%Y-%m-%d"
-                    ),
+                    report_data["academic_info"]["expected_graduation_str"],
                 ],
             ]
 
-            for row_idx, row in enumerate(personal_info, 1):
-                for col_idx, value in enumerate(row, 1):
-                    cell = ws_personal.cell(row=row_idx, column=col_idx, value=value)
-                    if col_idx == 1:
-                        cell.font = Font(bold=True)
+            for label, value in personal_info:
+                ws_personal.append([_styled_cell(ws_personal, label), value])
 
             # Academic History Sheet
             ws_academic = wb.create_sheet("Academic History")
+            _apply_column_widths(ws_academic, {1: 15, 2: 14, 3: 40, 4: 8})
             headers = ["Term", "Course Code", "Course Name", "Grade"]
-            for col, header in enumerate(headers, 1):
-                cell = ws_academic.cell(row=1, column=col, value=header)
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(
-                    start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"
-                )
+            ws_academic.append(_header_row(ws_academic, headers))
 
-            row = 2
             for term in report_data["academic_info"]["academic_history"]:
                 for course in term["courses"]:
-                    ws_academic.cell(row=row, column=1, value=term["term"])
-                    ws_academic.cell(row=row, column=2, value=course["code"])
-                    ws_academic.cell(row=row, column=3, value=course["name"])
-                    ws_academic.cell(row=row, column=4, value=course["grade"])
-                    row += 1
+                    ws_academic.append(
+                        [term["term"], course["code"], course["name"], course["grade"]]
+                    )
 
             # Scholarships Sheet
             ws_scholarships = wb.create_sheet("Scholarships")
+            _apply_column_widths(ws_scholarships, {1: 40, 2: 15, 3: 12, 4: 12})
             scholarship_headers = ["Scholarship Name", "Amount", "Status", "Award Date"]
-            for col, header in enumerate(scholarship_headers, 1):
-                cell = ws_scholarships.cell(row=1, column=col, value=header)
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(
-                    start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"
-                )
+            ws_scholarships.append(_header_row(ws_scholarships, scholarship_headers))
 
-            for row, award in enumerate(
-                report_data["scholarships"]["detailed_awards"], 2
-            ):
-                ws_scholarships.cell(row=row, column=1, value=award["scholarship_name"])
-                ws_scholarships.cell(
-                    row=row, column=2, value=f"${award['award_amount']:,}"
-                )
-                ws_scholarships.cell(row=row, column=3, value=award["status"])
-                ws_scholarships.cell(
-                    row=row, column=4, value=award["award_date"].strftime("%Y-%m-%d")
+            for award in report_data["scholarships"]["detailed_awards"]:
+                ws_scholarships.append(
+                    [
+                        award["scholarship_name"],
+                        f"${award['award_amount']:,}",
+                        award["status"],
+                        award["award_date_str"],
+                    ]
                 )
 
             # Essay Submissions Sheet (new)
             ws_submissions = wb.create_sheet("Essay Submissions")
+            _apply_column_widths(ws_submissions, {1: 40, 2: 16, 3: 50})
             sub_headers = ["Prompt", "Submission Date", "Content (Preview)"]
-            for col, header in enumerate(sub_headers, 1):
-                cell = ws_submissions.cell(row=1, column=col, value=header)
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(
-                    start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"
-                )
-            for r_idx, es in enumerate(report_data.get("essays", []), start=2):
+            ws_submissions.append(_header_row(ws_submissions, sub_headers))
+            for es in report_data.get("essays", []):
                 if isinstance(es, dict):
-                    sub_date = es.get("submission_date")
-                    if hasattr(sub_date, "strftime"):
-                        sub_date_str = sub_date.strftime("%Y-%m-%d")
-                    else:
-                        sub_date_str = str(sub_date) if sub_date else "N/A"
-                    ws_submissions.cell(row=r_idx, column=1, value=es.get("prompt", ""))
-                    ws_submissions.cell(row=r_idx, column=2, value=sub_date_str)
-                    ws_submissions.cell(
-                        row=r_idx, column=3, value=(es.get("content", "") or "")[:200]
+                    ws_submissions.append(
+                        [
+                            es.get("prompt", ""),
+                            es["submission_date_str"],
+                            (es.get("content", "") or "")[:200],
+                        ]
                     )
 
             # Essay Evaluations Sheet
             ws_evals = wb.create_sheet("Essay Evaluations")
+            _apply_column_widths(
+                ws_evals, {1: 14, 2: 35, 3: 40, 4: 8, 5: 20, 6: 12, 7: 50}
+            )
             eval_headers = [
                 "Source",
                 "Scholarship",
@@ -4046,50 +4686,20 @@ END OF LOG
                 "Date",
                 "Feedback",
             ]
-            for col, header in enumerate(eval_headers, 1):
-                cell = ws_evals.cell(row=1, column=col, value=header)
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(
-                    start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"
-                )
+            ws_evals.append(_header_row(ws_evals, eval_headers))
 
-            for row_idx, ev in enumerate(
-                report_data.get("essay_evaluations", []), start=2
-            ):
-                date_obj = ev.get("date")
-                date_str = (
-                    date_obj.strftime("%Y-%m-%d")
-                    if hasattr(date_obj, "strftime")
-                    else (str(date_obj) if date_obj else "")
-                )
-                ws_evals.cell(row=row_idx, column=1, value=ev.get("source"))
-                ws_evals.cell(
-                    row=row_idx, column=2, value=ev.get("scholarship_name") or "-"
+            for ev in report_data.get("essay_evaluations", []):
+                ws_evals.append(
+                    [
+                        ev.get("source"),
+                        ev.get("scholarship_name") or "-",
+                        ev.get("prompt"),
+                        ev.get("score"),
+                        ev.get("reviewer"),
+                        ev["date_str"],
+                        ev.get("feedback"),
+                    ]
                 )
-                ws_evals.cell(row=row_idx, column=3, value=ev.get("prompt"))
-                ws_evals.cell(row=row_idx, column=4, value=ev.get("score"))
-                ws_evals.cell(row=row_idx, column=5, value=ev.get("reviewer"))
-                ws_evals.cell(row=row_idx, column=6, value=date_str)
-                ws_evals.cell(row=row_idx, column=7, value=ev.get("feedback"))
-
-            # Adjust column widths
-            for ws in [
-                ws_personal,
-                ws_academic,
-                ws_scholarships,
-                ws_submissions,
-                ws_evals,
-            ]:
-                for col in ws.columns:
-                    max_length = 0
-                    for cell in col:
-                        try:
-                            max_length = max(max_length, len(str(cell.value)))
-                        except:
-                            pass
-                    ws.column_dimensions[chr(64 + col[0].column)].width = min(
-                        max_length + 2, 50
-                    )
 
         wb.save(output_path)
         return output_path
@@ -4102,153 +4712,138 @@ END OF LOG
         if not report_data:
             raise ValueError("Applicant not found")
 
-        import csv
+        with open(
+            output_path,
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=_EXPORT_BUFFER_SIZE,
+        ) as f:
+            csv.writer(f).writerows(self._applicant_report_csv_rows(report_data))
+
+        return output_path
 
+    @staticmethod
+    def _applicant_report_csv_rows(report_data):
+        """Yield the CSV rows of an applicant report."""
         # Check if this is a multi-applicant report
         is_multi_applicant = "applicants" in report_data
 
-        with open(output_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-
-            if is_multi_applicant:
-                # Multi-applicant summary CSV
-                writer.writerow(
-                    [
-                        "Student Name",
-                        "Student ID",
-                        "NetID",
-                        "Major",
-                        "Minor",
-                        "GPA",
-                        "Academic Level",
-                        "Achievements (#)",
-                        "FAFSA",
-                        "EFC",
-                        "Income Range",
-                        "Essay Submissions (#)",
-                        "Total Awards",
-                        "Total Scholarship Amount",
+        if is_multi_applicant:
+            # Multi-applicant summary CSV
+            yield [
+                "Student Name",
+                "Student ID",
+                "NetID",
+                "Major",
+                "Minor",
+                "GPA",
+                "Academic Level",
+                "Achievements (#)",
+                "FAFSA",
+                "EFC",
+                "Income Range",
+                "Essay Submissions (#)",
+                "Total Awards",
+                "Total Scholarship Amount",
+            ]
+            for applicant in report_data["applicants"]:
+                financial = applicant.get("financial_info") or {}
+                achievements = applicant.get("achievements") or []
+                essays = applicant.get("essays") or []
+                yield [
+                    applicant["personal_info"]["name"],
+                    applicant["personal_info"]["student_id"],
+                    applicant["personal_info"]["netid"],
+                    applicant["academic_info"]["major"],
+                    applicant["academic_info"]["minor"] or "N/A",
+                    f"{applicant['academic_info']['gpa']:.2f}",
+                    applicant["academic_info"]["academic_level"],
+                    len(achievements),
+                    "Yes" if financial.get("fafsa_submitted") else "No",
+                    financial.get("efc", 0),
+                    financial.get("household_income", "N/A"),
+                    len(essays),
+                    applicant["scholarships"]["total_awards"],
+                    f"${applicant['scholarships']['total_amount']:,.2f}",
+                ]
+        else:
+            # Single applicant with essay evaluations (existing logic)
+            yield [
+                "Row Type",
+                "Student Name",
+                "Student ID",
+                "NetID",
+                "Major",
+                "Minor",
+                "GPA",
+                "Academic Level",
+                "Prompt",
+                "Submission Date/ Eval Date",
+                "Source",
+                "Scholarship",
+                "Score",
+                "Reviewer",
+                "Feedback",
+            ]
+            # First add essay submissions
+            for es in report_data.get("essays") or []:
+                if isinstance(es, dict):
+                    yield [
+                        "Submission",
+                        report_data["personal_info"]["name"],
+                        report_data["personal_info"]["student_id"],
+                        report_data["personal_info"]["netid"],
+                        report_data["academic_info"]["major"],
+                        report_data["academic_info"]["minor"] or "N/A",
+                        f"{report_data['academic_info']['gpa']:.2f}",
+                        report_data["academic_info"]["academic_level"],
+                        es.get("prompt", ""),
+                        es["submission_date_str"],
+                        "Essay Submission",
+                        "-",
+                        "-",
+                        "-",
+                        (es.get("content", "") or "")[:120],
                     ]
-                )
-                for applicant in report_data["applicants"]:
-                    financial = applicant.get("financial_info") or {}
-                    achievements = applicant.get("achievements") or []
-                    essays = applicant.get("essays") or []
-                    writer.writerow(
-                        [
-                            applicant["personal_info"]["name"],
-                            applicant["personal_info"]["student_id"],
-                            applicant["personal_info"]["netid"],
-                            applicant["academic_info"]["major"],
-                            applicant["academic_info"]["minor"] or "N/A",
-                            f"{applicant['academic_info']['gpa']:.2f}",
-                            applicant["academic_info"]["academic_level"],
-                            len(achievements),
-                            "Yes" if financial.get("fafsa_submitted") else "No",
-                            financial.get("efc", 0),
-                            financial.get("household_income", "N/A"),
-                            len(essays),
-                            applicant["scholarships"]["total_awards"],
-                            f"${applicant['scholarships']['total_amount']:,.2f}",
-                        ]
-                    )
-            else:
-                # Single applicant with essay evaluations (existing logic)
-                writer.writerow(
-                    [
-                        "Row Type",
-                        "Student Name",
-                        "Student ID",
-                        "NetID",
-                        "Major",
-                        "Minor",
-                        "GPA",
-                        "Academic Level",
-                        "Prompt",
-                        "Submission Date/ Eval Date",
-                        "Source",
-                        "Scholarship",
-                        "Score",
-                        "Reviewer",
-                        "Feedback",
+            evaluations = report_data.get("essay_evaluations", [])
+            if evaluations:
+                for ev in evaluations:
+                    yield [
+                        "Evaluation",
+                        report_data["personal_info"]["name"],
+                        report_data["personal_info"]["student_id"],
+                        report_data["personal_info"]["netid"],
+                        report_data["academic_info"]["major"],
+                        report_data["academic_info"]["minor"] or "N/A",
+                        f"{report_data['academic_info']['gpa']:.2f}",
+                        report_data["academic_info"]["academic_level"],
+                        ev.get("prompt"),
+                        ev["date_str"],
+                        ev.get("source"),
+                        ev.get("scholarship_name") or "-",
+                        ev.get("score"),
+                        ev.get("reviewer"),
+                        (ev.get("feedback") or "")[:120],
                     ]
-                )
-                # First add essay submissions
-                for es in report_data.get("essays") or []:
-                    if isinstance(es, dict):
-                        sub_date = es.get("submission_date")
-                        if hasattr(sub_date, "strftime"):
-                            sub_date_str = sub_date.strftime("%Y-%m-%d")
-                        else:
-                            sub_date_str = str(sub_date) if sub_date else "N/A"
-                        writer.writerow(
-                            [
-                                "Submission",
-                                report_data["personal_info"]["name"],
-                                report_data["personal_info"]["student_id"],
-                                report_data["personal_info"]["netid"],
-                                report_data["academic_info"]["major"],
-                                report_data["academic_info"]["minor"] or "N/A",
-                                f"{report_data['academic_info']['gpa']:.2f}",
-                                report_data["academic_info"]["academic_level"],
-                                es.get("prompt", ""),
-                                sub_date_str,
-                                "Essay Submission",
-                                "-",
-                                "-",
-                                "-",
-                                (es.get("content", "") or "")[:120],
-                            ]
-                        )
-                evaluations = report_data.get("essay_evaluations", [])
-                if evaluations:
-                    for ev in evaluations:
-                        date_obj = ev.get("date")
-                        date_str = (
-                            date_obj.strftime("%Y-%m-%d")
-                            if hasattr(date_obj, "strftime")
-                            else (str(date_obj) if date_obj else "")
-                        )
-                        writer.writerow(
-                            [
-                                "Evaluation",
-                                report_data["personal_info"]["name"],
-                                report_data["personal_info"]["student_id"],
-                                report_data["personal_info"]["netid"],
-                                report_data["academic_info"]["major"],
-                                report_data["academic_info"]["minor"] or "N/A",
-                                f"{report_data['academic_info']['gpa']:.2f}",
-                                report_data["academic_info"]["academic_level"],
-                                ev.get("prompt"),
-                                date_str,
-                                ev.get("source"),
-                                ev.get("scholarship_name") or "-",
-                                ev.get("score"),
-                                ev.get("reviewer"),
-                                (ev.get("feedback") or "")[:120],
-                            ]
-                        )
-                else:
-                    writer.writerow(
-                        [
-                            "Evaluation",
-                            report_data["personal_info"]["name"],
-                            report_data["personal_info"]["student_id"],
-                            report_data["personal_info"]["netid"],
-                            report_data["academic_info"]["major"],
-                            report_data["academic_info"]["minor"] or "N/A",
-                            f"{report_data['academic_info']['gpa']:.2f}",
-                            report_data["academic_info"]["academic_level"],
-                            "-",
-                            "N/A",
-                            "None",
-                            "-",
-                            "-",
-                            "-",
-                            "No evaluations",
-                        ]
-                    )
-        return output_path
+            else:
+                yield [
+                    "Evaluation",
+                    report_data["personal_info"]["name"],
+                    report_data["personal_info"]["student_id"],
+                    report_data["personal_info"]["netid"],
+                    report_data["academic_info"]["major"],
+                    report_data["academic_info"]["minor"] or "N/A",
+                    f"{report_data['academic_info']['gpa']:.2f}",
+                    report_data["academic_info"]["academic_level"],
+                    "-",
+                    "N/A",
+                    "None",
+                    "-",
+                    "-",
+                    "-",
+                    "No evaluations",
+                ]
 
     # Financial Aid System Integration Helper Methods
     # Implements requirement: The report engine shall support future integration with
@@ -4331,8 +4926,6 @@ END OF LOG
             # Parse disbursement dates
             disbursement_dates = award.disbursement_dates
             if isinstance(disbursement_dates, str):
-                import json
-
                 disbursement_dates = json.loads(disbursement_dates)
 
             # Create disbursement for each scheduled date
@@ -4519,7 +5112,6 @@ END OF LOG
         self, analytics_data: Dict[str, Any], output_path: str
     ) -> str:
         """Export analytics report to JSON format."""
-        import json
         from datetime import date
         from decimal import Decimal
 
@@ -4530,7 +5122,9 @@ END OF LOG
                 return float(obj)
             return str(obj)
 
-        with open(output_path, "w", encoding="utf-8") as f:
+        with open(
+            output_path, "w", encoding="utf-8", buffering=_EXPORT_BUFFER_SIZE
+        ) as f:
             json.dump(analytics_data, f, indent=2, default=_ser)
         return output_path
 
@@ -4540,167 +5134,167 @@ END OF LOG
         """Export analytics report to an Excel workbook with formatted, readable sheets."""
         from openpyxl import Workbook
         from openpyxl.styles import Font, PatternFill, Alignment
-        from openpyxl.utils import get_column_letter
 
         def _sheet(name: str) -> str:
             for c in ["\\", "/", "*", "?", ":", "[", "]"]:
                 name = name.replace(c, "-")
             return (name or "Sheet")[:31]
         
-        def _format_header(ws, row=1):
-            """Apply header formatting to the first row."""
-            for cell in ws[row]:
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-                cell.alignment = Alignment(horizontal="center", vertical="center")
+        header_font = Font(bold=True, color="FFFFFF")
+        header_fill = PatternFill(
+            start_color="4472C4", end_color="4472C4", fill_type="solid"
+        )
+        header_alignment = Alignment(horizontal="center", vertical="center")
+        title_font = _excel_styles()["title_font"]
         
-        def _auto_size_columns(ws):
-            """Auto-size columns based on content."""
-            for column in ws.columns:
-                max_length = 0
-                column_letter = get_column_letter(column[0].column)
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
-
-        wb = Workbook()
+        def _header(ws, values):
+            """Build a white-on-blue, centred header row."""
+            row = []
+            for value in values:
+                cell = _styled_cell(ws, value, header_font, header_fill)
+                cell.alignment = header_alignment
+                row.append(cell)
+            return row
+
+        def _section(ws, rows, title, headers, items):
+            """Append a bold section title, a header row and its item rows."""
+            if not items:
+                return
+            rows.append([])
+            rows.append([_styled_cell(ws, title)] + [""] * (len(headers) - 1))
+            rows.append(_header(ws, headers))
+            rows.extend(items)
+
+        def _titled_sheet(title, sheet_title):
+            """Create a sheet whose merged A1:B1 title heads the summary rows."""
+            ws = wb.create_sheet(title)
+            ws.merged_cells.add("A1:B1")
+            rows = [
+                [_styled_cell(ws, sheet_title, title_font)],
+                [],
+                _header(ws, ["Metric", "Value"]),
+            ]
+            return ws, rows
+
+        wb = Workbook(write_only=True)
         
         # Metadata sheet
-        meta_ws = wb.active
-        meta_ws.title = "Metadata"
+        meta_ws = wb.create_sheet("Metadata")
         meta = analytics_data.get("metadata", {})
-        meta_ws.append(["Field", "Value"])
-        _format_header(meta_ws)
-        for k, v in meta.items():
-            meta_ws.append([k.replace("_", " ").title(), str(v)])
-        _auto_size_columns(meta_ws)
+        rows = [_header(meta_ws, ["Field", "Value"])]
+        rows.extend([k.replace("_", " ").title(), str(v)] for k, v in meta.items())
+        _append_sized_rows(meta_ws, rows)
 
         # Application Trends sheet
         if "application_trends" in analytics_data:
             app_data = analytics_data["application_trends"]
-            ws = wb.create_sheet("Application Trends")
-            
-            # Summary section
-            ws.append(["Application Trends Summary"])
-            ws.merge_cells('A1:B1')
-            ws['A1'].font = Font(bold=True, size=14)
-            ws.append([])
-            
-            ws.append(["Metric", "Value"])
-            _format_header(ws, row=3)
-            ws.append(["Total Applications", app_data.get("total_applications", 0)])
+            ws, rows = _titled_sheet("Application Trends", "Application Trends Summary")
+            rows.append(["Total Applications", app_data.get("total_applications", 0)])
             
             # GPA Statistics
             gpa_stats = app_data.get("gpa_statistics", {})
             if gpa_stats:
-                ws.append([])
-                ws.append(["GPA Statistics", ""])
-                ws['A{}'.format(ws.max_row)].font = Font(bold=True)
-                ws.append(["Average GPA", f"{gpa_stats.get('avg_gpa', 0):.2f}" if gpa_stats.get('avg_gpa') else "N/A"])
-                ws.append(["Minimum GPA", f"{gpa_stats.get('min_gpa', 0):.2f}" if gpa_stats.get('min_gpa') else "N/A"])
-                ws.append(["Maximum GPA", f"{gpa_stats.get('max_gpa', 0):.2f}" if gpa_stats.get('max_gpa') else "N/A"])
+                rows.append([])
+                rows.append([_styled_cell(ws, "GPA Statistics"), ""])
+                rows.append(["Average GPA", f"{gpa_stats.get('avg_gpa', 0):.2f}" if gpa_stats.get('avg_gpa') else "N/A"])
+                rows.append(["Minimum GPA", f"{gpa_stats.get('min_gpa', 0):.2f}" if gpa_stats.get('min_gpa') else "N/A"])
+                rows.append(["Maximum GPA", f"{gpa_stats.get('max_gpa', 0):.2f}" if gpa_stats.get('max_gpa') else "N/A"])
             
             # Monthly Trends
-            monthly = app_data.get("monthly_trends", {})
-            if monthly:
-                ws.append([])
-                ws.append(["Monthly Trends", ""])
-                ws['A{}'.format(ws.max_row)].font = Font(bold=True)
-                ws.append(["Month", "Applications"])
-                _format_header(ws, row=ws.max_row)
-                for month, count in sorted(monthly.items()):
-                    ws.append([month, count])
+            _section(
+                ws,
+                rows,
+                "Monthly Trends",
+                ["Month", "Applications"],
+                [
+                    [month, count]
+                    for month, count in sorted(
+                        app_data.get("monthly_trends", {}).items()
+                    )
+                ],
+            )
             
             # Major Distribution
-            major_dist = app_data.get("major_distribution", [])
-            if major_dist:
-                ws.append([])
-                ws.append(["Major Distribution", ""])
-                ws['A{}'.format(ws.max_row)].font = Font(bold=True)
-                ws.append(["Major", "Count"])
-                _format_header(ws, row=ws.max_row)
-                for item in major_dist:
-                    ws.append([item.get("major", "Unknown"), item.get("count", 0)])
+            _section(
+                ws,
+                rows,
+                "Major Distribution",
+                ["Major", "Count"],
+                [
+                    [item.get("major", "Unknown"), item.get("count", 0)]
+                    for item in app_data.get("major_distribution", [])
+                ],
+            )
             
             # Academic Level Distribution
-            level_dist = app_data.get("academic_level_distribution", [])
-            if level_dist:
-                ws.append([])
-                ws.append(["Academic Level Distribution", ""])
-                ws['A{}'.format(ws.max_row)].font = Font(bold=True)
-                ws.append(["Level", "Count"])
-                _format_header(ws, row=ws.max_row)
-                for item in level_dist:
-                    ws.append([item.get("academic_level", "Unknown"), item.get("count", 0)])
+            _section(
+                ws,
+                rows,
+                "Academic Level Distribution",
+                ["Level", "Count"],
+                [
+                    [item.get("academic_level", "Unknown"), item.get("count", 0)]
+                    for item in app_data.get("academic_level_distribution", [])
+                ],
+            )
             
-            _auto_size_columns(ws)
+            _append_sized_rows(ws, rows)
 
         # Scholarship Impact sheet
         if "scholarship_impact" in analytics_data:
-            schol_data = analytics_data["scholarship_impact"]
-            ws = wb.create_sheet("Scholarship Impact")
-            
-            # Summary section
-            ws.append(["Scholarship Impact Summary"])
-            ws.merge_cells('A1:B1')
-            ws['A1'].font = Font(bold=True, size=14)
-            ws.append([])
-            
-            ws.append(["Metric", "Value"])
-            _format_header(ws, row=3)
-            ws.append(["Total Awards", schol_data.get("total_awards", 0)])
+            schol_data = analytics_data["scholarship_impact"]
+            ws, rows = _titled_sheet("Scholarship Impact", "Scholarship Impact Summary")
+            rows.append(["Total Awards", schol_data.get("total_awards", 0)])
             
             # Financial Impact
             financial = schol_data.get("financial_impact", {})
             if financial:
-                ws.append([])
-                ws.append(["Financial Impact", ""])
-                ws['A{}'.format(ws.max_row)].font = Font(bold=True)
-                ws.append(["Total Awarded", f"${financial.get('total_awarded', 0):,.2f}" if financial.get('total_awarded') else "$0.00"])
-                ws.append(["Average Award", f"${financial.get('avg_award', 0):,.2f}" if financial.get('avg_award') else "$0.00"])
-                ws.append(["Minimum Award", f"${financial.get('min_award', 0):,.2f}" if financial.get('min_award') else "$0.00"])
-                ws.append(["Maximum Award", f"${financial.get('max_award', 0):,.2f}" if financial.get('max_award') else "$0.00"])
+                rows.append([])
+                rows.append([_styled_cell(ws, "Financial Impact"), ""])
+                rows.append(["Total Awarded", f"${financial.get('total_awarded', 0):,.2f}" if financial.get('total_awarded') else "$0.00"])
+                rows.append(["Average Award", f"${financial.get('avg_award', 0):,.2f}" if financial.get('avg_award') else "$0.00"])
+                rows.append(["Minimum Award", f"${financial.get('min_award', 0):,.2f}" if financial.get('min_award') else "$0.00"])
+                rows.append(["Maximum Award", f"${financial.get('max_award', 0):,.2f}" if financial.get('max_award') else "$0.00"])
             
             # Scholarship Breakdown
-            schol_breakdown = schol_data.get("scholarship_breakdown", [])
-            if schol_breakdown:
-                ws.append([])
-                ws.append(["Scholarship Breakdown", "", ""])
-                ws['A{}'.format(ws.max_row)].font = Font(bold=True)
-                ws.append(["Scholarship Name", "Count", "Total Amount"])
-                _format_header(ws, row=ws.max_row)
-                for item in schol_breakdown:
-                    ws.append([
+            _section(
+                ws,
+                rows,
+                "Scholarship Breakdown",
+                ["Scholarship Name", "Count", "Total Amount"],
+                [
+                    [
                         item.get("scholarship_name", "Unknown"),
                         item.get("count", 0),
                         f"${item.get('total_amount', 0):,.2f}" if item.get('total_amount') else "$0.00"
-                    ])
+                    ]
+                    for item in schol_data.get("scholarship_breakdown", [])
+                ],
+            )
             
             # Status Distribution
-            status_dist = schol_data.get("status_distribution", [])
-            if status_dist:
-                ws.append([])
-                ws.append(["Status Distribution", ""])
-                ws['A{}'.format(ws.max_row)].font = Font(bold=True)
-                ws.append(["Status", "Count"])
-                _format_header(ws, row=ws.max_row)
-                for item in status_dist:
-                    ws.append([item.get("status", "Unknown"), item.get("count", 0)])
+            _section(
+                ws,
+                rows,
+                "Status Distribution",
+                ["Status", "Count"],
+                [
+                    [item.get("status", "Unknown"), item.get("count", 0)]
+                    for item in schol_data.get("status_distribution", [])
+                ],
+            )
             
-            _auto_size_columns(ws)
+            _append_sized_rows(ws, rows)
 
-        wb.save(output_path)
+        _save_workbook(wb, output_path)
         return output_path
 
     def export_analytics_report_to_pdf(
         self, analytics_data: Dict[str, Any], output_path: str
     ) -> str:
         """Export analytics to a formatted, readable PDF report."""
+        from reportlab.lib.pagesizes import letter
+
         from reportlab.platypus import (
             SimpleDocTemplate,
             Paragraph,
@@ -4913,23 +5507,79 @@ END OF LOG
         return output_path
 
 
-import logging
-
-logger = logging.getLogger("reports_app")
-
-
-# View to handle report generation and exporting
-def home(request):
-    """View to handle report generation and exporting.
-    Logs detailed debugging information about request processing and report generation.
+# (report type, export format) -> (ReportEngine exporter, response content type)
+EXPORTERS = {
+    ("general", "pdf"): (ReportEngine.export_to_pdf, _EXPORT_CONTENT_TYPES["pdf"]),
+    ("general", "xlsx"): (ReportEngine.export_to_excel, _EXPORT_CONTENT_TYPES["xlsx"]),
+    ("general", "csv"): (ReportEngine.export_to_csv, _EXPORT_CONTENT_TYPES["csv"]),
+    ("donor", "pdf"): (
+        ReportEngine.export_donor_report_to_pdf,
+        _EXPORT_CONTENT_TYPES["pdf"],
+    ),
+    ("donor", "xlsx"): (
+        ReportEngine.export_donor_report_to_excel,
+        _EXPORT_CONTENT_TYPES["xlsx"],
+    ),
+    ("donor", "csv"): (
+        ReportEngine.export_donor_report_to_csv,
+        _EXPORT_CONTENT_TYPES["csv"],
+    ),
+    ("applicant", "pdf"): (
+        ReportEngine.export_applicant_report_to_pdf,
+        _EXPORT_CONTENT_TYPES["pdf"],
+    ),
+    ("applicant", "xlsx"): (
+        ReportEngine.export_applicant_report_to_excel,
+        _EXPORT_CONTENT_TYPES["xlsx"],
+    ),
+    ("applicant", "csv"): (
+        ReportEngine.export_applicant_report_to_csv,
+        _EXPORT_CONTENT_TYPES["csv"],
+    ),
+    ("disbursement", "pdf"): (
+        ReportEngine.export_disbursement_report_to_pdf,
+        _EXPORT_CONTENT_TYPES["pdf"],
+    ),
+    ("disbursement", "xlsx"): (
+        ReportEngine.export_disbursement_report_to_excel,
+        _EXPORT_CONTENT_TYPES["xlsx"],
+    ),
+    ("disbursement", "csv"): (
+        ReportEngine.export_disbursement_report_to_csv,
+        _EXPORT_CONTENT_TYPES["csv"],
+    ),
+    ("prescreening", "pdf"): (
+        ReportEngine.export_prescreening_report_to_pdf,
+        _EXPORT_CONTENT_TYPES["pdf"],
+    ),
+    ("prescreening", "xlsx"): (
+        ReportEngine.export_prescreening_report_to_excel,
+        _EXPORT_CONTENT_TYPES["xlsx"],
+    ),
+    ("prescreening", "csv"): (
+        ReportEngine.export_prescreening_report_to_csv,
+        _EXPORT_CONTENT_TYPES["csv"],
+    ),
+}
+
+
+# Sample-data dates shared by the demo fixtures and pre-screening applicants
+_CLASS_OF_2026 = datetime(2026, 5, 15)
+_CLASS_OF_2027 = datetime(2027, 5, 15)
+_ESSAY_SUBMISSION_DATE = datetime(2025, 2, 1)
+_FALL_TERM_START = datetime(2025, 9, 1)
+
+
+@lru_cache(maxsize=1)
+def _sample_fixtures():
+    """Seed the demo applicants, scholarships and awards used by home().
+
+    The fixture graph is built and written on first use, then reused by later
+    requests instead of being rebuilt on every page load.
+
+    Returns:
+        dict: "applicants" and "scholarships" tuples of saved model instances
     """
-    logger.debug(
-        "Processing home request. Method: %s, POST data: %s",
-        request.method,
-        request.POST if request.method == "POST" else "N/A",
-    )
-
-    # Create sample scholarship data (inline)
     # Create sample applicant data with comprehensive review information
     john_doe = Applicant.from_dict(
         {
@@ -4964,7 +5614,7 @@ def home(request):
                 {
                     "prompt": "Describe your career goals in engineering.",
                     "content": "My passion for systems engineering stems from...",
-                    "submission_date": datetime(2025, 2, 1),
+                    "submission_date": _ESSAY_SUBMISSION_DATE,
                     "evaluation": {
                         "score": 9.2,
                         "feedback": "Excellent vision and clear career trajectory.",
@@ -4975,7 +5625,7 @@ def home(request):
                 {
                     "prompt": "How will this scholarship impact your education?",
                     "content": "This scholarship will enable me to...",
-                    "submission_date": datetime(2025, 2, 1),
+                    "submission_date": _ESSAY_SUBMISSION_DATE,
                     "evaluation": {
                         "score": 8.8,
                         "feedback": "Strong understanding of opportunity and impact.",
@@ -4986,7 +5636,7 @@ def home(request):
             ],
             "gpa": 3.8,
             "academic_level": "Junior",
-            "expected_graduation": datetime(2027, 5, 15),
+            "expected_graduation": _CLASS_OF_2027,
             "academic_history": [
                 {
                     "term": "Fall 2024",
@@ -5050,7 +5700,7 @@ def home(request):
             ],
             "gpa": 3.9,
             "academic_level": "Senior",
-            "expected_graduation": datetime(2026, 5, 15),
+            "expected_graduation": _CLASS_OF_2026,
         }
     )
 
@@ -5076,7 +5726,7 @@ def home(request):
             "essays": [],
             "gpa": 3.75,
             "academic_level": "Junior",
-            "expected_graduation": datetime(2027, 5, 15),
+            "expected_graduation": _CLASS_OF_2027,
         }
     )
 
@@ -5112,7 +5762,7 @@ def home(request):
         "award_date": timezone.make_aware(datetime(2025, 8, 15)),
         "award_amount": 5000.00,
         "disbursement_dates": [
-            timezone.make_aware(datetime(2025, 9, 1)).isoformat(),
+            timezone.make_aware(_FALL_TERM_START).isoformat(),
             timezone.make_aware(datetime(2026, 1, 1)).isoformat(),
         ],
         "requirements_met": [
@@ -5204,7 +5854,7 @@ def home(request):
 
     # Create award for Maria Garcia for CS Leadership Scholarship
     _cs_award_defaults = {
-        "award_date": timezone.make_aware(datetime(2025, 9, 1)),
+        "award_date": timezone.make_aware(_FALL_TERM_START),
         "award_amount": 3000.00,
         "disbursement_dates": [
             timezone.make_aware(datetime(2025, 10, 1)).isoformat(),
@@ -5249,13 +5899,200 @@ def home(request):
             **_cs_award_defaults,
         )
 
-    # Add scholarships to list for the engine
-    sample_scholarships = [engineering_scholarship, cs_scholarship]
+    return {
+        "applicants": (john_doe, maria_garcia, sarah_johnson),
+        "scholarships": (engineering_scholarship, cs_scholarship),
+    }
+
+
+@lru_cache(maxsize=1)
+def _build_sample_engine():
+    """Return a ReportEngine loaded with the sample scholarships.
 
-    # Initialize engine and add sample data
+    The engine is built once and shared by every home() request. Its report
+    methods only read engine state, so no per-request copy is needed.
+    """
     engine = ReportEngine()
-    for scholarship in sample_scholarships:
+    for scholarship in _sample_fixtures()["scholarships"]:
         engine.add_scholarship(scholarship)
+    return engine
+
+
+def _prescreening_applicant_data():
+    """Return the demo applicants pre-screened by home(), as from_dict input.
+
+    The applicants have varying application completion levels so the
+    pre-screening report shows every status.
+    """
+    return [
+        {
+            "name": "Alice Smith",
+            "student_id": "12346789",
+            "netid": "asmith",
+            "major": "Engineering",
+            "minor": "Mathematics",
+            "gpa": 3.8,
+            "academic_level": "Junior",
+            "expected_graduation": _CLASS_OF_2027,
+            "academic_history": [
+                {
+                    "term": "Fall 2024",
+                    "courses": [
+                        {
+                            "code": "ENG301",
+                            "name": "Advanced Engineering",
+                            "grade": "A",
+                        },
+                        {
+                            "code": "MATH400",
+                            "name": "Applied Mathematics",
+                            "grade": "A-",
+                        },
+                    ],
+                    "gpa": 3.8,
+                }
+            ],
+            "essays": [
+                {
+                    "prompt": "Describe your research interests.",
+                    "content": "My research focuses on sustainable engineering...",
+                    "submission_date": _ESSAY_SUBMISSION_DATE,
+                    "evaluation": {
+                        "score": 9.5,
+                        "feedback": "Exceptional research vision and clarity.",
+                        "reviewer": "Dr. Thompson",
+                        "date": datetime(2025, 2, 10),
+                    },
+                }
+            ],
+            "financial_info": {
+                "fafsa_submitted": True,
+                "efc": 4000,
+                "household_income": "40000-60000",
+            },
+            "interview_notes": "Outstanding interview performance. Shows great potential.",
+            "committee_feedback": [
+                {
+                    "member": "Dr. Rodriguez",
+                    "comments": "Top candidate with excellent credentials.",
+                    "recommendation": "Highly Recommend",
+                    "date": datetime(2025, 3, 1),
+                }
+            ],
+        },
+        {
+            "name": "Bob Johnson",
+            "student_id": "12347890",
+            "netid": "bjohnson",
+            "major": "Computer Science",
+            "gpa": 3.2,
+            "academic_level": "Sophomore",
+            "essays": [
+                {
+                    "prompt": "Describe your programming experience.",
+                    "content": "I have developed several applications...",
+                    "submission_date": datetime(2025, 2, 2),
+                    "evaluation": {
+                        "score": 7.8,
+                        "feedback": "Good technical background, needs more detail.",
+                        "reviewer": "Prof. Chen",
+                        "date": datetime(2025, 2, 12),
+                    },
+                }
+            ],
+            "financial_info": {
+                "fafsa_submitted": True,
+                "efc": 6000,
+                "household_income": "60000-80000",
+            },
+        },
+        {
+            "name": "Carol Williams",
+            "student_id": "12348901",
+            "netid": "cwilliams",
+            "major": "Engineering",
+            "gpa": 3.6,
+            "academic_level": "Senior",
+            "expected_graduation": _CLASS_OF_2026,
+            "academic_history": [
+                {
+                    "term": "Fall 2024",
+                    "courses": [
+                        {
+                            "code": "ENG401",
+                            "name": "Engineering Design",
+                            "grade": "A",
+                        },
+                        {
+                            "code": "ENG402",
+                            "name": "Project Management",
+                            "grade": "B+",
+                        },
+                    ],
+                    "gpa": 3.6,
+                }
+            ],
+            "essays": [
+                {
+                    "prompt": "Describe your leadership experience.",
+                    "content": "As president of the Engineering Club...",
+                    "submission_date": datetime(2025, 2, 3),
+                    "evaluation": {
+                        "score": 8.9,
+                        "feedback": "Strong leadership qualities demonstrated.",
+                        "reviewer": "Dr. Martinez",
+                        "date": datetime(2025, 2, 14),
+                    },
+                }
+            ],
+            "financial_info": {
+                "fafsa_submitted": True,
+                "efc": 3000,
+                "household_income": "30000-50000",
+            },
+            "interview_notes": "Great communication skills and project experience.",
+            "committee_feedback": [
+                {
+                    "member": "Prof. Anderson",
+                    "comments": "Strong candidate with practical experience.",
+                    "recommendation": "Recommend",
+                    "date": datetime(2025, 3, 2),
+                }
+            ],
+        },
+    ]
+
+
+@lru_cache(maxsize=1)
+def _build_prescreening_applicants():
+    """Return the demo applicants pre-screened by home(), saving them if needed.
+
+    They are only written when one is missing from the database, so exports
+    after the first do not change the Applicant table their cache keys read.
+    Built once per process, on the first pre-screening export, and shared
+    afterwards.
+    """
+    data = _prescreening_applicant_data()
+    stored = Applicant.objects.in_bulk(
+        [applicant["student_id"] for applicant in data], field_name="student_id"
+    )
+    if len(stored) == len(data):
+        return [stored[applicant["student_id"]] for applicant in data]
+    return [Applicant.from_dict(applicant) for applicant in data]
+
+
+# View to handle report generation and exporting
+def home(request):
+    """View to handle report generation and exporting.
+    Logs detailed debugging information about request processing and report generation.
+    """
+    logger.debug(
+        "Processing home request. Method: %s, POST data: %s",
+        request.method,
+        request.POST if request.method == "POST" else "N/A",
+    )
+
+    engine = _build_sample_engine()
 
     if request.method == "POST":
         export_format = request.POST.get("export_format")
@@ -5269,302 +6106,229 @@ def home(request):
             donor_name,
         )
 
-        if export_format:
-            temp_file = None
+        if export_format and (
+            export_format not in VALID_FORMATS or report_type not in VALID_TYPES
+        ):
+            return HttpResponseBadRequest(
+                f"Unsupported export: report_type={report_type} format={export_format}"
+            )
+
+        # Keyword arguments for each report's exporter
+        export_params = {
+            "general": {},
+            "donor": {"donor_name": donor_name},
+            "applicant": {"student_id": None},  # None = all applicants
+            "disbursement": {"scholarship_name": request.POST.get("scholarship_name")},
+        }
+        if (
+            export_format
+            and report_type in export_params
+            and request.POST.get("background")
+        ):
+            if report_type == "donor" and not donor_name:
+                return HttpResponse("donor_name is required", status=400)
+            # Render on the worker pool and let the client poll export_status
+            fd, output_path = tempfile.mkstemp(
+                suffix=f".{export_format}", dir=_SCRATCH_DIR
+            )
+            os.close(fd)
             try:
-                # Create temporary file with appropriate extension
-                temp_file = tempfile.NamedTemporaryFile(
-                    delete=False, suffix=f".{export_format}"
+                task_id = engine.submit_export(
+                    export_format,
+                    output_path,
+                    report_type=report_type,
+                    owner=_export_owner(request),
+                    **export_params[report_type],
                 )
-                temp_file.close()  # Close the file handle immediately
+            except ValueError as e:
+                os.unlink(output_path)
+                return HttpResponse(str(e), status=400)
+            except RuntimeError as e:
+                os.unlink(output_path)
+                return HttpResponse(str(e), status=503)
+            return JsonResponse(
+                {
+                    "task_id": task_id,
+                    "status_url": reverse("export_status", args=[task_id]),
+                },
+                status=202,
+            )
 
-                if report_type == "donor" and donor_name:
-                    # Generate donor-specific report
-                    if export_format == "pdf":
-                        output_path = engine.export_donor_report_to_pdf(
-                            donor_name=donor_name, output_path=temp_file.name
-                        )
-                        content_type = "application/pdf"
-                    elif export_format == "xlsx":
-                        output_path = engine.export_donor_report_to_excel(
-                            donor_name=donor_name, output_path=temp_file.name
-                        )
-                        content_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                    elif export_format == "csv":
-                        output_path = engine.export_donor_report_to_csv(
-                            donor_name=donor_name, output_path=temp_file.name
-                        )
-                        content_type = "text/csv"
-                    else:
-                        raise ValueError(
-                            f"Unsupported export format for donor report: {export_format}"
-                        )
-                    filename = f"donor_report.{export_format}"
-                elif report_type == "applicant":
-                    # Generate report for ALL applicants (not just one sample)
-                    if export_format == "pdf":
-                        output_path = engine.export_applicant_report_to_pdf(
-                            student_id=None,  # None = all applicants
-                            output_path=temp_file.name,
-                        )
-                        content_type = "application/pdf"
-                    elif export_format == "xlsx":
-                        output_path = engine.export_applicant_report_to_excel(
-                            student_id=None,  # None = all applicants
-                            output_path=temp_file.name,
-                        )
-                        content_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                    elif export_format == "csv":
-                        output_path = engine.export_applicant_report_to_csv(
-                            student_id=None,  # None = all applicants
-                            output_path=temp_file.name,
-                        )
-                        content_type = "text/csv"
-                    else:
-                        raise ValueError(
-                            f"Unsupported export format for applicant report: {export_format}"
-                        )
-                    filename = f"applicant_report.{export_format}"
-                elif report_type == "disbursement":
-                    # Get scholarship name from request
-                    scholarship_name = request.POST.get("scholarship_name")
-                    if export_format == "pdf":
-                        output_path = engine.export_disbursement_report_to_pdf(
-                            scholarship_name=scholarship_name,
-                            output_path=temp_file.name,
-                        )
-                        content_type = "application/pdf"
-                    elif export_format == "xlsx":
-                        output_path = engine.export_disbursement_report_to_excel(
-                            scholarship_name=scholarship_name,
-                            output_path=temp_file.name,
-                        )
-                        content_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                    elif export_format == "csv":
-                        output_path = engine.export_disbursement_report_to_csv(
-                            scholarship_name=scholarship_name,
-                            output_path=temp_file.name,
-                        )
-                        content_type = "text/csv"
-                    else:
-                        raise ValueError(
-                            f"Unsupported export format for disbursement report: {export_format}"
-                        )
-                    filename = f"disbursement_report.{export_format}"
-                elif report_type == "prescreening":
-                    # For demo purposes, we'll create a list of sample applicants with varying completion levels
-                    sample_applicants = [
-                        Applicant.from_dict(
-                            {
-                                "name": "Alice Smith",
-                                "student_id": "12346789",
-                                "netid": "asmith",
-                                "major": "Engineering",
-                                "minor": "Mathematics",
-                                "gpa": 3.8,
-                                "academic_level": "Junior",
-                                "expected_graduation": datetime(2027, 5, 15),
-                                "academic_history": [
-                                    {
-                                        "term": "Fall 2024",
-                                        "courses": [
-                                            {
-                                                "code": "ENG301",
-                                                "name": "Advanced Engineering",
-                                                "grade": "A",
-                                            },
-                                            {
-                                                "code": "MATH400",
-                                                "name": "Applied Mathematics",
-                                                "grade": "A-",
-                                            },
-                                        ],
-                                        "gpa": 3.8,
-                                    }
-                                ],
-                                "essays": [
-                                    {
-                                        "prompt": "Describe your research interests.",
-                                        "content": "My research focuses on sustainable engineering...",
-                                        "submission_date": datetime(2025, 2, 1),
-                                        "evaluation": {
-                                            "score": 9.5,
-                                            "feedback": "Exceptional research vision and clarity.",
-                                            "reviewer": "Dr. Thompson",
-                                            "date": datetime(2025, 2, 10),
-                                        },
-                                    }
-                                ],
-                                "financial_info": {
-                                    "fafsa_submitted": True,
-                                    "efc": 4000,
-                                    "household_income": "40000-60000",
-                                },
-                                "interview_notes": "Outstanding interview performance. Shows great potential.",
-                                "committee_feedback": [
-                                    {
-                                        "member": "Dr. Rodriguez",
-                                        "comments": "Top candidate with excellent credentials.",
-                                        "recommendation": "Highly Recommend",
-                                        "date": datetime(2025, 3, 1),
-                                    }
-                                ],
-                            }
-                        ),
-                        Applicant.from_dict(
-                            {
-                                "name": "Bob Johnson",
-                                "student_id": "12347890",
-                                "netid": "bjohnson",
-                                "major": "Computer Science",
-                                "gpa": 3.2,
-                                "academic_level": "Sophomore",
-                                "essays": [
-                                    {
-                                        "prompt": "Describe your programming experience.",
-                                        "content": "I have developed several applications...",
-                                        "submission_date": datetime(2025, 2, 2),
-                                        "evaluation": {
-                                            "score": 7.8,
-                                            "feedback": "Good technical background, needs more detail.",
-                                            "reviewer": "Prof. Chen",
-                                            "date": datetime(2025, 2, 12),
-                                        },
-                                    }
-                                ],
-                                "financial_info": {
-                                    "fafsa_submitted": True,
-                                    "efc": 6000,
-                                    "household_income": "60000-80000",
-                                },
-                            }
-                        ),
-                        Applicant.from_dict(
-                            {
-                                "name": "Carol Williams",
-                                "student_id": "12348901",
-                                "netid": "cwilliams",
-                                "major": "Engineering",
-                                "gpa": 3.6,
-                                "academic_level": "Senior",
-                                "expected_graduation": datetime(2026, 5, 15),
-                                "academic_history": [
-                                    {
-                                        "term": "Fall 2024",
-                                        "courses": [
-                                            {
-                                                "code": "ENG401",
-                                                "name": "Engineering Design",
-                                                "grade": "A",
-                                            },
-                                            {
-                                                "code": "ENG402",
-                                                "name": "Project Management",
-                                                "grade": "B+",
-                                            },
-                                        ],
-                                        "gpa": 3.6,
-                                    }
-                                ],
-                                "essays": [
-                                    {
-                                        "prompt": "Describe your leadership experience.",
-                                        "content": "As president of the Engineering Club...",
-                                        "submission_date": datetime(2025, 2, 3),
-                                        "evaluation": {
-                                            "score": 8.9,
-                                            "feedback": "Strong leadership qualities demonstrated.",
-                                            "reviewer": "Dr. Martinez",
-                                            "date": datetime(2025, 2, 14),
-                                        },
-                                    }
-                                ],
-                                "financial_info": {
-                                    "fafsa_submitted": True,
-                                    "efc": 3000,
-                                    "household_income": "30000-50000",
-                                },
-                                "interview_notes": "Great communication skills and project experience.",
-                                "committee_feedback": [
-                                    {
-                                        "member": "Prof. Anderson",
-                                        "comments": "Strong candidate with practical experience.",
-                                        "recommendation": "Recommend",
-                                        "date": datetime(2025, 3, 2),
-                                    }
-                                ],
-                            }
-                        ),
-                    ]
+        if export_format:
+            # Donor reports without a donor fall back to the general report
+            if report_type == "donor" and not donor_name:
+                report_type = "general"
+            exporter, content_type = EXPORTERS[(report_type, export_format)]
+            report_name = "scholarship" if report_type == "general" else report_type
+            filename = f"{report_name}_report.{export_format}"
+            params = export_params.get(report_type, {})
+            if report_type == "prescreening":
+                # Saved before the cache key reads the Applicant table, so the
+                # first export is cached under the key later requests use
+                params = {"applicants": _build_prescreening_applicants()}
+
+            # The sample data only changes with the database, so identical
+            # requests are answered from disk or with 304 Not Modified
+            cache_key = _export_cache_key(
+                engine,
+                report_name,
+                export_format,
+                donor_name,
+                request.POST.get("scholarship_name"),
+            )
+            etag = f'"{cache_key}"'
+            # Gzipping weakens the ETag of compressed CSV responses, so
+            # match If-None-Match weakly, as RFC 9110 specifies anyway
+            if etag in (
+                tag.removeprefix("W/")
+                for tag in parse_etags(request.META.get("HTTP_IF_NONE_MATCH", ""))
+            ):
+                response = HttpResponseNotModified()
+                response["ETag"] = etag
+                return response
 
-                    if export_format == "pdf":
-                        output_path = engine.export_prescreening_report_to_pdf(
-                            applicants=sample_applicants, output_path=temp_file.name
-                        )
-                        content_type = "application/pdf"
-                    elif export_format == "xlsx":
-                        output_path = engine.export_prescreening_report_to_excel(
-                            applicants=sample_applicants, output_path=temp_file.name
-                        )
-                        content_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                    elif export_format == "csv":
-                        output_path = engine.export_prescreening_report_to_csv(
-                            applicants=sample_applicants, output_path=temp_file.name
-                        )
-                        content_type = "text/csv"
-                    else:
-                        raise ValueError(
-                            f"Unsupported export format for pre-screening report: {export_format}"
-                        )
-                    filename = f"prescreening_report.{export_format}"
-                else:
-                    # Generate general scholarship report
-                    if export_format == "pdf":
-                        output_path = engine.export_to_pdf(temp_file.name)
-                        content_type = "application/pdf"
-                    elif export_format == "xlsx":
-                        output_path = engine.export_to_excel(temp_file.name)
-                        content_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                    elif export_format == "csv":
-                        output_path = engine.export_to_csv(temp_file.name)
-                        content_type = "text/csv"
-                    else:
-                        raise ValueError(f"Unsupported export format: {export_format}")
-                    filename = f"scholarship_report.{export_format}"
-
-                # Read the file and create the response
-                with open(output_path, "rb") as f:
-                    response = HttpResponse(f.read(), content_type=content_type)
-                    response["Content-Disposition"] = (
-                        f'attachment; filename="{filename}"'
+            if export_format == "csv":
+                # CSV is streamed row by row straight from the engine
+                try:
+                    lines = engine.iter_csv_rows(report_type, **params)
+                except Exception as e:
+                    logger.exception(
+                        "Export failed: report_type=%s format=%s",
+                        report_type,
+                        export_format,
                     )
-                return response
+                    return HttpResponse(
+                        f"Error generating report: {str(e)}", status=500
+                    )
+                response = StreamingHttpResponse(
+                    _csv_chunks(lines),
+                    content_type=content_type,
+                    headers={
+                        "Content-Disposition": f'attachment; filename="{filename}"'
+                    },
+                )
+                response["ETag"] = etag
+                patch_cache_control(response, private=True, no_cache=True)
+                return _gzip_response(request, response)
+
+            cache_dir = os.path.join(settings.MEDIA_ROOT, "report_cache")
+            cached_path = os.path.join(cache_dir, f"{cache_key}.{export_format}")
+            try:
+                cached = open(cached_path, "rb")
+            except FileNotFoundError:
+                pass
+            else:
+                return _cached_download_response(cached, content_type, filename, etag)
 
+            # Render next to the cache so the finished file can be renamed
+            # into place; fd stays open for streaming the response
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(suffix=f".{export_format}", dir=cache_dir)
+            try:
+                output_path = exporter(engine, output_path=temp_path, **params)
+                os.replace(output_path, cached_path)
             except Exception as e:
-                # Log the error (you might want to use proper logging here)
-                print(f"Error during export: {str(e)}")
+                os.close(fd)
+                try:
+                    os.unlink(temp_path)
+                except FileNotFoundError:
+                    pass
+                logger.exception(
+                    "Export failed: report_type=%s format=%s",
+                    report_type,
+                    export_format,
+                )
                 return HttpResponse(f"Error generating report: {str(e)}", status=500)
 
-            finally:
-                # Clean up temporary file in finally block to ensure it happens
-                try:
-                    if temp_file:
-                        os.unlink(temp_file.name)
-                except Exception as e:
-                    print(f"Error cleaning up temporary file: {str(e)}")
+            _prune_report_cache(cache_dir)
+            return _cached_download_response(
+                os.fdopen(fd, "rb"), content_type, filename, etag
+            )
 
     # Generate report for web display
     report_data = engine.generate_scholarship_report()
 
-    # Convert scholarships data for template display
-    for scholarship in report_data["scholarships"]:
-        # Ensure donor info is in the expected format
-        if isinstance(scholarship.get("donor"), dict):
-            scholarship["donor"] = scholarship["donor"]
-        else:
-            scholarship["donor"] = {"name": "Unknown", "contact": "Not provided"}
+    # The template expects donor info as a dict; only malformed rows need
+    # fixing. The report is memoized and shared with the exporters, so the
+    # fixed rows are copies rather than edits of the cached entries.
+    unknown_donor = {"name": "Unknown", "contact": "Not provided"}
+    report_data = {
+        **report_data,
+        "scholarships": [
+            scholarship
+            if isinstance(scholarship.get("donor"), dict)
+            else {**scholarship, "donor": unknown_donor}
+            for scholarship in report_data["scholarships"]
+        ],
+    }
+
+    return _gzip_response(
+        request, render(request, "reports_app/index.html", {"report": report_data})
+    )
+
+
+def _export_owner(request):
+    """Identify who queued a background export: the user, else the session."""
+    if request.user.is_authenticated:
+        return f"user:{request.user.pk}"
+    if request.session.session_key is None:
+        request.session.create()
+    return f"session:{request.session.session_key}"
 
-    return render(request, "reports_app/index.html", {"report": report_data})
+
+def export_status(request, task_id):
+    """Report progress of a background export and serve it once finished.
+
+    Returns JSON with the task status. When the export is done, requesting
+    the same URL with ``?download=1`` returns the file and forgets the task.
+    Only the user or session that queued the export can see it.
+    """
+    task = ReportEngine.get_export_task(task_id)
+    if task is None or task["owner"] != _export_owner(request):
+        return JsonResponse({"task_id": task_id, "status": "unknown"}, status=404)
+
+    future = task["future"]
+    if not future.done():
+        status = "running" if future.running() else "pending"
+        return JsonResponse({"task_id": task_id, "status": status})
+
+    error = future.exception()
+    if error is not None:
+        if ReportEngine.get_export_task(task_id, remove=True) is not None:
+            logger.error(
+                "Background export %s failed: report_type=%s format=%s",
+                task_id,
+                task["report_type"],
+                task["export_format"],
+                exc_info=error,
+            )
+            if os.path.exists(task["output_path"]):
+                os.unlink(task["output_path"])
+        return JsonResponse(
+            {"task_id": task_id, "status": "failed", "error": "Export failed"},
+            status=500,
+        )
+
+    if not request.GET.get("download"):
+        return JsonResponse(
+            {
+                "task_id": task_id,
+                "status": "done",
+                "download_url": f"{request.path}?download=1",
+            }
+        )
+
+    # Only the first of concurrent download requests gets the file
+    if ReportEngine.get_export_task(task_id, remove=True) is None:
+        return JsonResponse({"task_id": task_id, "status": "unknown"}, status=404)
+    report_name = (
+        "scholarship" if task["report_type"] == "general" else task["report_type"]
+    )
+    return _download_response(
+        task["output_path"],
+        _EXPORT_CONTENT_TYPES[task["export_format"]],
+        f"{report_name}_report.{task['export_format']}",
+    )
 
 
 def combined_analytics(request):
@@ -5605,7 +6369,7 @@ def combined_analytics(request):
         import tempfile, os
 
         try:
-            tmp_dir = tempfile.gettempdir()
+            tmp_dir = _SCRATCH_DIR or tempfile.gettempdir()
             filename_base = (
                 f"combined_analytics_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             )
@@ -5629,15 +6393,8 @@ def combined_analytics(request):
                 errors.append("Unsupported export format.")
 
             if path and os.path.exists(path):
-                with open(path, "rb") as f:
-                    data = f.read()
-                from django.http import HttpResponse
-
-                response = HttpResponse(data, content_type=mime)
-                response["Content-Disposition"] = (
-                    f'attachment; filename="{os.path.basename(path)}"'
-                )
-                return response
+                # Stream from disk; the temp file is removed once sent
+                return _download_response(path, mime, os.path.basename(path))
         except Exception as e:
             logger.error(f"Combined analytics export failed: {e}")
             errors.append(f"Export failed: {e}")
@@ -5645,7 +6402,6 @@ def combined_analytics(request):
     # Format analytics data for template display (create a copy to avoid modifying original)
     analytics_display = None
     if analytics:
-        import json
         from datetime import date
         from decimal import Decimal
         
@@ -5687,7 +6443,9 @@ def combined_analytics(request):
         },
     }
     
-    return render(request, "reports_app/combined_analytics.html", context)
+    return _gzip_response(
+        request, render(request, "reports_app/combined_analytics.html", context)
+    )
 
 
 def request_information(request):
@@ -5924,6 +6682,7 @@ def award_scholarship(request):
         return HttpResponse(f"Error: {str(e)}", status=500)
 
 
+@gzip_page
 def view_request_logs(request):
     """View to display all information requests in a table format.
 
@@ -5966,6 +6725,32 @@ def view_request_logs(request):
     return render(request, "reports_app/request_logs.html", context)
 
 
+def _clear_log_file(handler):
+    """Empty a FileHandler's log file and delete its rotated backups.
+
+    The live file is truncated in place rather than deleted, so the handlers
+    of every worker process keep appending to the same file.
+    """
+    handler.acquire()
+    try:
+        handler.flush()
+        paths = [
+            f"{handler.baseFilename}.{index}"
+            for index in range(1, getattr(handler, "backupCount", 0) + 1)
+        ]
+        try:
+            os.truncate(handler.baseFilename, 0)
+        except FileNotFoundError:
+            pass
+        for path in paths:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+    finally:
+        handler.release()
+
+
 def clear_request_logs(request):
     """View to clear all information request logs.
 
@@ -5976,25 +6761,23 @@ def clear_request_logs(request):
         # Delete all information requests
         ReviewerInformationRequest.objects.all().delete()
 
-        # Optionally delete log files if they exist
-        import os
-
-        logs_dir = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), "information_request_logs"
-        )
-        if os.path.exists(logs_dir):
-            import shutil
-
+        # Empty the log files too
+        for handler in info_request_logger.handlers:
+            if not isinstance(handler, logging.FileHandler):
+                continue
             try:
-                shutil.rmtree(logs_dir)
-                os.makedirs(logs_dir, exist_ok=True)
-            except Exception as e:
-                pass  # If log files can't be deleted, continue anyway
+                _clear_log_file(handler)
+            except OSError:
+                # If log files can't be cleared, continue anyway
+                logger.warning(
+                    "Could not clear %s", handler.baseFilename, exc_info=True
+                )
 
     return redirect("view_request_logs")
 
 
 # Implementation of the prescreening report view with award decision functionality SFWE-504_3-LLR-28.
+@gzip_page
 def view_prescreening_report(request):
     """View to display prescreening report with award decision functionality.
 